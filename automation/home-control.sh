@@ -8,6 +8,15 @@ source "${SCRIPT_DIR}/../config/load-config.sh"
 
 ACTION="$1"
 
+# Task supervisor shared with the Control Center GUI and the dashboard
+SUPERVISOR="${SCRIPT_DIR}/../philaunch_gui/philaunch_supervisor.py"
+supervisor() {
+    python3 "$SUPERVISOR" "$@"
+}
+
+# Pooled SSH (one multiplexed connection per configured host)
+REMOTE="${SCRIPT_DIR}/../philaunch_gui/philaunch_remote.py"
+
 case "$ACTION" in
     status)
         bash "${PHILAUNCH_REMOTE_SCRIPTS_DIR}/quick-status.sh"
@@ -19,8 +28,39 @@ case "$ACTION" in
         ;;
 
     list-tasks)
+        echo "=== Supervised tasks ==="
+        OUT=$(supervisor list --all 2>/dev/null) || OUT="Supervisor unavailable"
+        echo "$OUT" | head -20
+        echo ""
         echo "=== Running tmux sessions ==="
-        tmux list-sessions 2>/dev/null || echo "No active sessions"
+        # The GUI's hidden control-mode watcher is not a task
+        SESSIONS=$(tmux list-sessions 2>/dev/null | grep -v '^_philaunch_watch:')
+        if [ -n "$SESSIONS" ]; then
+            echo "$SESSIONS"
+        else
+            echo "No active sessions"
+        fi
+        ;;
+
+    run-task)
+        SCRIPT="$2"
+        if [ -z "$SCRIPT" ]; then
+            echo "Usage: $0 run-task <script> [session-name]"
+            exit 1
+        fi
+        NAME="${3:-$(basename "$SCRIPT" .sh)}"
+        supervisor start --name "$NAME" --tmux -- bash "$SCRIPT"
+        ;;
+
+    task-status)
+        SESSION="$2"
+        if [ -z "$SESSION" ]; then
+            echo "Usage: $0 task-status <session-name>"
+            exit 1
+        fi
+        supervisor status "$SESSION" --json
+        echo ""
+        supervisor logs "$SESSION" -n 20
         ;;
 
     kill-task)
@@ -29,7 +69,14 @@ case "$ACTION" in
             echo "Usage: $0 kill-task <session-name>"
             exit 1
         fi
-        tmux kill-session -t "$SESSION"
+        # Supervised tasks are terminated by the supervisor (keeps exit status)
+        KILLED=false
+        supervisor stop "$SESSION" 2>/dev/null && KILLED=true
+        tmux kill-session -t "$SESSION" 2>/dev/null && KILLED=true
+        if [ "$KILLED" != true ]; then
+            echo "✗ No task or session named: $SESSION" >&2
+            exit 1
+        fi
         echo "✓ Killed session: $SESSION"
         ;;
 
@@ -38,6 +85,32 @@ case "$ACTION" in
         journalctl -n 20 --no-pager
         ;;
 
+    remote)
+        # remote [--host NAME] <command> [args]: run home-control.sh over the pooled connection
+        shift
+        HOST_ARGS=()
+        if [ "$1" = "--host" ]; then
+            HOST_ARGS=(--host "$2")
+            shift 2
+        fi
+        if [ -z "$1" ]; then
+            echo "Usage: $0 remote [--host NAME] <command> [args]"
+            exit 1
+        fi
+        python3 "$REMOTE" run "${HOST_ARGS[@]}" -- bash automation/home-control.sh "$@"  # Remote sessions start in ~
+        ;;
+
+    fanout)
+        # fanout <script> [args]: run a local script on every configured host
+        SCRIPT="$2"
+        if [ -z "$SCRIPT" ]; then
+            echo "Usage: $0 fanout <script> [args]"
+            exit 1
+        fi
+        shift 2
+        python3 "$REMOTE" fanout --script "$SCRIPT" -- "$@"
+        ;;
+
     restart-ssh)
         echo "Restarting SSH server..."
         sudo systemctl restart ssh
@@ -53,11 +126,18 @@ case "$ACTION" in
         echo "  status        - System status overview"
         echo "  list-scripts  - Show all available scripts"
         echo "  list-tasks    - Show running background tasks"
+        echo "  run-task      - Run a script under the task supervisor"
+        echo "  task-status   - Exit status, timing and log tail of a task"
         echo "  kill-task     - Kill a background task"
         echo "  logs          - View recent system logs"
         echo "  restart-ssh   - Restart SSH server"
+        echo "  remote        - Run one of these on a remote host (pooled SSH)"
+        echo "  fanout        - Run a local script on every configured host"
         echo ""
         echo "Examples:"
+        echo "  $0 remote status"
+        echo "  $0 remote --host pi list-tasks"
+        echo "  $0 fanout remote-scripts/quick-status.sh"
         echo "  ssh ${PHILAUNCH_SSH_CONN} -p ${PHILAUNCH_SSH_PORT} 'bash ~/automation/home-control.sh status'"
         echo "  ssh ${PHILAUNCH_SSH_CONN} -p ${PHILAUNCH_SSH_PORT} 'bash ~/automation/home-control.sh list-tasks'"
         ;;
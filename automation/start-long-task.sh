@@ -13,13 +13,22 @@ if [ -z "$SESSION_NAME" ] || [ $# -eq 0 ]; then
     exit 1
 fi
 
-# Create detached tmux session and run command
-tmux new-session -d -s "$SESSION_NAME" "$@"
+# Prefer the PhiLaunch task supervisor: it records exit status, timing and
+# resource usage, and opens a tmux session that follows the task's log
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+SUPERVISOR="${SCRIPT_DIR}/../philaunch_gui/philaunch_supervisor.py"
 
-echo "✓ Task started in tmux session: $SESSION_NAME"
+if command -v python3 &> /dev/null && [ -f "$SUPERVISOR" ]; then
+    python3 "$SUPERVISOR" start --name "$SESSION_NAME" --tmux -- "$@" || exit 1
+else
+    # Create detached tmux session and run command
+    tmux new-session -d -s "$SESSION_NAME" "$@"
+    echo "✓ Task started in tmux session: $SESSION_NAME"
+fi
 echo ""
 echo "To check progress:"
 echo "  tmux attach -t $SESSION_NAME"
 echo ""
 echo "To list all sessions:"
 echo "  tmux list-sessions"
+echo "  bash ~/automation/home-control.sh list-tasks"
@@ -64,15 +64,23 @@ export PHILAUNCH_USER
 export PHILAUNCH_HOST
 export PHILAUNCH_SSH_PORT
 export PHILAUNCH_SSH_CONN
+export PHILAUNCH_REMOTE_HOSTS
+export PHILAUNCH_REMOTE_PARALLEL
 export PHILAUNCH_HOME
 export PHILAUNCH_USER_HOME
 export PHILAUNCH_AUTOMATION_DIR
 export PHILAUNCH_REMOTE_SCRIPTS_DIR
 export PHILAUNCH_LOG_DIR
+export PHILAUNCH_STATE_DIR
 export WOW_SERVER_IP
 export MONITOR_INTERVAL
 export WIREGUARD_INTERFACE
 export ENABLE_WAN_WARNINGS
+export PHILAUNCH_PROBE_TARGETS
+export PHILAUNCH_GUI_OUTPUT_LINES
+export PHILAUNCH_MAX_TASKS
+export PHILAUNCH_JOURNAL_FILE
+export PHILAUNCH_SLOW_OP_MS
 export TMUX_SESSION_PREFIX
 export ENABLE_COLOR_OUTPUT
 export DEBUG_MODE
@@ -8,9 +8,18 @@ if [ -f "$SCRIPT_DIR/../../config/load-config.sh" ]; then
 fi
 
 LOG_DIR="${PHILAUNCH_LOG_DIR:-$HOME/PhiLaunch/logs}"
+LOGPACK="$SCRIPT_DIR/../../philaunch_gui/philaunch_logpack.py"
 
-# Find recent log files
-LOG_FILES=$(find "$LOG_DIR" -type f -name "*.log" 2>/dev/null | head -5)
+# Most recently written logs, plain or packed (.logz)
+LOG_FILES=$(find "$LOG_DIR" -type f \( -name "*.log" -o -name "*.logz" \) -printf '%T@ %p\n' 2>/dev/null \
+    | sort -rn | head -5 | cut -d' ' -f2-)
+
+# The reader seeks to the last lines (and decodes packs) in one process
+if [ -n "$LOG_FILES" ] && command -v python3 &> /dev/null && [ -f "$LOGPACK" ]; then
+    mapfile -t FILES <<< "$LOG_FILES"
+    python3 "$LOGPACK" tail --dashboard -n 5 "${FILES[@]}" 2>/dev/null && exit 0
+fi
+LOG_FILES=$(echo "$LOG_FILES" | grep '\.log$')
 
 echo '{"logs": ['
 
@@ -30,8 +30,19 @@ get_disk_usage() {
     fi
 }
 
-# Get network status
+# Get network status: the dashboard server hands over its prober's latest
+# result, otherwise philaunch_netprobe.py's cache file if it is fresh; a
+# blocking ping only when run on its own with no prober around
 get_network_status() {
+    if [ -n "$PHILAUNCH_NETWORK_JSON" ]; then
+        echo "$PHILAUNCH_NETWORK_JSON"
+        return
+    fi
+    local cache="${PHILAUNCH_STATE_DIR:-${XDG_STATE_HOME:-$HOME/.local/state}/philaunch}/connectivity.json"
+    if [ -f "$cache" ] && [ $(( $(date +%s) - $(stat -c %Y "$cache" 2>/dev/null || echo 0) )) -lt 60 ]; then
+        cat "$cache"
+        return
+    fi
     if ping -c 1 -W 1 8.8.8.8 &>/dev/null; then
         echo '{"status": "Connected", "connected": true}'
     else
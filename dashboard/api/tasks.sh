@@ -1,16 +1,34 @@
 #!/bin/bash
 # Generate background tasks JSON
 
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+SUPERVISOR="$SCRIPT_DIR/../../philaunch_gui/philaunch_supervisor.py"
+CLI="$SCRIPT_DIR/../../philaunch_gui/philaunch_cli.py"
+
+# One python3 process builds the whole document (no per-session tmux calls)
+if command -v python3 &> /dev/null && [ -f "$CLI" ]; then
+    python3 "$CLI" tasks --dashboard 2>/dev/null && exit 0
+fi
+
+# Supervised tasks (exit status, timing, rusage) from the shared supervisor state
+supervised_json() {
+    if command -v python3 &> /dev/null && [ -f "$SUPERVISOR" ]; then
+        python3 "$SUPERVISOR" list --all --json 2>/dev/null || echo '{"tasks": [], "count": 0}'
+    else
+        echo '{"tasks": [], "count": 0}'
+    fi
+}
+
 if ! command -v tmux &> /dev/null; then
-    echo '{"tasks": [], "count": 0}'
+    echo '{"tasks": [], "count": 0, "supervised": '"$(supervised_json)"'}'
     exit 0
 fi
 
-# Get tmux sessions
-SESSIONS=$(tmux list-sessions 2>/dev/null | awk -F: '{print $1}' || echo "")
+# Get tmux sessions (not the GUI's hidden control-mode watcher)
+SESSIONS=$(tmux list-sessions 2>/dev/null | awk -F: '$1 != "_philaunch_watch" {print $1}' || echo "")
 
 if [ -z "$SESSIONS" ]; then
-    echo '{"tasks": [], "count": 0}'
+    echo '{"tasks": [], "count": 0, "supervised": '"$(supervised_json)"'}'
     exit 0
 fi
 
@@ -41,5 +59,6 @@ done <<< "$SESSIONS"
 
 echo '],'
 echo '"count": '"$(echo "$SESSIONS" | grep -c '^')"','
+echo '"supervised": '"$(supervised_json)"','
 echo '"timestamp": "'"$(date -u +%Y-%m-%dT%H:%M:%SZ)"'"'
 echo '}'
@@ -12,7 +12,8 @@ fi
 
 # Check if log file exists
 LOG_DIR="${PHILAUNCH_LOG_DIR:-$HOME/PhiLaunch/logs}"
-LOG_FILE=$(find "$LOG_DIR" -name "wow_connection_*.log" -type f 2>/dev/null | sort | tail -1)
+LOGPACK="$SCRIPT_DIR/../../philaunch_gui/philaunch_logpack.py"
+LOG_FILE=$(find "$LOG_DIR" -name "wow_connection_*.log*" -type f 2>/dev/null | sort | tail -1)
 
 if [ -z "$LOG_FILE" ] || [ ! -f "$LOG_FILE" ]; then
     echo '{"enabled": false, "message": "No log file found"}'
@@ -20,7 +21,12 @@ if [ -z "$LOG_FILE" ] || [ ! -f "$LOG_FILE" ]; then
 fi
 
 # Get latest stats from log
-LATEST=$(tail -1 "$LOG_FILE" 2>/dev/null)
+if [ "${LOG_FILE##*.}" = "logz" ]; then
+    # Packed by philaunch_logpack.py: only its last block is decompressed
+    LATEST=$(python3 "$LOGPACK" tail -n 1 "$LOG_FILE" 2>/dev/null)
+else
+    LATEST=$(tail -1 "$LOG_FILE" 2>/dev/null)
+fi
 
 if [ -z "$LATEST" ]; then
     echo '{"enabled": false, "message": "No data in log"}'
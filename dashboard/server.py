@@ -0,0 +1,545 @@
+#!/usr/bin/env python3
+"""
+PhiLaunch Dashboard Server
+One asyncio process serving index.html, static/ and on-demand api/*.json documents
+
+Each API document is built only when a request asks for it, and is then
+cached for its own TTL; concurrent requests for an expired document share
+one computation. With no browser open the server does no work at all.
+status, metrics, wow and info run their api/*.sh script; tasks and logs are
+built in-process by the philaunch_gui modules the scripts would start
+python3 for anyway. metrics.sh gets its network section from a background
+connectivity prober (philaunch_netprobe.py) through PHILAUNCH_NETWORK_JSON,
+so it never waits on the network; the prober runs only while metrics are
+being asked for.
+
+/api/events is a Server-Sent Events stream: one loop, running only while
+someone is subscribed, re-reads the pushed sections through the same
+caches and sends each changed section once, encoded once, to every client.
+/api/snapshot is every section in one document with per-section versions
+and a strong ETag, so a polling client revalidates in one round trip and
+gets 304 Not Modified when nothing changed.
+Every metrics and wow build is also added to the time-series store
+(philaunch_timeseries.py), except the metrics a running `record` process
+owns; /api/metrics/history?range=1h|24h|7d|30d reads its 1 s / 1 min / 1 h
+rollups.
+
+Usage:
+    server.py [--port PORT] [--bind ADDRESS]     (default: $DASHBOARD_PORT or 8080, 0.0.0.0)
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from email.utils import formatdate
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Optional, Set, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(ROOT.parent / 'philaunch_gui'))
+
+SCRIPT_TIMEOUT = 15.0  # Seconds before a hung api/*.sh is killed
+KEEPALIVE_TIMEOUT = 30.0
+MAX_HEADER_LINES = 100
+PUSH_INTERVAL = 2.0  # Seconds between change checks while clients are subscribed
+HEARTBEAT = 15.0  # Comment line sent on an otherwise idle stream (keeps NAT/proxies open)
+MAX_BUFFERED = 512 * 1024  # A subscriber this far behind is disconnected
+
+# Seconds each document is reused for; info only changes with the host
+TTLS = {'status': 5.0, 'metrics': 2.0, 'tasks': 2.0, 'wow': 5.0, 'logs': 5.0, 'info': 300.0}
+
+# Sections the event stream re-checks; info is only sent when a client connects
+PUSHED = ('status', 'metrics', 'tasks', 'wow', 'logs')
+
+CONTENT_TYPES = {
+    '.html': 'text/html; charset=utf-8',
+    '.css': 'text/css; charset=utf-8',
+    '.js': 'application/javascript; charset=utf-8',
+    '.json': 'application/json',
+    '.svg': 'image/svg+xml',
+    '.png': 'image/png',
+    '.ico': 'image/x-icon',
+}
+
+REASONS = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found',
+           405: 'Method Not Allowed'}
+
+
+def _fingerprint(data: Dict) -> str:
+    """Document content without its generation timestamp"""
+    return json.dumps({k: v for k, v in data.items() if k != 'timestamp'},
+                      sort_keys=True, default=str)
+
+
+class Document:
+    """
+    One /api/<name>.json document: a producer plus a TTL cache around it.
+
+    `produce` is a coroutine function returning the document as a dict.
+    Failures are served (and cached) as {"error": ...}, the same document
+    serve.sh used to write when a script failed. `version` goes up only
+    when a build differs from the previous one in more than its timestamp.
+    `on_build` is called with every successful build (history recording).
+    """
+
+    def __init__(self, name: str, produce: Callable[[], Awaitable[Dict]], ttl: float,
+                 on_build: Optional[Callable[[Dict], None]] = None):
+        self.name = name
+        self.produce = produce
+        self.ttl = ttl
+        self.on_build = on_build
+        self.data: Optional[Dict] = None
+        self.body = b''
+        self.expires = 0.0
+        self.builds = 0
+        self.version = 0
+        self._fingerprint = ''
+        self._event = b''
+        self._pending: Optional[asyncio.Future] = None
+
+    async def get(self) -> bytes:
+        if self.data is not None and time.monotonic() < self.expires:
+            return self.body
+        if self._pending is None:
+            self._pending = asyncio.ensure_future(self._build())
+        # Shielded: a client hanging up must not cancel the build others wait for
+        return await asyncio.shield(self._pending)
+
+    def event(self) -> bytes:
+        """The current build as one SSE message (encoded once per build)"""
+        if not self._event:
+            data = json.dumps(self.data, separators=(',', ':'), default=str)
+            self._event = f"event: {self.name}\ndata: {data}\n\n".encode()
+        return self._event
+
+    async def _build(self) -> bytes:
+        try:
+            try:
+                data = await self.produce()
+                if self.on_build is not None:
+                    self.on_build(data)
+            except Exception as e:
+                data = {'error': f"Failed to generate {self.name}: {e}"}
+            self.data = data
+            self.body = json.dumps(data, indent=2, default=str).encode()
+            self._event = b''
+            self.expires = time.monotonic() + self.ttl
+            self.builds += 1
+            fingerprint = _fingerprint(data)
+            if fingerprint != self._fingerprint:
+                self._fingerprint = fingerprint
+                self.version += 1
+            return self.body
+        finally:
+            self._pending = None
+
+
+# === Producers ===
+
+def script_producer(script: Path, env: Optional[Callable[[], Dict[str, str]]] = None
+                    ) -> Callable[[], Awaitable[Dict]]:
+    """Run an api/*.sh script and parse the JSON it prints (`env()` adds variables)"""
+    async def produce() -> Dict:
+        process = await asyncio.create_subprocess_exec(
+            'bash', str(script), stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL, stdin=asyncio.subprocess.DEVNULL,
+            env={**os.environ, **env()} if env else None)
+        try:
+            stdout, _ = await asyncio.wait_for(process.communicate(), SCRIPT_TIMEOUT)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise RuntimeError(f"{script.name} timed out")
+        if process.returncode != 0:
+            raise RuntimeError(f"{script.name} exited with {process.returncode}")
+        return json.loads(stdout)
+    return produce
+
+
+def thread_producer(fn: Callable[[], Dict]) -> Callable[[], Awaitable[Dict]]:
+    """Run a blocking function on the default thread pool"""
+    async def produce() -> Dict:
+        return await asyncio.get_running_loop().run_in_executor(None, fn)
+    return produce
+
+
+_engine = None
+_prober = None
+_history = None
+
+
+def build_tasks() -> Dict:
+    """api/tasks.json from the shared engine (tmux sessions + supervisor state)"""
+    global _engine
+    from philaunch_engine import PhiLaunchEngine, dashboard_tasks
+    if _engine is None:
+        _engine = PhiLaunchEngine()
+    return dashboard_tasks(_engine)
+
+
+def network_env() -> Dict[str, str]:
+    """PHILAUNCH_NETWORK_JSON for metrics.sh: the prober's latest result, never a fresh probe"""
+    global _prober
+    from philaunch_netprobe import CACHE_FILE, ConnectivityProber
+    from philaunch_paths import state_dir
+    if _prober is None:
+        try:
+            _prober = ConnectivityProber(cache_path=state_dir() / CACHE_FILE)
+        except ValueError as e:
+            return {'PHILAUNCH_NETWORK_JSON': json.dumps(
+                {'status': 'Bad probe targets', 'connected': None, 'error': str(e)})}
+    _prober.ensure_running(idle_after=60.0)
+    return {'PHILAUNCH_NETWORK_JSON': json.dumps(_prober.result())}
+
+
+def build_logs() -> Dict:
+    """api/logs.json: last 5 lines of the 5 most recently written logs, plain or packed"""
+    from philaunch_logpack import dashboard_logs
+    from philaunch_paths import log_dir
+    paths = []
+    try:
+        for entry in os.scandir(log_dir()):
+            if entry.is_file() and entry.name.endswith(('.log', '.logz')):
+                paths.append((entry.stat().st_mtime, entry.path))
+    except OSError:
+        pass
+    return dashboard_logs([path for _, path in sorted(paths, reverse=True)[:5]], count=5)
+
+
+def history():
+    """The shared time-series store (philaunch_timeseries.py)"""
+    global _history
+    from philaunch_timeseries import TimeSeriesStore
+    if _history is None:
+        _history = TimeSeriesStore()
+    return _history
+
+
+def history_recorder(extract: Callable[[Dict], Dict]) -> Callable[[Dict], None]:
+    """
+    on_build hook adding a document's values to the store. While
+    `philaunch_timeseries.py record` runs, the metrics it samples are left to
+    it (one writer per metric). Storage errors never fail the document.
+    """
+    def record(data: Dict):
+        from philaunch_timeseries import RECORDER_METRICS, TimeSeriesError
+        try:
+            store = history()
+            samples = extract(data)
+            if store.recorder_running():
+                samples = {name: value for name, value in samples.items()
+                           if name not in RECORDER_METRICS}
+            store.add(samples)
+        except (OSError, TimeSeriesError):
+            pass
+    return record
+
+
+def default_documents(api_dir: Path = ROOT / 'api') -> Dict[str, Document]:
+    from philaunch_timeseries import metrics_samples, wow_samples
+    recorders = {'metrics': history_recorder(metrics_samples), 'wow': history_recorder(wow_samples)}
+    producers = {
+        'status': script_producer(api_dir / 'status.sh'),
+        'metrics': script_producer(api_dir / 'metrics.sh', env=network_env),
+        'tasks': thread_producer(build_tasks),
+        'wow': script_producer(api_dir / 'wow.sh'),
+        'logs': thread_producer(build_logs),
+        'info': script_producer(api_dir / 'info.sh'),
+    }
+    return {name: Document(name, produce, TTLS[name], recorders.get(name))
+            for name, produce in producers.items()}
+
+
+# === Event stream ===
+
+class EventHub:
+    """
+    Fan-out of changed sections to Server-Sent Events subscribers.
+
+    A new subscriber gets every section straight away. After that, one loop
+    (alive only while there are subscribers) reads the PUSHED documents
+    through their TTL caches every PUSH_INTERVAL. A section is sent only if
+    its version differs from the one last sent.
+    The message bytes are shared, so each extra client costs one socket write.
+    Clients that stop reading are dropped rather than buffered for.
+    """
+
+    def __init__(self, documents: Dict[str, Document], sections=PUSHED,
+                 interval: float = PUSH_INTERVAL):
+        self.documents = documents
+        self.sections = [name for name in sections if name in documents]
+        self.interval = interval
+        self.subscribers: Set[asyncio.StreamWriter] = set()
+        self.sent = 0  # Messages broadcast (each to every subscriber)
+        self._versions: Dict[str, int] = {}  # section -> version last sent
+        self._last_write = 0.0
+        self._task: Optional[asyncio.Future] = None
+
+    async def stream(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve one /api/events client until it disconnects"""
+        writer.write(b'HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n'
+                     b'Cache-Control: no-cache\r\nConnection: keep-alive\r\n'
+                     b'X-Accel-Buffering: no\r\n\r\nretry: 3000\n\n')
+        await asyncio.gather(*(document.get() for document in self.documents.values()))
+        for document in self.documents.values():
+            writer.write(document.event())
+            if not self.subscribers:
+                # Nobody else to keep in step with: start change tracking from here
+                self._versions[document.name] = document.version
+        await writer.drain()
+
+        self.subscribers.add(writer)
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+        try:
+            while await reader.read(1024):  # EventSource never sends; EOF means gone
+                pass
+        finally:
+            self.subscribers.discard(writer)
+
+    async def _run(self):
+        while self.subscribers:
+            documents = [self.documents[name] for name in self.sections]
+            await asyncio.gather(*(document.get() for document in documents))
+            for document in documents:
+                if self._versions.get(document.name) != document.version:
+                    self._versions[document.name] = document.version
+                    self.broadcast(document.event())
+            if time.monotonic() - self._last_write >= HEARTBEAT:
+                self.broadcast(b': ping\n\n')
+            await asyncio.sleep(self.interval)
+
+    def broadcast(self, message: bytes):
+        self._last_write = time.monotonic()
+        if not message.startswith(b':'):
+            self.sent += 1
+        for writer in list(self.subscribers):
+            if writer.is_closing() or writer.transport.get_write_buffer_size() > MAX_BUFFERED:
+                self.subscribers.discard(writer)
+                writer.close()
+            else:
+                writer.write(message)
+
+
+# === HTTP ===
+
+class DashboardServer:
+    """
+    Minimal HTTP/1.1 server (GET/HEAD, keep-alive) for the dashboard.
+
+    Only index.html and files under static/ are served from disk; api/*.json
+    paths map to documents and never touch the api/ directory.
+    """
+
+    def __init__(self, root: Path = ROOT, documents: Optional[Dict[str, Document]] = None):
+        self.root = root
+        self.documents = documents if documents is not None else default_documents(root / 'api')
+        self.hub = EventHub(self.documents)
+        self.boot = format(int(time.time()), 'x')  # Versions restart with the process
+        self._snapshot: Tuple[str, bytes] = ('', b'')
+        self._static: Dict[Path, Tuple[float, bytes]] = {}
+
+    async def serve(self, host: str, port: int):
+        server = await asyncio.start_server(self.handle, host, port)
+        async with server:
+            await server.serve_forever()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except ValueError as e:
+                    await self.respond(writer, 400, json.dumps({'error': str(e)}).encode(),
+                                       'application/json', keep_alive=False)
+                    break
+                if request is None:
+                    break
+                method, target, headers = request
+                if method == 'GET' and urlsplit(target).path == '/api/events':
+                    await self.hub.stream(reader, writer)
+                    break
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                await self.dispatch(method, target, headers, writer, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.TimeoutError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader):
+        """(method, target, lower-cased headers), or None on EOF/idle timeout; ValueError if unusable"""
+        try:
+            line = await asyncio.wait_for(reader.readline(), KEEPALIVE_TIMEOUT)
+        except asyncio.TimeoutError:
+            return None
+        if not line:
+            return None
+        parts = line.decode('latin-1').split()
+        if len(parts) != 3:
+            raise ConnectionError('malformed request line')
+        headers = {}
+        for _ in range(MAX_HEADER_LINES):
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        length = headers.get('content-length', '0') or '0'
+        if not length.isdigit():
+            raise ValueError(f"bad Content-Length '{length}'")
+        length = int(length)
+        if length:
+            await reader.readexactly(length)  # GET/HEAD only; drop any body
+        return parts[0], parts[1], headers
+
+    async def dispatch(self, method: str, target: str, headers: Dict[str, str],
+                       writer: asyncio.StreamWriter, keep_alive: bool):
+        if method not in ('GET', 'HEAD'):
+            await self.respond(writer, 405, b'', 'text/plain', keep_alive, {'Allow': 'GET, HEAD'})
+            return
+        path = unquote(urlsplit(target).path)
+        if path == '/api/snapshot':
+            etag, body = await self.snapshot()
+            if _etag_matches(headers.get('if-none-match', ''), etag):
+                await self.respond(writer, 304, b'', '', keep_alive,
+                                   {'ETag': etag, 'Cache-Control': 'no-cache'})
+            else:
+                await self.respond(writer, 200, body, 'application/json', keep_alive,
+                                   {'ETag': etag, 'Cache-Control': 'no-cache'},
+                                   head=method == 'HEAD')
+            return
+        if path == '/api/metrics/history':
+            status, body = await self.metrics_history(urlsplit(target).query)
+            await self.respond(writer, status, body, 'application/json', keep_alive,
+                               {'Cache-Control': 'no-cache'}, head=method == 'HEAD')
+            return
+        if path.startswith('/api/') and path.endswith('.json'):
+            document = self.documents.get(path[len('/api/'):-len('.json')])
+            if document is None:
+                await self.respond(writer, 404, b'{"error": "unknown document"}',
+                                   'application/json', keep_alive)
+                return
+            body = await document.get()
+            await self.respond(writer, 200, body, 'application/json', keep_alive,
+                               {'Cache-Control': 'no-cache'}, head=method == 'HEAD')
+            return
+        file = self._resolve(path)
+        if file is None:
+            await self.respond(writer, 404, b'Not Found', 'text/plain', keep_alive)
+            return
+        mtime, body = self._read_static(file)
+        await self.respond(writer, 200, body, CONTENT_TYPES.get(file.suffix, 'application/octet-stream'),
+                           keep_alive, {'Last-Modified': formatdate(mtime, usegmt=True)},
+                           head=method == 'HEAD')
+
+    async def snapshot(self) -> Tuple[str, bytes]:
+        """
+        (ETag, body) of every section at its current version.
+
+        The tag is the process start plus each section's version, and the
+        body is only rebuilt when the tag changes, so one tag always names
+        the same bytes (a strong validator).
+        """
+        await asyncio.gather(*(document.get() for document in self.documents.values()))
+        versions = {name: document.version for name, document in self.documents.items()}
+        etag = f'"{self.boot}-{".".join(str(version) for version in versions.values())}"'
+        if etag != self._snapshot[0]:
+            body = json.dumps({
+                'versions': versions,
+                'sections': {name: document.data for name, document in self.documents.items()},
+            }, separators=(',', ':'), default=str).encode()
+            self._snapshot = (etag, body)
+        return self._snapshot
+
+    async def metrics_history(self, query: str) -> Tuple[int, bytes]:
+        """
+        (status, body) for /api/metrics/history?range=24h[&metric=cpu,mem][&points=300].
+
+        Reads the time-series store only: the query picks the segment whose
+        resolution fits `points`, so even 30 days is a few hundred rows.
+        """
+        from philaunch_timeseries import DEFAULT_POINTS, TimeSeriesError, parse_range
+        params = parse_qs(query)
+        try:
+            seconds = parse_range(params.get('range', ['1h'])[0])
+            points = min(int(params.get('points', [DEFAULT_POINTS])[0]), 5000)
+            store = history()
+            wanted = [name for value in params.get('metric', []) for name in value.split(',') if name]
+            result = {}
+            for name in wanted or store.metrics():
+                found = store.query(name, seconds, points)
+                if found is not None:
+                    result[name] = found
+        except (TimeSeriesError, ValueError) as e:
+            return 400, json.dumps({'error': str(e)}).encode()
+        return 200, json.dumps({'range': seconds, 'metrics': result},
+                               separators=(',', ':')).encode()
+
+    def _resolve(self, path: str) -> Optional[Path]:
+        """index.html or a file under static/ - nothing else on disk is exposed"""
+        if path in ('/', '/index.html'):
+            return self.root / 'index.html'
+        if not path.startswith('/static/'):
+            return None
+        static = (self.root / 'static').resolve()
+        try:
+            file = (self.root / path.lstrip('/')).resolve()
+        except ValueError:  # Embedded NUL (%00)
+            return None
+        if static not in file.parents or not file.is_file():
+            return None
+        return file
+
+    def _read_static(self, file: Path) -> Tuple[float, bytes]:
+        mtime = file.stat().st_mtime
+        cached = self._static.get(file)
+        if cached is None or cached[0] != mtime:
+            cached = self._static[file] = (mtime, file.read_bytes())
+        return cached
+
+    async def respond(self, writer: asyncio.StreamWriter, status: int, body: bytes,
+                      content_type: str, keep_alive: bool, extra: Optional[Dict[str, str]] = None,
+                      head: bool = False):
+        headers = {} if status == 304 else {'Content-Type': content_type,
+                                            'Content-Length': str(len(body))}
+        headers['Connection'] = 'keep-alive' if keep_alive else 'close'
+        headers.update(extra or {})
+        lines = [f"HTTP/1.1 {status} {REASONS.get(status, '')}"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+        if not head:
+            writer.write(body)
+        await writer.drain()
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """If-None-Match check (weak comparison, as RFC 7232 specifies for it)"""
+    if header.strip() == '*':
+        return True
+    return any(tag.strip().replace('W/', '', 1) == etag for tag in header.split(','))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--port', type=int, default=int(os.environ.get('DASHBOARD_PORT', 8080)))
+    parser.add_argument('--bind', default='0.0.0.0')
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(DashboardServer().serve(args.bind, args.port))
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        print(f"✗ {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
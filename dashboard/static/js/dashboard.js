@@ -1,8 +1,23 @@
 // PhiLaunch Dashboard JavaScript
 
 let refreshInterval = null;
+let eventSource = null;
+let snapshotTag = null; // ETag of the last /api/snapshot rendered
+let snapshotSupported = true; // false when served without server.py
+let snapshotBoot = null; // Server start in that ETag; versions restart with it
+const renderedVersions = {};
 const REFRESH_RATE = 5000; // 5 seconds
 
+// Event stream sections (server.py /api/events) and what renders them
+const RENDERERS = {
+    status: renderSystemStatus,
+    metrics: renderMetrics,
+    tasks: renderTasks,
+    wow: renderWowMonitor,
+    logs: renderLogs,
+    info: renderSystemInfo
+};
+
 // Initialize dashboard on load
 document.addEventListener('DOMContentLoaded', () => {
     console.log('PhiLaunch Dashboard initializing...');
@@ -13,8 +28,9 @@ function initDashboard() {
     // Load initial data
     refreshDashboard();
 
-    // Start auto-refresh
+    // Start auto-refresh; polling stops once the event stream is connected
     startAutoRefresh();
+    startEventStream();
 
     // Update timestamps
     updateTimestamp();
@@ -41,7 +57,41 @@ function stopAutoRefresh() {
     document.getElementById('auto-refresh').textContent = 'OFF';
 }
 
+function startEventStream() {
+    if (!window.EventSource) {
+        return;
+    }
+
+    eventSource = new EventSource('api/events');
+    eventSource.onopen = () => {
+        stopAutoRefresh();
+        document.getElementById('auto-refresh').textContent = 'LIVE';
+    };
+    eventSource.onerror = () => {
+        // The browser reconnects by itself (unless the server has no stream);
+        // poll in the meantime
+        if (!refreshInterval) {
+            startAutoRefresh();
+        }
+    };
+
+    Object.entries(RENDERERS).forEach(([section, render]) => {
+        eventSource.addEventListener(section, event => {
+            try {
+                render(JSON.parse(event.data));
+                updateLastUpdate();
+            } catch (error) {
+                console.error(`Error rendering ${section}:`, error);
+            }
+        });
+    });
+}
+
 async function refreshDashboard() {
+    if (snapshotSupported && await loadSnapshot()) {
+        updateLastUpdate();
+        return;
+    }
     try {
         await Promise.all([
             loadSystemStatus(),
@@ -57,166 +107,237 @@ async function refreshDashboard() {
     }
 }
 
+// Every section in one request; 304 when nothing changed since snapshotTag
+async function loadSnapshot() {
+    try {
+        const response = await fetch('api/snapshot', {
+            cache: 'no-store',
+            headers: snapshotTag ? {'If-None-Match': snapshotTag} : {}
+        });
+        if (response.status === 304) {
+            return true;
+        }
+        if (!response.ok) {
+            snapshotSupported = response.status !== 404;
+            return false;
+        }
+        const snapshot = await response.json();
+        const etag = response.headers.get('ETag') || '';
+        const boot = etag.replace(/^"/, '').split('-')[0];
+        if (boot !== snapshotBoot) {
+            // server.py restarted: its versions count from 1 again
+            Object.keys(renderedVersions).forEach(section => delete renderedVersions[section]);
+            snapshotBoot = boot;
+        }
+        Object.entries(snapshot.sections).forEach(([section, data]) => {
+            const render = RENDERERS[section];
+            if (!render || renderedVersions[section] === snapshot.versions[section]) {
+                return;
+            }
+            try {
+                render(data);
+                renderedVersions[section] = snapshot.versions[section];
+            } catch (error) {
+                console.error(`Error rendering ${section}:`, error);
+            }
+        });
+        snapshotTag = etag;
+        return true;
+    } catch (error) {
+        console.error('Error loading snapshot:', error);
+        return false;
+    }
+}
+
 async function loadSystemStatus() {
     try {
         const response = await fetch('api/status.json');
-        const data = await response.json();
+        renderSystemStatus(await response.json());
+    } catch (error) {
+        console.error('Error loading system status:', error);
+        setOfflineStatus();
+    }
+}
 
-        // System Status
-        updateStatusCard('system-status', data.system);
+function renderSystemStatus(data) {
+    // System Status
+    updateStatusCard('system-status', data.system);
 
-        // Services Status
-        updateStatusCard('services-status', data.services);
+    // Services Status
+    updateStatusCard('services-status', data.services);
 
-        // Tasks Status
-        updateStatusCard('tasks-status', data.tasks);
+    // Tasks Status
+    updateStatusCard('tasks-status', data.tasks);
 
-        // Uptime
-        if (data.uptime) {
-            document.getElementById('uptime').textContent = `Uptime: ${data.uptime}`;
-        }
-    } catch (error) {
-        console.error('Error loading system status:', error);
-        setOfflineStatus();
+    // Uptime
+    if (data.uptime) {
+        document.getElementById('uptime').textContent = `Uptime: ${data.uptime}`;
     }
 }
 
 async function loadMetrics() {
     try {
         const response = await fetch('api/metrics.json');
-        const data = await response.json();
+        renderMetrics(await response.json());
+    } catch (error) {
+        console.error('Error loading metrics:', error);
+    }
+}
 
-        // CPU
-        updateMetric('cpu', data.cpu);
+function renderMetrics(data) {
+    // CPU
+    updateMetric('cpu', data.cpu);
 
-        // Memory
-        updateMetric('mem', data.memory);
+    // Memory
+    updateMetric('mem', data.memory);
 
-        // Disk
-        updateMetric('disk', data.disk);
+    // Disk
+    updateMetric('disk', data.disk);
 
-        // Network
-        updateNetworkMetric(data.network);
-    } catch (error) {
-        console.error('Error loading metrics:', error);
-    }
+    // Network
+    updateNetworkMetric(data.network);
 }
 
 async function loadTasks() {
     try {
         const response = await fetch('api/tasks.json');
-        const data = await response.json();
-
-        const tasksList = document.getElementById('tasks-list');
-
-        if (data.tasks && data.tasks.length > 0) {
-            tasksList.innerHTML = data.tasks.map(task => `
-                <div class="task-item">
-                    <span class="task-name">${escapeHtml(task.name)}</span>
-                    <span class="task-status ${task.status}">${task.status}</span>
-                </div>
-            `).join('');
-        } else {
-            tasksList.innerHTML = '<div class="loading-spinner">No active tasks</div>';
-        }
+        renderTasks(await response.json());
     } catch (error) {
         console.error('Error loading tasks:', error);
     }
 }
 
+function renderTasks(data) {
+    const tasksList = document.getElementById('tasks-list');
+
+    // Supervised tasks carry state/exit code; their tmux viewer sessions
+    // would otherwise show up a second time
+    const supervised = ((data.supervised && data.supervised.tasks) || []).slice(0, 10);
+    const supervisedNames = new Set(supervised.map(task => task.name));
+    const tasks = (data.tasks || [])
+        .filter(task => !supervisedNames.has(task.name))
+        .concat(supervised.map(task => ({
+            name: task.name,
+            status: task.state,
+            detail: task.state === 'pending'
+                ? `queued ${Math.round(task.wait)}s · ${task.priority}`
+                : task.exit_code === null
+                    ? `${Math.round(task.duration)}s`
+                    : `exit ${task.exit_code} · ${task.duration.toFixed(1)}s`
+        })));
+
+    if (tasks.length > 0) {
+        tasksList.innerHTML = tasks.map(task => `
+            <div class="task-item">
+                <span class="task-name">${escapeHtml(task.name)}</span>
+                ${task.detail ? `<span class="task-detail">${escapeHtml(task.detail)}</span>` : ''}
+                <span class="task-status ${escapeHtml(task.status)}">${escapeHtml(task.status)}</span>
+            </div>
+        `).join('');
+    } else {
+        tasksList.innerHTML = '<div class="loading-spinner">No active tasks</div>';
+    }
+}
+
 async function loadWowMonitor() {
     try {
         const response = await fetch('api/wow.json');
-        const data = await response.json();
-
-        const monitorDiv = document.getElementById('wow-monitor');
-
-        if (data.enabled && data.stats) {
-            monitorDiv.innerHTML = `
-                <div class="monitor-stat">
-                    <span>Latency (Avg)</span>
-                    <span style="color: ${getLatencyColor(data.stats.avg_latency)}">${data.stats.avg_latency}ms</span>
-                </div>
-                <div class="monitor-stat">
-                    <span>Latency (Best)</span>
-                    <span style="color: var(--success)">${data.stats.best_latency}ms</span>
-                </div>
-                <div class="monitor-stat">
-                    <span>Latency (Worst)</span>
-                    <span style="color: var(--warning)">${data.stats.worst_latency}ms</span>
-                </div>
-                <div class="monitor-stat">
-                    <span>Jitter</span>
-                    <span>${data.stats.jitter}ms</span>
-                </div>
-                <div class="monitor-stat">
-                    <span>Packet Loss</span>
-                    <span style="color: ${data.stats.loss > 0 ? 'var(--danger)' : 'var(--success)'}">
-                        ${data.stats.loss}
-                    </span>
-                </div>
-            `;
-        } else {
-            monitorDiv.innerHTML = '<div class="loading-spinner">WoW monitor not running</div>';
-        }
+        renderWowMonitor(await response.json());
     } catch (error) {
         console.error('Error loading WoW monitor:', error);
         document.getElementById('wow-monitor').innerHTML = '<div class="loading-spinner">Monitor unavailable</div>';
     }
 }
 
+function renderWowMonitor(data) {
+    const monitorDiv = document.getElementById('wow-monitor');
+
+    if (data.enabled && data.stats) {
+        monitorDiv.innerHTML = `
+            <div class="monitor-stat">
+                <span>Latency (Avg)</span>
+                <span style="color: ${getLatencyColor(data.stats.avg_latency)}">${data.stats.avg_latency}ms</span>
+            </div>
+            <div class="monitor-stat">
+                <span>Latency (Best)</span>
+                <span style="color: var(--success)">${data.stats.best_latency}ms</span>
+            </div>
+            <div class="monitor-stat">
+                <span>Latency (Worst)</span>
+                <span style="color: var(--warning)">${data.stats.worst_latency}ms</span>
+            </div>
+            <div class="monitor-stat">
+                <span>Jitter</span>
+                <span>${data.stats.jitter}ms</span>
+            </div>
+            <div class="monitor-stat">
+                <span>Packet Loss</span>
+                <span style="color: ${data.stats.loss > 0 ? 'var(--danger)' : 'var(--success)'}">
+                    ${data.stats.loss}
+                </span>
+            </div>
+        `;
+    } else {
+        monitorDiv.innerHTML = '<div class="loading-spinner">WoW monitor not running</div>';
+    }
+}
+
 async function loadLogs() {
     try {
         const response = await fetch('api/logs.json');
-        const data = await response.json();
-
-        const logsDiv = document.getElementById('logs-content');
-
-        if (data.logs && data.logs.length > 0) {
-            logsDiv.innerHTML = data.logs.map(log => `
-                <div class="log-entry">
-                    <span class="log-timestamp">${log.timestamp}</span>
-                    <span>${escapeHtml(log.message)}</span>
-                </div>
-            `).join('');
-        } else {
-            logsDiv.innerHTML = '<div class="loading-spinner">No recent logs</div>';
-        }
+        renderLogs(await response.json());
     } catch (error) {
         console.error('Error loading logs:', error);
     }
 }
 
+function renderLogs(data) {
+    const logsDiv = document.getElementById('logs-content');
+
+    if (data.logs && data.logs.length > 0) {
+        logsDiv.innerHTML = data.logs.map(log => `
+            <div class="log-entry">
+                <span class="log-timestamp">${log.timestamp}</span>
+                <span>${escapeHtml(log.message)}</span>
+            </div>
+        `).join('');
+    } else {
+        logsDiv.innerHTML = '<div class="loading-spinner">No recent logs</div>';
+    }
+}
+
 async function loadSystemInfo() {
     try {
         const response = await fetch('api/info.json');
-        const data = await response.json();
-
-        const infoDiv = document.getElementById('system-info');
-
-        infoDiv.innerHTML = `
-            <div class="info-item">
-                <span class="info-label">Hostname</span>
-                <span class="info-value">${escapeHtml(data.hostname)}</span>
-            </div>
-            <div class="info-item">
-                <span class="info-label">OS</span>
-                <span class="info-value">${escapeHtml(data.os)}</span>
-            </div>
-            <div class="info-item">
-                <span class="info-label">Kernel</span>
-                <span class="info-value">${escapeHtml(data.kernel)}</span>
-            </div>
-            <div class="info-item">
-                <span class="info-label">IP Address</span>
-                <span class="info-value">${escapeHtml(data.ip)}</span>
-            </div>
-        `;
+        renderSystemInfo(await response.json());
     } catch (error) {
         console.error('Error loading system info:', error);
     }
 }
 
+function renderSystemInfo(data) {
+    const infoDiv = document.getElementById('system-info');
+
+    infoDiv.innerHTML = `
+        <div class="info-item">
+            <span class="info-label">Hostname</span>
+            <span class="info-value">${escapeHtml(data.hostname)}</span>
+        </div>
+        <div class="info-item">
+            <span class="info-label">OS</span>
+            <span class="info-value">${escapeHtml(data.os)}</span>
+        </div>
+        <div class="info-item">
+            <span class="info-label">Kernel</span>
+            <span class="info-value">${escapeHtml(data.kernel)}</span>
+        </div>
+        <div class="info-item">
+            <span class="info-label">IP Address</span>
+            <span class="info-value">${escapeHtml(data.ip)}</span>
+        </div>
+    `;
+}
+
 function updateStatusCard(cardId, status) {
     const card = document.getElementById(cardId);
     const indicator = card.querySelector('.status-indicator');
@@ -256,6 +377,10 @@ function updateNetworkMetric(data) {
     if (data && data.status) {
         statusEl.textContent = data.status;
         barEl.style.width = data.connected ? '100%' : '0%';
+        // Per-target results from the connectivity prober, on hover
+        statusEl.title = (data.targets || []).map(target =>
+            `${target.name}: ${target.up ? `${target.rtt_ms} ms` : (target.error || 'not probed yet')}`
+        ).join('\n');
     }
 }
 
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark: output archive ingest rate and FTS5 search vs grep over the logs
+Builds a synthetic history (one run per task per hour) in a temporary directory
+
+Usage: python3 benchmarks/bench_archive.py [--runs N] [--lines N] [--rounds N]
+"""
+
+import argparse
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from philaunch_archive import OutputArchive
+
+TASKS = ('wow_monitor', 'status_monitor', 'backup', 'system_info_checker')
+WORDS = ('ping', 'latency', 'ok', 'packet', 'loss', 'disk', 'usage', 'memory', 'ssh', 'active',
+         'service', 'checked', 'bytes', 'received', 'from', 'server', 'time', 'status')
+
+
+def timed(label: str, fn, rounds: int):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        result = fn()
+    per_round = (time.perf_counter() - start) * 1000 / rounds
+    print(f"  {label:<44} {per_round:8.3f} ms")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--runs', type=int, default=2000)
+    parser.add_argument('--lines', type=int, default=200, help='lines per run')
+    parser.add_argument('--rounds', type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    with tempfile.TemporaryDirectory(prefix='philaunch-archive-') as tmp:
+        log_dir = Path(tmp) / 'tasks'
+        log_dir.mkdir()
+        stamp = time.time() - args.runs * 3600
+        for run in range(args.runs):
+            lines = [' '.join(rng.choice(WORDS) for _ in range(8)) + f' {rng.randrange(1000)}ms'
+                     for _ in range(args.lines)]
+            if run == args.runs // 3:
+                lines[7] = '⚠ HIGH LATENCY DETECTED: 412ms'
+            name = f"{TASKS[run % len(TASKS)]}-{time.strftime('%Y%m%d-%H%M%S', time.localtime(stamp))}"
+            (log_dir / f'{name}.log').write_text('\n'.join(lines) + '\n')
+            stamp += 3600
+        total = args.runs * args.lines
+        size = sum(p.stat().st_size for p in log_dir.iterdir())
+        print(f"{args.runs} runs, {total} lines, {size / 1e6:.1f} MB of logs")
+
+        archive = OutputArchive(Path(tmp) / 'archive.db')
+        start = time.perf_counter()
+        archive.import_logs(log_dir)
+        archive.close()
+        elapsed = time.perf_counter() - start
+        print(f"  ingest (batched transactions)              {total / elapsed:10.0f} lines/s "
+              f"({archive.stats()['bytes'] / 1e6:.1f} MB on disk)")
+
+        print("Search")
+        grep = ['grep', '-rF', 'HIGH LATENCY DETECTED', str(log_dir)]
+        timed("grep -rF over the logs (rare phrase)", lambda: subprocess.run(grep, capture_output=True),
+              max(1, args.rounds // 4))
+        result = timed("archive: rare phrase", lambda: archive.search('HIGH LATENCY DETECTED'),
+                       args.rounds)
+        assert len(result['hits']) == 1, result
+        timed("archive: common word (newest 100)", lambda: archive.search('latency'), args.rounds)
+        timed("archive: common word + task filter", lambda: archive.search('disk', name='backup'),
+              args.rounds)
+        # A prefix merges the posting lists of every matching term first
+        timed("archive: prefix of a common word", lambda: archive.search('pack*'), args.rounds)
+        timed("archive: two words ANDed", lambda: archive.search('disk loss'), args.rounds)
+
+
+if __name__ == '__main__':
+    main()
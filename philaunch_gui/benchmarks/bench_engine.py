@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark: headless engine / CLI vs the shell entry points it replaces
+Each row is one cold process, as a phone SSH session or the dashboard runs it
+
+Usage: python3 benchmarks/bench_engine.py [--rounds N]
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+GUI_DIR = Path(__file__).resolve().parent.parent
+REPO = GUI_DIR.parent
+sys.path.insert(0, str(GUI_DIR))
+
+from philaunch_engine import PhiLaunchEngine, dashboard_tasks
+
+
+def timed(label: str, fn, rounds: int):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    per_round = (time.perf_counter() - start) * 1000 / rounds
+    print(f"  {label:<44} {per_round:8.3f} ms")
+
+
+def run(*argv: str):
+    return lambda: subprocess.run(argv, cwd=str(REPO), stdin=subprocess.DEVNULL,
+                                  capture_output=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--rounds', type=int, default=10)
+    args = parser.parse_args()
+
+    cli = str(GUI_DIR / 'philaunch_cli.py')
+    control = str(REPO / 'automation' / 'home-control.sh')
+    tasks_sh = REPO / 'dashboard' / 'api' / 'tasks.sh'
+
+    # tasks.sh without its CLI fast path, next to the original so the
+    # relative supervisor path still resolves
+    lines = tasks_sh.read_text().splitlines(keepends=True)
+    start = next(i for i, line in enumerate(lines) if line.startswith('# One python3'))
+    end = next(i for i in range(start, len(lines)) if lines[i].startswith('fi'))
+    legacy = tempfile.NamedTemporaryFile('w', dir=str(tasks_sh.parent), suffix='.sh', delete=False)
+    legacy.write(''.join(lines[:start] + lines[end + 1:]))
+    legacy.close()
+
+    print("Task list")
+    timed("home-control.sh list-tasks", run('bash', control, 'list-tasks'), args.rounds)
+    timed("philaunch_cli.py tasks", run(sys.executable, cli, 'tasks'), args.rounds)
+    print("Dashboard tasks.json")
+    try:
+        timed("tasks.sh, shell loop per session", run('bash', legacy.name), args.rounds)
+    finally:
+        Path(legacy.name).unlink()
+    timed("tasks.sh via philaunch_cli.py", run('bash', str(tasks_sh)), args.rounds)
+    print("Status")
+    timed("philaunch_cli.py status", run(sys.executable, cli, 'status'), args.rounds)
+    timed("philaunch_cli.py scripts", run(sys.executable, cli, 'scripts'), args.rounds)
+    timed("python3 -c pass (interpreter floor)", run(sys.executable, '-c', 'pass'), args.rounds)
+
+    print("In-process (a long-lived caller such as the GUI)")
+    engine = PhiLaunchEngine()
+    engine.scripts()
+    timed("engine.scripts() (warm catalog)", engine.scripts, args.rounds)
+    timed("dashboard_tasks(engine)", lambda: dashboard_tasks(engine), args.rounds)
+    engine.close()
+
+
+if __name__ == '__main__':
+    main()
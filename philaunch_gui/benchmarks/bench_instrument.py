@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cost of recording a duration, of a timed call and of a snapshot
+Compares a bare function call with the same call through Instruments.wrap
+
+Usage: python3 benchmarks/bench_instrument.py [--calls N] [--operations N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from philaunch_instrument import Instruments
+
+
+def timed(label: str, fn, calls: int):
+    start = time.perf_counter()
+    fn()
+    per_call = (time.perf_counter() - start) * 1e9 / calls
+    print(f"  {label:<44} {per_call:9.0f} ns")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--calls', type=int, default=200000)
+    parser.add_argument('--operations', type=int, default=200, help='distinct names in the snapshot')
+    args = parser.parse_args()
+
+    instruments = Instruments(slow_ms=1e9)
+
+    def handler(value):
+        return value
+
+    wrapped = instruments.wrap('slot:handler', handler)
+    calls = range(args.calls)
+
+    print(f"{args.calls} calls")
+    timed("bare call", lambda: [handler(i) for i in calls], args.calls)
+    timed("Instruments.wrap", lambda: [wrapped(i) for i in calls], args.calls)
+    timed("Instruments.record", lambda: [instruments.record('op', 1e-4) for _ in calls], args.calls)
+
+    def with_timer():
+        for i in calls:
+            with instruments.timer('timer'):
+                handler(i)
+    timed("with Instruments.timer", with_timer, args.calls)
+
+    for index in range(args.operations):
+        for sample in range(100):
+            instruments.record(f'op{index}', (sample + 1) * 1e-4)
+    start = time.perf_counter()
+    snapshot = instruments.snapshot()
+    print(f"  snapshot of {len(snapshot)} operations{'':<17} "
+          f"{(time.perf_counter() - start) * 1000:9.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark: journal follower over 100,000 entries
+Uses the file stand-in journal (PHILAUNCH_JOURNAL_FILE) so it runs without systemd
+
+Usage: python3 benchmarks/bench_journal.py [--entries N] [--rounds N]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from philaunch_journal import JournalFollower, format_entry, parse_record
+
+
+def build_journal(path: Path, entries: int):
+    units = ['ssh.service', 'cron.service', 'philaunch.service', 'NetworkManager.service']
+    now = int(time.time() * 1e6)
+    with open(path, 'w') as f:
+        for i in range(entries):
+            unit = units[i % len(units)]
+            f.write(json.dumps({
+                '__CURSOR': f's=bench;i={i:x}',
+                '__REALTIME_TIMESTAMP': str(now - (entries - i) * 1000),
+                'PRIORITY': str(3 + i % 4),
+                '_SYSTEMD_UNIT': unit,
+                'SYSLOG_IDENTIFIER': unit.split('.')[0],
+                '_PID': str(1000 + i % 50),
+                'MESSAGE': f'synthetic journal entry {i} with a typical amount of text',
+            }) + '\n')
+
+
+def timed(label: str, fn, rounds: int):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    per_round = (time.perf_counter() - start) * 1000 / rounds
+    print(f"  {label:<40} {per_round:8.3f} ms")
+
+
+def follow_all(journalctl, entries: int, **filters) -> int:
+    """Time until the follower has delivered the initial read"""
+    done = threading.Event()
+    received = []
+
+    def on_entries(batch, reset):
+        received.append(len(batch))
+        if sum(received) >= entries:
+            done.set()
+
+    follower = JournalFollower(on_entries, journalctl=journalctl, initial_lines=entries,
+                               **filters)
+    follower.start()
+    done.wait(timeout=60)
+    follower.stop()
+    assert sum(received) == entries, (sum(received), entries)
+    return sum(received)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--entries', type=int, default=100_000)
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='philaunch-journal-') as tmp:
+        path = Path(tmp) / 'journal.jsonl'
+        build_journal(path, args.entries)
+        lines = path.read_bytes().splitlines()
+        entries = [parse_record(line) for line in lines]
+
+        print(f"Journal stand-in ({args.entries:,} entries)")
+        timed("parse_record() x all", lambda: [parse_record(line) for line in lines], args.rounds)
+        timed("format_entry() x one screen (60 rows)",
+              lambda: [format_entry(entry) for entry in entries[-60:]], args.rounds * 100)
+
+        module = Path(__file__).resolve().parent.parent / 'philaunch_journal.py'
+        journalctl = [sys.executable, str(module), 'replay', '--file', str(path)]
+        timed("follower: initial read, no filter",
+              lambda: follow_all(journalctl, args.entries), args.rounds)
+        timed("follower: --unit=ssh --priority=err",
+              lambda: follow_all(journalctl, args.entries // 4, units=['ssh'], priority='err'),
+              args.rounds)
+
+
+if __name__ == '__main__':
+    main()
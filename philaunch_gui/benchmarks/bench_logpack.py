@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark: log packs vs plain text and whole-file gzip for tail, line and time reads
+Generates a wow_monitor-style log (one stamped line every 2 s) in a temporary directory
+
+Usage: python3 benchmarks/bench_logpack.py [--lines N] [--rounds N]
+"""
+
+import argparse
+import gzip
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from philaunch_logpack import LogPack, pack_file, read_between, read_lines, tail_lines
+
+
+def timed(label: str, fn, rounds: int):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        result = fn()
+    per_round = (time.perf_counter() - start) * 1000 / rounds
+    print(f"  {label:<44} {per_round:9.3f} ms")
+    return result
+
+
+def gzip_lines(path: Path, start: int, stop: int):
+    with gzip.open(path, 'rb') as f:
+        return [line for number, line in enumerate(f) if start <= number < stop]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--lines', type=int, default=500000)
+    parser.add_argument('--rounds', type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='philaunch-logpack-') as tmp:
+        plain = Path(tmp) / 'wow_connection_20261001.log'
+        origin = time.mktime(time.strptime('2026-10-01', '%Y-%m-%d'))
+        with open(plain, 'w') as f:
+            for i in range(args.lines):
+                stamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(origin + i * 2))
+                f.write(f"[{stamp}] Latency: Best={20 + i % 17}.0ms Avg={40 + i % 61}.5ms "
+                        f"Worst={90 + i % 113}.0ms Jitter={i % 23}.2ms Loss={i % 3}.0%\n")
+        size = plain.stat().st_size
+        print(f"{args.lines} lines, {size / 1e6:.1f} MB plain")
+
+        gz = Path(tmp) / 'whole.log.gz'
+        start = time.perf_counter()
+        with open(plain, 'rb') as src, gzip.open(gz, 'wb', compresslevel=6) as dst:
+            shutil.copyfileobj(src, dst)
+        print(f"  gzip (whole file)      {time.perf_counter() - start:6.2f} s  "
+              f"{gz.stat().st_size / size:6.1%} of text")
+        start = time.perf_counter()
+        result = pack_file(plain, keep=True)
+        print(f"  pack (64 KiB blocks)   {time.perf_counter() - start:6.2f} s  "
+              f"{result['bytes_out'] / size:6.1%} of text (incl. verify)")
+        packed = Path(result['pack'])
+
+        middle = args.lines // 2
+        window = (origin + middle * 2, origin + middle * 2 + 600)  # 10 minutes
+        print("Last 20 lines")
+        timed("plain (seek from the end)", lambda: tail_lines(plain, 20), args.rounds)
+        timed("pack", lambda: tail_lines(packed, 20), args.rounds)
+        timed("gzip (decompress everything)",
+              lambda: gzip_lines(gz, args.lines - 20, args.lines), max(1, args.rounds // 5))
+        print(f"Lines {middle}..{middle + 100}")
+        timed("plain (read whole file)", lambda: read_lines(plain, middle, middle + 100),
+              max(1, args.rounds // 5))
+        expected = timed("pack", lambda: read_lines(packed, middle, middle + 100), args.rounds)
+        assert expected == read_lines(plain, middle, middle + 100)
+        print("10-minute window")
+        timed("plain (parse every stamp)", lambda: read_between(plain, *window),
+              max(1, args.rounds // 5))
+        found = timed("pack (index skips other blocks)", lambda: read_between(packed, *window),
+                      args.rounds)
+        assert len(found) == 301, len(found)
+        with LogPack(packed) as pack:
+            print(f"  ({len(pack.blocks)} blocks, index {len(pack.blocks) * 40 / 1e3:.1f} kB)")
+
+
+if __name__ == '__main__':
+    main()
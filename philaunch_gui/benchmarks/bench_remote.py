@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-command SSH latency, fresh connection vs pooled master
+Needs an sshd that accepts key auth for the target (default: $USER@localhost)
+
+Usage: python3 benchmarks/bench_remote.py [--target USER@HOST] [--port N] [--rounds N]
+"""
+
+import argparse
+import getpass
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from philaunch_remote import RemoteError, SSHPool
+
+
+def timed(label: str, fn, rounds: int):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    per_round = (time.perf_counter() - start) * 1000 / rounds
+    print(f"  {label:<40} {per_round:8.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--target', default=f'{getpass.getuser()}@localhost')
+    parser.add_argument('--port', type=int, default=22)
+    parser.add_argument('--rounds', type=int, default=20)
+    args = parser.parse_args()
+
+    host = {'name': 'bench', 'target': args.target, 'port': args.port}
+    with tempfile.TemporaryDirectory(prefix='philaunch-ssh-') as tmp:
+        pool = SSHPool({'bench': host}, control_dir=Path(tmp), persist=60)
+        try:
+            pool.connect('bench')
+        except RemoteError as e:
+            print(f"Skipped: cannot reach {args.target}:{args.port} ({e})")
+            return
+
+        fresh = ['ssh', '-o', 'BatchMode=yes', '-o', 'ControlPath=none', '-p', str(args.port),
+                 args.target, 'true']
+        print(f"SSH round trips to {args.target}:{args.port}")
+        timed("fresh connection per command",
+              lambda: subprocess.run(fresh, stdin=subprocess.DEVNULL, capture_output=True),
+              args.rounds)
+        timed("pooled (ControlMaster) per command", lambda: pool.run('true', 'bench'), args.rounds)
+        pool.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark: RUNNING TASKS refresh with 500 synthetic sessions
+Compares the old clear-and-rebuild refresh against TaskTreeModel deltas
+
+Usage: python3 benchmarks/bench_task_tree.py [--sessions N] [--rounds N]
+The Qt part runs offscreen and is skipped when PyQt6 is not installed.
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from philaunch_sessions import diff_sessions
+
+
+def synthetic_sessions(count: int, offset: int = 0):
+    return [
+        {'id': f'${i}', 'name': f'task-{i:04d}', 'created': 1762900000 + i,
+         'windows': 1, 'attached': False}
+        for i in range(offset, offset + count)
+    ]
+
+
+def timed(label: str, fn, rounds: int):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    per_round = (time.perf_counter() - start) * 1000 / rounds
+    print(f"  {label:<40} {per_round:8.3f} ms")
+
+
+def bench_diff(count: int, rounds: int):
+    print(f"diff_sessions ({count} sessions)")
+    sessions = synthetic_sessions(count)
+    known = {s['name']: s for s in sessions}
+
+    renamed = [dict(s) for s in sessions]
+    renamed[count // 2]['name'] = 'renamed'
+    grown = sessions + synthetic_sessions(1, offset=count)
+
+    timed("unchanged", lambda: diff_sessions(known, sessions), rounds)
+    timed("one rename", lambda: diff_sessions(known, renamed), rounds)
+    timed("one added", lambda: diff_sessions(known, grown), rounds)
+    timed("all new (cold start)", lambda: diff_sessions({}, sessions), rounds)
+
+
+def bench_qt(count: int, rounds: int):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        from PyQt6.QtCore import Qt
+        from PyQt6.QtWidgets import QApplication, QTreeWidget, QTreeWidgetItem
+    except ImportError:
+        print("PyQt6 not installed - skipping tree benchmark")
+        return
+
+    from philaunch_task_tree import TaskTreeModel
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    sessions = synthetic_sessions(count)
+    names = [s['name'] for s in sessions]
+
+    print(f"QTreeWidget refresh ({count} sessions)")
+
+    tree = QTreeWidget()
+    root = QTreeWidgetItem(tree, ["▼ RUNNING TASKS"])
+
+    def rebuild():
+        while root.childCount() > 0:
+            root.removeChild(root.child(0))
+        for name in names:
+            item = QTreeWidgetItem(root, [f"  ├─ ▶ {name}"])
+            item.setData(0, Qt.ItemDataRole.UserRole, f"task:{name}")
+
+    timed("rebuild (old refresh_task_list)", rebuild, rounds)
+
+    while root.childCount() > 0:
+        root.removeChild(root.child(0))
+    model = TaskTreeModel(root)
+    model.apply(sessions)
+
+    renamed = [dict(s) for s in sessions]
+    renamed[count // 2]['name'] = 'renamed'
+
+    timed("model.apply unchanged", lambda: model.apply(sessions), rounds)
+    timed("model.apply rename + rename back",
+          lambda: (model.apply(renamed), model.apply(sessions)), rounds)
+    app.processEvents()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--sessions', type=int, default=500)
+    parser.add_argument('--rounds', type=int, default=50)
+    args = parser.parse_args()
+
+    bench_diff(args.sessions, args.rounds)
+    bench_qt(args.sessions, args.rounds)
+
+
+if __name__ == '__main__':
+    main()
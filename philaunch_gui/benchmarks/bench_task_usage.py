@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-task usage walk over 1,000 processes
+Builds a synthetic /proc (stat, task/<tid>/children, uptime) and times sample()
+
+Usage: python3 benchmarks/bench_task_usage.py [--procs N] [--tasks N] [--rounds N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from philaunch_task_usage import TaskUsageCollector
+
+
+def build_proc(root: Path, procs: int, tasks: int, pools: int = 4):
+    """Each task: a root shell -> `pools` worker parents -> leaf processes"""
+    (root / 'uptime').write_text('1000.00 900.00\n')
+    children = {}
+    roots = {}
+    per_task = procs // tasks
+    pid = 100
+    for task in range(tasks):
+        shell = pid
+        roots[f'task-{task:03d}'] = [shell]
+        children[shell] = list(range(shell + 1, shell + 1 + pools))
+        leaves = range(shell + 1 + pools, shell + per_task)
+        for offset, leaf in enumerate(leaves):
+            children.setdefault(shell + 1 + offset % pools, []).append(leaf)
+            children[leaf] = []
+        for parent in children[shell]:
+            children.setdefault(parent, [])
+        pid += per_task
+
+    for proc, kids in children.items():
+        stat = (f"{proc} (worker {proc}) S 1 {proc} {proc} 0 -1 4194304 0 0 0 0 "
+                f"{proc % 50} {proc % 7} 0 0 20 0 1 0 {proc} 1000000 {proc % 300} 0\n")
+        base = root / str(proc)
+        (base / 'task' / str(proc)).mkdir(parents=True)
+        (base / 'stat').write_text(stat)
+        (base / 'task' / str(proc) / 'children').write_text(' '.join(map(str, kids)))
+    # Lets the collector detect children-file support for this fake root
+    me = root / str(os.getpid()) / 'task' / str(os.getpid())
+    me.mkdir(parents=True, exist_ok=True)
+    (me / 'children').write_text('')
+    return roots
+
+
+def timed(label: str, fn, rounds: int):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    per_round = (time.perf_counter() - start) * 1000 / rounds
+    print(f"  {label:<40} {per_round:8.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--procs', type=int, default=1000)
+    parser.add_argument('--tasks', type=int, default=20)
+    parser.add_argument('--rounds', type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='philaunch-proc-') as tmp:
+        roots = build_proc(Path(tmp), args.procs, args.tasks)
+        collector = TaskUsageCollector(proc_root=tmp)
+        collector.set_roots(roots)
+        collector.sample()
+        walked = sum(usage['procs'] for usage in collector.usage.values())
+
+        print(f"TaskUsageCollector ({walked} processes in {len(roots)} tasks, synthetic /proc)")
+        timed("sample() via children files", collector.sample, args.rounds)
+
+        collector._children_files = False
+        timed("sample() via full /proc scan", collector.sample, args.rounds)
+
+    live = TaskUsageCollector()
+    live.set_roots({'init': [1]})
+    live.sample()
+    print(f"Live /proc from pid 1 ({live.usage['init']['procs']} processes)")
+    timed("sample()", live.sample, args.rounds)
+
+
+if __name__ == '__main__':
+    main()
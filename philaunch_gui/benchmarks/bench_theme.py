@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark: application stylesheet compile and window restyle
+Times compile_stylesheet() cold vs cached and, with PyQt6, window construction
+
+Usage: python3 benchmarks/bench_theme.py [--rounds N]
+The Qt part runs offscreen and is skipped when PyQt6 is not installed.
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from philaunch_theme import DEFAULT_THEME, compile_stylesheet
+
+
+def timed(label: str, fn, rounds: int):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    per_round = (time.perf_counter() - start) * 1000 / rounds
+    print(f"  {label:<40} {per_round:8.3f} ms")
+
+
+def bench_compile(rounds: int):
+    print("compile_stylesheet")
+
+    def cold():
+        compile_stylesheet.cache_clear()
+        compile_stylesheet(DEFAULT_THEME)
+
+    timed("cold (cache cleared)", cold, rounds)
+    compile_stylesheet(DEFAULT_THEME)
+    timed("cached", lambda: compile_stylesheet(DEFAULT_THEME), rounds)
+    print(f"  sheet size: {len(compile_stylesheet(DEFAULT_THEME))} bytes")
+
+
+def bench_qt(rounds: int):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    os.environ.setdefault("DISPLAY", ":0")
+    try:
+        from PyQt6.QtWidgets import QApplication
+    except ImportError:
+        print("PyQt6 not installed - skipping window benchmark")
+        return
+
+    from philaunch_gui import PhiLaunchControlCenter
+    from philaunch_theme import apply_theme
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    apply_theme(app)
+
+    print("PhiLaunchControlCenter")
+    windows = []
+
+    def construct():
+        window = PhiLaunchControlCenter()
+        window.ensurePolished()
+        windows.append(window)
+
+    timed("construct + polish", construct, max(1, rounds // 10))
+
+    def restyle():
+        app.setStyleSheet("")
+        apply_theme(app)
+        app.processEvents()
+
+    timed("restyle (re-apply theme)", restyle, max(1, rounds // 10))
+
+    for window in windows:
+        window.close()
+    app.processEvents()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--rounds', type=int, default=200)
+    args = parser.parse_args()
+
+    bench_compile(args.rounds)
+    bench_qt(args.rounds)
+
+
+if __name__ == '__main__':
+    main()
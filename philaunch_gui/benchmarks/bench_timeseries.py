@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Benchmark: time-series insert cost and history queries over 30 days
+Fills a scratch store with a month of per-minute samples plus the last hour per second
+
+Usage: python3 benchmarks/bench_timeseries.py [--metrics N] [--points N]
+"""
+
+import argparse
+import math
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from philaunch_timeseries import TimeSeriesStore, parse_range
+
+
+def timed(label: str, fn, calls: int = 1):
+    start = time.perf_counter()
+    fn()
+    print(f"  {label:<44} {(time.perf_counter() - start) * 1000 / calls:9.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--metrics', type=int, default=8)
+    parser.add_argument('--points', type=int, default=300)
+    args = parser.parse_args()
+
+    names = [f"m{index}" for index in range(args.metrics)]
+    now = time.time()
+    with tempfile.TemporaryDirectory() as directory:
+        store = TimeSeriesStore(Path(directory))
+        minutes = 30 * 1440
+
+        def fill():
+            for minute in range(minutes):
+                value = 50 + 40 * math.sin(minute / 500)
+                store.add({name: value for name in names}, now - (minutes - minute) * 60)
+            for second in range(3600):
+                store.add({name: random.uniform(0, 100) for name in names}, now - 3600 + second)
+
+        print(f"{args.metrics} metrics, {minutes + 3600} batches")
+        timed(f"add (batch of {args.metrics})", fill, minutes + 3600)
+        for text in ('1h', '24h', '7d', '30d'):
+            seconds = parse_range(text)
+            timed(f"query {text:>3} x {args.metrics} metrics ({args.points} points)",
+                  lambda: [store.query(name, seconds, args.points, now) for name in names])
+        size = sum(path.stat().st_blocks * 512 for path in Path(directory).glob('*.ts'))
+        print(f"  on disk{'':<37} {size / 1e6:9.1f} MB")
+        store.close()
+
+
+if __name__ == '__main__':
+    main()
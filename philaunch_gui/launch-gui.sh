@@ -51,8 +51,13 @@ echo ""
 # Navigate to GUI directory
 cd "$(dirname "$0")"
 
+# Load PhiLaunch configuration if available (SSH port, GUI settings)
+if [ -f "../config/load-config.sh" ]; then
+    source "../config/load-config.sh" 2>/dev/null || true
+fi
+
 # Launch GUI
-python3 philaunch_gui.py
+python3 philaunch_gui.py "$@"
 
 # Exit code handling
 EXIT_CODE=$?
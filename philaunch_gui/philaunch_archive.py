@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+PhiLaunch Output Archive
+Searchable on-disk history of task output and LIVE OUTPUT (SQLite FTS5)
+
+Every line is stored once in `lines` and indexed in an FTS5 table, so a
+search is an inverted-index lookup rather than a scan of old logs. Writers
+never touch the database themselves: start_run/append/end_run only queue
+work, and one background thread commits it in batches (one transaction per
+`batch_lines` lines or `flush_interval` seconds). The database is in WAL
+mode, so the supervisor daemon and the GUI can write while others search.
+
+Runs are keyed by a string: supervised tasks use their log file path, which
+also lets `import` backfill old logs without duplicating live ones. Without
+FTS5 in the local SQLite, search falls back to a LIKE scan.
+
+Usage:
+    philaunch_archive.py search QUERY... [-n LIMIT] [--source SRC] [--name NAME] [--json]
+    philaunch_archive.py import [LOG_DIR]
+    philaunch_archive.py stats
+"""
+
+import argparse
+import codecs
+import json
+import queue
+import re
+import sqlite3
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from philaunch_paths import state_dir
+
+
+ARCHIVE_FILE = 'output_archive.db'
+LOG_NAME = re.compile(r'^(?P<name>.+)-(?P<stamp>\d{8}-\d{6})\.log$')
+LOG_TRAILER = re.compile(rb'\[philaunch\] .* \(exit (-?\d+)\) after [\d.]+s\s*$')
+# CSI / OSC escape sequences from pty output (colors, cursor movement, titles)
+ANSI_ESCAPE = re.compile(r'\x1b\[[0-9;?]*[ -/]*[@-~]|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)|\x1b[()][0-9A-B]')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    key TEXT UNIQUE NOT NULL,
+    source TEXT NOT NULL,
+    name TEXT NOT NULL,
+    started REAL NOT NULL,
+    ended REAL,
+    exit_code INTEGER
+);
+CREATE TABLE IF NOT EXISTS lines (
+    id INTEGER PRIMARY KEY,
+    run INTEGER NOT NULL,
+    ts REAL NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS lines_run ON lines (run);
+"""
+FTS_SCHEMA = ("CREATE VIRTUAL TABLE IF NOT EXISTS lines_fts USING fts5("
+              "text, content='lines', content_rowid='id')")
+
+
+def clean_line(text: str) -> str:
+    """Strip escape sequences; keep what a \\r-redrawn line ended up showing"""
+    text = ANSI_ESCAPE.sub('', text)
+    if '\r' in text:
+        text = text.rstrip('\r').rpartition('\r')[2]
+    return text.rstrip()
+
+
+def fts_query(text: str) -> str:
+    """
+    User input -> FTS5 query. Plain words are quoted (so `-`, `:` and `.`
+    don't break the syntax) and ANDed; a trailing * keeps prefix matching.
+    Input that already contains double quotes is passed through as-is.
+    """
+    if '"' in text:
+        return text
+    terms = []
+    for word in text.split():
+        prefix = word.endswith('*')
+        word = word.rstrip('*')
+        if word:
+            terms.append(f'"{word}"' + ('*' if prefix else ''))
+    return ' '.join(terms)
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    db = sqlite3.connect(str(path), timeout=10, check_same_thread=False)
+    db.execute('PRAGMA journal_mode=WAL')
+    db.execute('PRAGMA synchronous=NORMAL')
+    return db
+
+
+class OutputArchive:
+    """
+    Batched writer and searcher for the archive database.
+
+    start_run/append/end_run are non-blocking and safe from any thread
+    (the asyncio daemon calls them from its event loop). The writer thread
+    starts with the first write, so processes that only search never run it.
+    """
+
+    def __init__(self, path: Optional[Path] = None, batch_lines: int = 2000,
+                 flush_interval: float = 1.0):
+        self.path = Path(path) if path else state_dir() / ARCHIVE_FILE
+        self.batch_lines = batch_lines
+        self.flush_interval = flush_interval
+
+        db = _connect(self.path)
+        with db:
+            db.executescript(SCHEMA)
+            try:
+                db.execute(FTS_SCHEMA)
+                self.fts = True
+            except sqlite3.OperationalError:
+                self.fts = False  # SQLite built without FTS5: LIKE scan instead
+        db.close()
+
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    # === Writing (any thread) ===
+
+    def start_run(self, key: str, source: str, name: str, started: Optional[float] = None):
+        self._put(('start', key, source, name, started or time.time()))
+
+    def append(self, key: str, data):
+        """Raw output (str or bytes, partial lines allowed)"""
+        self._put(('append', key, data, time.time()))
+
+    def end_run(self, key: str, exit_code: Optional[int] = None):
+        self._put(('end', key, exit_code, time.time()))
+
+    def flush(self, timeout: float = 10.0):
+        """Block until everything queued so far is committed"""
+        if self._thread is None:
+            return
+        done = threading.Event()
+        self._queue.put(('flush', done))
+        done.wait(timeout)
+
+    def close(self):
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout=10)
+        self._thread = None
+
+    def _put(self, op):
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._writer, name='philaunch-archive',
+                                                    daemon=True)
+                    self._thread.start()
+        self._queue.put(op)
+
+    # === Writer thread ===
+
+    def _writer(self):
+        db = _connect(self.path)
+        runs: Dict[str, int] = {}  # key -> runs.id
+        partial: Dict[str, str] = {}  # key -> unterminated tail of its output
+        decoders: Dict[str, codecs.IncrementalDecoder] = {}  # Chunks may split a character
+        ops: List = []  # start / lines / end records, committed in order
+        deadline = None
+
+        def run_id(key: str, source: str = 'console', name: str = '', started: float = 0.0):
+            if key not in runs:
+                db.execute('INSERT OR IGNORE INTO runs (key, source, name, started) '
+                           'VALUES (?, ?, ?, ?)', (key, source, name or key, started or time.time()))
+                runs[key] = db.execute('SELECT id FROM runs WHERE key = ?', (key,)).fetchone()[0]
+            return runs[key]
+
+        def commit():
+            with db:
+                for op in ops:
+                    if op[0] == 'start':
+                        run_id(*op[1:])
+                    elif op[0] == 'lines':
+                        self._insert(db, [(run_id(op[1]), ts, text) for ts, text in op[2]])
+                    else:
+                        _, key, exit_code, ended = op
+                        db.execute('UPDATE runs SET ended = ?, exit_code = ? WHERE id = ?',
+                                   (ended, exit_code, run_id(key)))
+            ops.clear()
+
+        pending = 0  # Lines in `ops`
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                op = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                op = ('tick',)
+            kind = 'stop' if op is None else op[0]
+
+            if kind == 'start':
+                ops.append(op)
+            elif kind == 'append':
+                _, key, data, ts = op
+                if isinstance(data, bytes):
+                    if key not in decoders:
+                        decoders[key] = codecs.getincrementaldecoder('utf-8')('replace')
+                    data = decoders[key].decode(data)
+                pieces = (partial.pop(key, '') + data).split('\n')
+                if pieces[-1]:
+                    partial[key] = pieces[-1]  # Held until its newline arrives
+                lines = [(ts, text) for text in map(clean_line, pieces[:-1]) if text]
+                if lines:
+                    ops.append(('lines', key, lines))
+                    pending += len(lines)
+            elif kind in ('end', 'stop'):
+                # Unterminated output of a finished run (or of every run at exit)
+                for key in ([op[1]] if kind == 'end' else list(partial)):
+                    decoders.pop(key, None)
+                    tail = clean_line(partial.pop(key, ''))
+                    if tail:
+                        ops.append(('lines', key, [(time.time(), tail)]))
+                if kind == 'end':
+                    ops.append(op)
+
+            if ops and deadline is None:
+                deadline = time.monotonic() + self.flush_interval
+            due = deadline is not None and time.monotonic() >= deadline
+            if ops and (due or kind in ('flush', 'stop') or pending >= self.batch_lines):
+                commit()
+                pending = 0
+                deadline = None
+            if kind == 'flush':
+                op[1].set()
+            elif kind == 'stop':
+                break
+        db.close()
+
+    def _insert(self, db: sqlite3.Connection, rows: List):
+        for run, ts, text in rows:
+            cursor = db.execute('INSERT INTO lines (run, ts, text) VALUES (?, ?, ?)',
+                                (run, ts, text))
+            if self.fts:
+                db.execute('INSERT INTO lines_fts (rowid, text) VALUES (?, ?)',
+                           (cursor.lastrowid, text))
+
+    # === Reading (any thread, own connection) ===
+
+    def search(self, query: str, limit: int = 100, source: Optional[str] = None,
+               name: Optional[str] = None, since: Optional[float] = None) -> Dict:
+        """
+        Most recent matching lines first:
+        {'hits': [{'ts', 'text', 'source', 'name', 'run', 'started', 'exit_code'}],
+         'query', 'elapsed', 'truncated'}
+        """
+        start = time.perf_counter()
+        where, params = [], []
+        if self.fts:
+            match = fts_query(query)
+            if not match:
+                return {'hits': [], 'query': query, 'elapsed': 0.0, 'truncated': False}
+            sql = ('SELECT l.ts, l.text, r.source, r.name, r.id, r.started, r.exit_code '
+                   # CROSS JOIN keeps the index-driven order: the planner would
+                   # otherwise start from `runs` when filtering by name
+                   'FROM lines_fts f CROSS JOIN lines l ON l.id = f.rowid '
+                   'CROSS JOIN runs r ON r.id = l.run WHERE lines_fts MATCH ?')
+            params.append(match)
+            order = ' ORDER BY f.rowid DESC LIMIT ?'
+        else:
+            sql = ('SELECT l.ts, l.text, r.source, r.name, r.id, r.started, r.exit_code '
+                   'FROM lines l JOIN runs r ON r.id = l.run WHERE 1')
+            for word in query.split():
+                where.append("l.text LIKE ? ESCAPE '\\'")
+                params.append('%' + re.sub(r'([%_\\])', r'\\\1', word.strip('"*')) + '%')
+            order = ' ORDER BY l.id DESC LIMIT ?'
+        if source:
+            where.append('r.source = ?')
+            params.append(source)
+        if name:
+            where.append('r.name = ?')
+            params.append(name)
+        if since:
+            where.append('l.ts >= ?')
+            params.append(since)
+        sql += ''.join(f' AND {clause}' for clause in where) + order
+        params.append(limit + 1)
+
+        db = sqlite3.connect(str(self.path), timeout=10)
+        try:
+            rows = db.execute(sql, params).fetchall()
+        except sqlite3.OperationalError as e:
+            raise ValueError(f'bad search query: {e}')
+        finally:
+            db.close()
+        keys = ('ts', 'text', 'source', 'name', 'run', 'started', 'exit_code')
+        return {
+            'hits': [dict(zip(keys, row)) for row in rows[:limit]],
+            'query': query,
+            'elapsed': time.perf_counter() - start,
+            'truncated': len(rows) > limit,
+        }
+
+    def stats(self) -> Dict:
+        db = sqlite3.connect(str(self.path), timeout=10)
+        try:
+            runs, = db.execute('SELECT count(*) FROM runs').fetchone()
+            lines, first = db.execute('SELECT count(*), min(ts) FROM lines').fetchone()
+        finally:
+            db.close()
+        size = sum(p.stat().st_size for p in self.path.parent.glob(self.path.name + '*'))
+        return {'runs': runs, 'lines': lines, 'since': first, 'bytes': size, 'fts': self.fts}
+
+    def import_logs(self, log_dir: Optional[Path] = None) -> int:
+        """Backfill supervisor logs (`<name>-<YYYYmmdd-HHMMSS>.log`) not archived yet"""
+        log_dir = Path(log_dir) if log_dir else state_dir() / 'tasks'
+        db = sqlite3.connect(str(self.path), timeout=10)
+        try:
+            known = {key for key, in db.execute('SELECT key FROM runs')}
+        finally:
+            db.close()
+        # Oldest first: search returns the newest lines by rowid
+        logs = [(match.group('stamp'), path, match) for path, match in
+                ((path, LOG_NAME.match(path.name)) for path in log_dir.glob('*.log'))
+                if match and str(path) not in known]
+        imported = 0
+        for _, path, match in sorted(logs):
+            started = time.mktime(time.strptime(match.group('stamp'), '%Y%m%d-%H%M%S'))
+            ended = path.stat().st_mtime
+            key = str(path)
+            self.start_run(key, 'task', match.group('name'), started)
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    self._put(('append', key, chunk, started))
+                    tail = chunk[-200:]
+            trailer = LOG_TRAILER.search(tail) if path.stat().st_size else None
+            self._put(('end', key, int(trailer.group(1)) if trailer else None, ended))
+            imported += 1
+        self.flush(timeout=300)
+        return imported
+
+
+def format_hit(hit: Dict) -> str:
+    """One search hit as a LIVE OUTPUT / terminal line"""
+    stamp = datetime.fromtimestamp(hit['ts']).strftime('%Y-%m-%d %H:%M:%S')
+    exit_code = '' if hit['exit_code'] is None else f", exit {hit['exit_code']}"
+    return f"{stamp}  {hit['name']} ({hit['source']}{exit_code})  {hit['text']}"
+
+
+def format_results(result: Dict) -> str:
+    """Header line plus one line per hit"""
+    count = len(result['hits'])
+    more = '+' if result['truncated'] else ''
+    lines = [f"=== SEARCH \"{result['query']}\": {count}{more} matches "
+             f"in {result['elapsed'] * 1000:.1f} ms ==="]
+    lines.extend(format_hit(hit) for hit in result['hits'])
+    return '\n'.join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--db', type=Path, help=f'archive file (default: <state>/{ARCHIVE_FILE})')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    search = sub.add_parser('search', help='most recent matching lines first')
+    search.add_argument('query', nargs='+')
+    search.add_argument('-n', '--limit', type=int, default=50)
+    search.add_argument('--source', help='task or console')
+    search.add_argument('--name', help='task name')
+    search.add_argument('--json', action='store_true')
+
+    backfill = sub.add_parser('import', help='archive existing supervisor logs')
+    backfill.add_argument('log_dir', nargs='?', type=Path)
+
+    sub.add_parser('stats', help='size of the archive')
+
+    args = parser.parse_args(argv)
+    archive = OutputArchive(args.db)
+
+    if args.command == 'search':
+        try:
+            result = archive.search(' '.join(args.query), args.limit, args.source, args.name)
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            return 1
+        print(json.dumps(result, indent=2) if args.json else format_results(result))
+    elif args.command == 'import':
+        print(f"Imported {archive.import_logs(args.log_dir)} logs")
+        archive.close()
+    else:
+        stats = archive.stats()
+        since = datetime.fromtimestamp(stats['since']).strftime('%Y-%m-%d') if stats['since'] else '-'
+        print(f"{stats['runs']} runs, {stats['lines']} lines since {since}, "
+              f"{stats['bytes'] / 1e6:.1f} MB ({'FTS5' if stats['fts'] else 'LIKE scan'})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
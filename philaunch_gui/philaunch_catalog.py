@@ -0,0 +1,374 @@
+"""
+PhiLaunch Script Catalog
+mtime-keyed index of PhiLaunch scripts and their header metadata, kept current via inotify
+"""
+
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import stat
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+INDEX_VERSION = 2
+HEADER_BYTES = 4096           # Metadata lives in the leading comment block
+LOCAL_TAG = '@SCRIPT_LAUNCHER_LOCAL'
+
+# Header keys the scripts already carry -> index field
+HEADER_KEYS = {
+    'purpose': 'purpose',
+    'dependencies': 'dependencies',
+    'sudo': 'sudo',
+    'usage': 'usage',
+    'priority': 'priority',       # Run queue class: high | normal | low
+    'exclusive': 'exclusive',     # Mutual-exclusion key for the run queue
+}
+
+# inotify(7)
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+
+WATCH_MASK = (IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE
+              | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+_EVENT = struct.Struct('iIII')  # wd, mask, cookie, len
+
+
+def parse_script_header(path: Path) -> Dict:
+    """
+    Read the leading comment block of a script.
+
+    Recognises the `@SCRIPT_LAUNCHER_LOCAL` tag and `Purpose:` /
+    `Dependencies:` / `Sudo:` / `Usage:` / `Priority:` / `Exclusive:` lines;
+    the first other comment line becomes the description.
+    """
+    meta = {'local': False, 'description': '', 'purpose': '', 'dependencies': [],
+            'sudo': '', 'usage': '', 'priority': '', 'exclusive': ''}
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(HEADER_BYTES).decode('utf-8', 'replace')
+    except OSError:
+        return meta
+
+    for line in head.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#!'):
+            continue
+        if not stripped.startswith('#'):
+            break  # End of the header block
+        text = stripped.lstrip('#').strip()
+
+        if LOCAL_TAG in text:
+            meta['local'] = True
+            continue
+
+        key, sep, value = text.partition(':')
+        field = HEADER_KEYS.get(key.strip().lower()) if sep else None
+        if field == 'dependencies':
+            meta[field] = [dep.strip() for dep in value.split(',') if dep.strip()]
+        elif field:
+            meta[field] = value.strip()
+        elif text and not meta['description'] and not set(text) <= set('=-#*'):
+            meta['description'] = text
+
+    return meta
+
+
+class _Inotify:
+    """Minimal ctypes binding for inotify (Linux only)"""
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._add = libc.inotify_add_watch
+        self._add.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+
+    def add_watch(self, path: Path, mask: int) -> int:
+        wd = self._add(self.fd, os.fsencode(str(path)), mask)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f'inotify_add_watch failed: {path}')
+        return wd
+
+    def read_events(self) -> List[Tuple[int, int, str]]:
+        """Drain pending events as (wd, mask, name)"""
+        events = []
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except BlockingIOError:
+                return events
+            offset = 0
+            while offset + _EVENT.size <= len(data):
+                wd, mask, _cookie, length = _EVENT.unpack_from(data, offset)
+                offset += _EVENT.size
+                name = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+                events.append((wd, mask, os.fsdecode(name)))
+
+    def close(self):
+        os.close(self.fd)
+
+
+class ScriptCatalog:
+    """
+    Index of the scripts under a few section roots (non-recursive).
+
+    The first scan() reuses the on-disk index for every file whose mtime and
+    size are unchanged, so only new or edited scripts are read. After
+    start(), inotify events update single entries (debounced) and
+    `on_change(sections)` is called on the watcher thread; without inotify
+    the roots are re-stat'ed every `rescan_interval` seconds instead.
+    """
+
+    def __init__(self, roots: Iterable[Tuple[str, Path]],
+                 index_path: Optional[Path] = None,
+                 on_change: Optional[Callable[[List], None]] = None,
+                 suffixes: Tuple[str, ...] = ('.sh',),
+                 debounce: float = 0.1,
+                 rescan_interval: float = 5.0):
+        self.roots = [(section, Path(root)) for section, root in roots]
+        self.index_path = Path(index_path) if index_path else None
+        self.on_change = on_change
+        self.suffixes = suffixes
+        self.debounce = debounce
+        self.rescan_interval = rescan_interval
+
+        self.entries: Dict[str, Dict] = {}   # path -> entry
+        self.mode = None                     # 'inotify' | 'polling' once started
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._cache: Dict[str, Dict] = {}
+        self._thread = None
+        self._stop = threading.Event()
+        self._wake_r, self._wake_w = os.pipe()
+
+    # === Public API ===
+
+    def scan(self) -> bool:
+        """Re-stat every root; parse only new or modified scripts. True if changed"""
+        if not self._loaded:
+            self._cache = self._load_index()
+            self._loaded = True
+
+        found = {}
+        for position, (section, root) in enumerate(self.roots):
+            try:
+                with os.scandir(root) as it:
+                    for dirent in it:
+                        path = os.path.join(str(root), dirent.name)
+                        if path in found or not self._wanted(dirent.name):
+                            continue
+                        entry = self._entry(position, path, dirent)
+                        if entry is not None:
+                            found[path] = entry
+            except OSError:
+                continue  # Missing root: section stays empty
+
+        with self._lock:
+            changed = found != self.entries
+            self.entries = found
+        if changed:
+            self._save_index()
+        return changed
+
+    def sections(self) -> List[Tuple[str, List[Dict]]]:
+        """[(section, [entry, ...])] in root order, entries sorted by name"""
+        with self._lock:
+            grouped = [(section, []) for section, _ in self.roots]
+            for entry in self.entries.values():
+                grouped[entry['root']][1].append(entry)
+        for _, entries in grouped:
+            entries.sort(key=lambda entry: entry['name'].lower())
+        return grouped
+
+    def get(self, path: str) -> Optional[Dict]:
+        with self._lock:
+            return self.entries.get(path)
+
+    def start(self) -> str:
+        """Begin watching the roots; returns the mode in use"""
+        if self._thread is not None:
+            return self.mode
+        try:
+            inotify = _Inotify()
+        except (OSError, AttributeError):
+            inotify = None
+
+        self.mode = 'inotify' if inotify is not None else 'polling'
+        self._thread = threading.Thread(target=self._watch, args=(inotify,), daemon=True)
+        self._thread.start()
+        return self.mode
+
+    def stop(self):
+        self._stop.set()
+        try:
+            os.write(self._wake_w, b'x')
+        except OSError:
+            pass
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    # === Index ===
+
+    def _wanted(self, name: str) -> bool:
+        return not name.startswith('.') and name.endswith(self.suffixes)
+
+    def _entry(self, position: int, path: str, dirent=None) -> Optional[Dict]:
+        try:
+            st = dirent.stat() if dirent is not None else os.stat(path)
+        except OSError:
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+
+        cached = self._cache.get(path)
+        if cached and cached['mtime_ns'] == st.st_mtime_ns and cached['size'] == st.st_size:
+            entry = dict(cached)
+        else:
+            entry = {'path': path, 'name': os.path.basename(path),
+                     'mtime_ns': st.st_mtime_ns, 'size': st.st_size,
+                     **parse_script_header(Path(path))}
+            self._cache[path] = entry
+        entry['root'] = position
+        entry['section'] = self.roots[position][0]
+        return entry
+
+    def _load_index(self) -> Dict[str, Dict]:
+        if self.index_path is None:
+            return {}
+        try:
+            data = json.loads(self.index_path.read_text())
+        except (OSError, ValueError):
+            return {}
+        if data.get('version') != INDEX_VERSION:
+            return {}
+        return data.get('entries', {})
+
+    def _save_index(self):
+        if self.index_path is None:
+            return
+        with self._lock:
+            entries = {path: {k: v for k, v in entry.items() if k not in ('root', 'section')}
+                       for path, entry in self.entries.items()}
+        tmp = Path(str(self.index_path) + '.tmp')
+        try:
+            tmp.write_text(json.dumps({'version': INDEX_VERSION, 'entries': entries}))
+            os.replace(tmp, self.index_path)
+        except OSError:
+            pass  # The index is only a cache
+
+    def _update(self, paths: Iterable[Tuple[int, str]]) -> bool:
+        """Refresh individual entries after inotify events"""
+        changed = False
+        for position, path in paths:
+            entry = self._entry(position, path)
+            with self._lock:
+                current = self.entries.get(path)
+                if current is not None and current['root'] < position:
+                    continue  # Owned by an earlier section
+                if entry is None:
+                    changed |= self.entries.pop(path, None) is not None
+                    self._cache.pop(path, None)
+                elif entry != current:
+                    self.entries[path] = entry
+                    changed = True
+        if changed:
+            self._save_index()
+        return changed
+
+    # === Watcher ===
+
+    def _watch(self, inotify: Optional[_Inotify]):
+        try:
+            if inotify is None:
+                self._poll()
+            else:
+                self._follow(inotify)
+        finally:
+            if inotify is not None:
+                inotify.close()
+
+    def _notify(self):
+        if self.on_change:
+            self.on_change(self.sections())
+
+    def _poll(self):
+        while not self._stop.wait(self.rescan_interval):
+            if self.scan():
+                self._notify()
+
+    def _add_watches(self, inotify: _Inotify) -> Dict[int, int]:
+        watches = {}
+        for position, (_, root) in enumerate(self.roots):
+            try:
+                # Same directory twice returns the same wd: first section wins
+                watches.setdefault(inotify.add_watch(root, WATCH_MASK), position)
+            except OSError:
+                pass  # Missing root; picked up on the next full rescan
+        return watches
+
+    def _follow(self, inotify: _Inotify):
+        watches = self._add_watches(inotify)
+        # Catch anything that changed between the initial scan and the watch
+        if self.scan():
+            self._notify()
+
+        dirty = set()
+        full_rescan = False
+        deadline = None
+        while not self._stop.is_set():
+            missing = len(set(watches.values())) < len(self.roots)
+            if deadline is not None:
+                timeout = max(0.0, deadline - time.monotonic())
+            else:
+                timeout = self.rescan_interval if missing else None  # Retry missing roots
+            readable, _, _ = select.select([inotify.fd, self._wake_r], [], [], timeout)
+            if self._wake_r in readable:
+                os.read(self._wake_r, 64)
+                continue
+
+            for wd, mask, name in inotify.read_events() if inotify.fd in readable else []:
+                if mask & (IN_Q_OVERFLOW | IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED):
+                    full_rescan = True
+                elif wd in watches and self._wanted(name):
+                    root = self.roots[watches[wd]][1]
+                    dirty.add((watches[wd], os.path.join(str(root), name)))
+                if deadline is None:
+                    deadline = time.monotonic() + self.debounce
+
+            if not readable and deadline is None and missing:
+                retried = self._add_watches(inotify)
+                if len(set(retried.values())) > len(set(watches.values())):
+                    full_rescan = True
+                    deadline = time.monotonic()
+
+            if deadline is not None and time.monotonic() >= deadline:
+                deadline = None
+                if full_rescan:
+                    full_rescan = False
+                    dirty.clear()
+                    watches = self._add_watches(inotify)
+                    changed = self.scan()
+                else:
+                    changed = self._update(sorted(dirty))
+                    dirty.clear()
+                if changed:
+                    self._notify()
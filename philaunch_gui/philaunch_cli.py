@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+PhiLaunch CLI
+The Control Center's actions without a display (phone SSH sessions, dashboard, cron)
+
+Usage:
+    philaunch_cli.py scripts [--json]
+    philaunch_cli.py tasks [--all] [--json | --dashboard]
+    philaunch_cli.py run SCRIPT [--no-tmux]
+    philaunch_cli.py stop NAME|#ID
+    philaunch_cli.py status [--json] [--report]
+    philaunch_cli.py logs [-n LINES] [-u UNIT] [-p PRIORITY] [--json]
+    philaunch_cli.py search QUERY... [-n LIMIT] [--source SRC] [--name TASK] [--json]
+    philaunch_cli.py pack-logs [--older-than HOURS]
+    philaunch_cli.py remote ...          (see philaunch_remote.py)
+"""
+
+import argparse
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+try:
+    from philaunch_engine import PhiLaunchEngine, dashboard_tasks, to_json
+except ImportError:
+    # Fallback if running from different directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from philaunch_engine import PhiLaunchEngine, dashboard_tasks, to_json
+
+
+def cmd_scripts(engine: PhiLaunchEngine, args) -> int:
+    sections = engine.scripts()
+    if args.json:
+        print(to_json({section.strip('▼ ').lower(): entries for section, entries in sections}))
+        return 0
+    for section, entries in sections:
+        if not entries:
+            continue
+        print(section.strip('▼ '))
+        for entry in entries:
+            note = entry.get('description') or entry.get('purpose') or ''
+            print(f"  {entry['name']:<32} {note[:60]}")
+    return 0
+
+
+def cmd_tasks(engine: PhiLaunchEngine, args) -> int:
+    if args.dashboard:
+        print(to_json(dashboard_tasks(engine)))
+        return 0
+    sessions = engine.sessions()
+    supervised = engine.tasks(include_finished=args.all)
+    if args.json:
+        print(to_json({'sessions': sessions, 'supervised': supervised}))
+        return 0
+
+    names = {task['name'] for task in supervised}
+    print("=== Tasks ===")
+    for task in supervised:
+        if task['state'] == 'pending':
+            detail = f"queued {task['wait']:.0f}s, {task['priority']}"
+        elif task['exit_code'] is not None:
+            detail = f"exit {task['exit_code']} after {task['duration']:.1f}s"
+        else:
+            detail = f"{task['duration']:.0f}s"
+        print(f"  {task['name']:<24} {task['state']:<9} {detail}")
+    for session in sessions:
+        if session['name'] not in names:
+            started = datetime.fromtimestamp(session['created']).strftime('%H:%M:%S')
+            print(f"  {session['name']:<24} {'tmux':<9} since {started}, "
+                  f"{session['windows']} windows")
+    if not supervised and not sessions:
+        print("  No active tasks")
+    return 0
+
+
+def cmd_run(engine: PhiLaunchEngine, args) -> int:
+    from philaunch_supervisor import SupervisorError
+    try:
+        task = engine.launch_script(args.script, tmux=not args.no_tmux)
+    except SupervisorError as e:
+        print(f"✗ {e}", file=sys.stderr)
+        return 1
+    if task['state'] == 'pending':
+        print(f"⏸ {task['name']} queued (#{task['id']}, {task['priority']} priority)")
+    elif task['state'] == 'running':
+        print(f"✓ {task['name']} started (pid {task['pid']})")
+        print(f"  Log: {task['log']}")
+    else:
+        print(f"✗ {task['name']} {task['state']}: {task.get('error') or ''}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def cmd_stop(engine: PhiLaunchEngine, args) -> int:
+    from philaunch_supervisor import SupervisorError
+    try:
+        record = engine.stop_task(args.name)
+    except SupervisorError as e:
+        print(f"✗ {e}", file=sys.stderr)
+        return 1
+    print(f"✓ {record['name']} {record['state'] if record['state'] != 'running' else 'stopping'}")
+    return 0
+
+
+def cmd_status(engine: PhiLaunchEngine, args) -> int:
+    if args.report:
+        print(engine.status_report(), end='')
+        return 0
+    status = engine.system_status(cpu_window=0.2)
+    tasks = len(engine.sessions())
+    if args.json:
+        print(to_json({**status, 'tasks': tasks}))
+        return 0
+    cpu = '??' if status['cpu'] is None else f"{status['cpu']:.1f}"
+    ram = '??' if status['ram'] is None else f"{status['ram']:.0f}"
+    print(f"CPU {cpu}%  RAM {ram}%  SSH {'✓' if status['ssh'] else '✗'}  TASKS {tasks}")
+    return 0
+
+
+def cmd_logs(engine: PhiLaunchEngine, args) -> int:
+    from philaunch_journal import format_entry
+    entries = engine.recent_logs(args.lines, args.unit, args.priority)
+    if args.json:
+        print(to_json(entries))
+    else:
+        for entry in entries:
+            print(format_entry(entry))
+    return 0
+
+
+def cmd_search(engine: PhiLaunchEngine, args) -> int:
+    from philaunch_archive import format_results
+    try:
+        result = engine.search_output(' '.join(args.query), args.limit, args.source, args.name)
+    except ValueError as e:
+        print(f"✗ {e}", file=sys.stderr)
+        return 1
+    print(to_json(result) if args.json else format_results(result))
+    return 0
+
+
+def cmd_pack_logs(engine: PhiLaunchEngine, args) -> int:
+    from philaunch_logpack import format_pack_results
+    results = engine.pack_logs(args.older_than * 3600)
+    print(format_pack_results(results))
+    return 1 if any('error' in result for result in results) else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ['remote']:
+        # Pooled SSH / fan-out have their own CLI
+        from philaunch_remote import main as remote_main
+        return remote_main(argv[1:])
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    scripts = sub.add_parser('scripts', help='list scripts from the catalog')
+    scripts.add_argument('--json', action='store_true')
+
+    tasks = sub.add_parser('tasks', help='supervised tasks and tmux sessions')
+    tasks.add_argument('--all', action='store_true', help='include finished tasks')
+    tasks.add_argument('--json', action='store_true')
+    tasks.add_argument('--dashboard', action='store_true', help="the dashboard's tasks.json")
+
+    run = sub.add_parser('run', help='launch a script under the supervisor')
+    run.add_argument('script', help='path, file name or name without .sh')
+    run.add_argument('--no-tmux', action='store_true', help='skip the tmux viewer session')
+
+    stop = sub.add_parser('stop', help='stop a task or cancel a queued one')
+    stop.add_argument('name')
+
+    status = sub.add_parser('status', help='CPU, RAM, SSH and task count')
+    status.add_argument('--json', action='store_true')
+    status.add_argument('--report', action='store_true', help='full home-control.sh status')
+
+    logs = sub.add_parser('logs', help='recent journal entries')
+    logs.add_argument('-n', '--lines', type=int, default=20)
+    logs.add_argument('-u', '--unit', action='append', default=[])
+    logs.add_argument('-p', '--priority')
+    logs.add_argument('--json', action='store_true')
+
+    search = sub.add_parser('search', help='archived task and console output')
+    search.add_argument('query', nargs='+')
+    search.add_argument('-n', '--limit', type=int, default=50)
+    search.add_argument('--source', choices=['task', 'console'])
+    search.add_argument('--name', help='task name')
+    search.add_argument('--json', action='store_true')
+
+    pack = sub.add_parser('pack-logs', help='compress idle monitor and task logs')
+    pack.add_argument('--older-than', type=float, default=24.0, metavar='HOURS')
+
+    sub.add_parser('remote', help='pooled SSH commands and fan-out (philaunch_remote.py)')
+
+    args = parser.parse_args(argv)
+    engine = PhiLaunchEngine()
+    try:
+        return globals()[f"cmd_{args.command.replace('-', '_')}"](engine, args)
+    except BrokenPipeError:
+        return 0
+    finally:
+        engine.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
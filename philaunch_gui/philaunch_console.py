@@ -0,0 +1,176 @@
+"""
+PhiLaunch Output Console
+Bounded, batched LIVE OUTPUT view with a disk-backed scrollback
+"""
+
+import tempfile
+from array import array
+from typing import List, Optional
+
+from PyQt6.QtCore import QTimer, pyqtSignal
+from PyQt6.QtGui import QTextCursor
+from PyQt6.QtWidgets import QPlainTextEdit
+
+
+class ScrollbackSpool:
+    """
+    Append-only on-disk line store.
+
+    Lines that roll out of the console are written here, and a compact offset
+    index makes any range readable without scanning the file.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        if path is None:
+            self._file = tempfile.TemporaryFile(prefix='philaunch-scrollback-')
+        else:
+            self._file = open(path, 'w+b')
+        self._offsets = array('Q')
+        self._end = 0
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def append(self, lines: List[str]):
+        """Spill lines to disk"""
+        if not lines:
+            return
+        chunks = []
+        for line in lines:
+            data = line.encode('utf-8', 'replace') + b'\n'
+            self._offsets.append(self._end)
+            self._end += len(data)
+            chunks.append(data)
+        self._file.seek(0, 2)
+        self._file.write(b''.join(chunks))
+
+    def read(self, start: int, stop: int) -> List[str]:
+        """Read lines [start, stop) back from disk"""
+        start = max(0, start)
+        stop = min(stop, len(self._offsets))
+        if start >= stop:
+            return []
+        end = self._offsets[stop] if stop < len(self._offsets) else self._end
+        self._file.flush()
+        self._file.seek(self._offsets[start])
+        data = self._file.read(end - self._offsets[start])
+        return data.decode('utf-8', 'replace').split('\n')[:stop - start]
+
+    def close(self):
+        self._file.close()
+
+
+class OutputConsole(QPlainTextEdit):
+    """
+    LIVE OUTPUT pane.
+
+    append_text() only queues; queued chunks are flushed into the document once
+    per frame. The document is capped at `line_cap` blocks - older lines are
+    spilled to a ScrollbackSpool and paged back in when the user scrolls to
+    the top.
+    """
+
+    flushed = pyqtSignal(str)  # last line of the batch (for the status bar)
+
+    def __init__(self, line_cap: int = 5000, flush_interval_ms: int = 16,
+                 history_page: int = 500, parent=None):
+        super().__init__(parent)
+        self.setReadOnly(True)
+        self.setUndoRedoEnabled(False)
+
+        self.line_cap = max(100, line_cap)
+        self.history_page = history_page
+        self.spool = ScrollbackSpool()
+
+        self._pending = []
+        self._spool_cursor = 0   # spool index of the first line in the document
+        self._extra = 0          # history lines paged in above the cap
+        self._loading_history = False
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(flush_interval_ms)
+        self._flush_timer.timeout.connect(self._flush)
+
+        self.verticalScrollBar().valueChanged.connect(self._on_scroll)
+
+    # === Public API ===
+
+    def append_text(self, text: str):
+        """Queue text for the next frame (cheap, call as often as needed)"""
+        self._pending.append(text[:-1] if text.endswith('\n') else text)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    # === Batching ===
+
+    def _flush(self):
+        if not self._pending:
+            return
+        text = '\n'.join(self._pending)
+        self._pending = []
+
+        bar = self.verticalScrollBar()
+        following = bar.value() >= bar.maximum() - 1
+
+        self.appendPlainText(text)
+
+        if following:
+            self._extra = 0
+        self._trim(self.line_cap + self._extra)
+
+        if following:
+            bar.setValue(bar.maximum())
+
+        last_line = text.strip().split('\n')[-1] if text.strip() else ''
+        self.flushed.emit(last_line)
+
+    def _trim(self, limit: int):
+        doc = self.document()
+        overflow = doc.blockCount() - limit
+        if overflow <= 0:
+            return
+
+        # Lines already backed by the spool just move the cursor forward;
+        # anything newer has to be spilled first.
+        spooled = min(overflow, len(self.spool) - self._spool_cursor)
+        spill = []
+        block = doc.findBlockByNumber(spooled)
+        for _ in range(overflow - spooled):
+            spill.append(block.text())
+            block = block.next()
+
+        cursor = QTextCursor(doc)
+        cursor.movePosition(QTextCursor.MoveOperation.Start)
+        cursor.movePosition(QTextCursor.MoveOperation.NextBlock,
+                            QTextCursor.MoveMode.KeepAnchor, overflow)
+        cursor.removeSelectedText()
+
+        self.spool.append(spill)
+        self._spool_cursor = self._spool_cursor + spooled if not spill else len(self.spool)
+
+    # === Lazy scrollback ===
+
+    def _on_scroll(self, value: int):
+        bar = self.verticalScrollBar()
+        if value >= bar.maximum() - 1:
+            self._extra = 0
+            return
+        if value != bar.minimum() or self._spool_cursor == 0 or self._loading_history:
+            return
+        if self._extra >= self.line_cap:
+            return  # Enough history on screen; keep memory bounded
+
+        start = max(0, self._spool_cursor - self.history_page)
+        lines = self.spool.read(start, self._spool_cursor)
+        if not lines:
+            return
+
+        self._loading_history = True
+        cursor = QTextCursor(self.document())
+        cursor.movePosition(QTextCursor.MoveOperation.Start)
+        cursor.insertText('\n'.join(lines) + '\n')
+        self._spool_cursor = start
+        self._extra += len(lines)
+        bar.setValue(bar.minimum() + len(lines))
+        self._loading_history = False
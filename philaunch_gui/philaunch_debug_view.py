@@ -0,0 +1,135 @@
+"""
+PhiLaunch Debug View
+Latency window: p50/p95/max per instrumented operation and the recent slow operations
+"""
+
+import time
+from typing import Callable, Dict, Optional
+
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QFont
+from PyQt6.QtWidgets import (
+    QHBoxLayout, QHeaderView, QLabel, QPlainTextEdit, QPushButton, QTableWidget,
+    QTableWidgetItem, QVBoxLayout, QWidget
+)
+
+from philaunch_instrument import Instruments
+from philaunch_paths import state_dir
+from philaunch_theme import tag
+
+
+COLUMNS = ('operation', 'count', 'p50 ms', 'p95 ms', 'max ms', 'total s')
+
+
+class _NumberItem(QTableWidgetItem):
+    """Cell that sorts by value instead of by text"""
+
+    def __init__(self, value: float, text: str):
+        super().__init__(text)
+        self.value = value
+        self.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+
+    def __lt__(self, other):
+        return self.value < getattr(other, 'value', 0)
+
+
+class DebugPanel(QWidget):
+    """
+    Window opened by the toolbar's Perf button.
+
+    The table is refreshed once a second while the window is visible; the
+    timer stops when it is hidden, so the panel costs nothing when closed.
+    `extra` (e.g. executor stats) is added to JSON exports.
+    """
+
+    def __init__(self, instruments: Instruments, extra: Optional[Callable[[], Dict]] = None,
+                 parent=None):
+        super().__init__(parent)
+        self.instruments = instruments
+        self.extra = extra
+        self.setWindowTitle("PhiLaunch Latency")
+        self.resize(900, 600)
+        tag(self, surface="panel")
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(10, 10, 10, 10)
+
+        bar = QHBoxLayout()
+        header = tag(QLabel("⏱ LATENCY"), "header")
+        header.setFont(QFont("Monospace", 11, QFont.Weight.Bold))
+        bar.addWidget(header)
+        self.summary_label = tag(QLabel(""), "indicatorName")
+        bar.addWidget(self.summary_label, 1)
+        for text, tone, callback in [("EXPORT JSON", "info", self.export),
+                                     ("RESET", "warning", self.reset)]:
+            button = tag(QPushButton(text), "quickAction", tone=tone)
+            button.clicked.connect(callback)
+            bar.addWidget(button)
+        layout.addLayout(bar)
+
+        self.table = QTableWidget(0, len(COLUMNS))
+        self.table.setHorizontalHeaderLabels(COLUMNS)
+        self.table.setFont(QFont("Monospace", 9))
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.table.setSortingEnabled(True)
+        self.table.sortByColumn(5, Qt.SortOrder.DescendingOrder)
+        layout.addWidget(self.table, 3)
+
+        slow_header = tag(QLabel(f"SLOW (≥ {instruments.slow_seconds * 1000:.0f} ms)"),
+                          "indicatorName")
+        layout.addWidget(slow_header)
+        self.slow_text = QPlainTextEdit()
+        self.slow_text.setReadOnly(True)
+        self.slow_text.setFont(QFont("Monospace", 9))
+        self.slow_text.setMaximumBlockCount(200)
+        layout.addWidget(self.slow_text, 1)
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        self.refresh()
+        self.timer.start(1000)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
+
+    # === Actions ===
+
+    def refresh(self):
+        """Rebuild the table from a snapshot (sorting is paused while filling)"""
+        operations = self.instruments.snapshot()
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(len(operations))
+        for row, (name, stats) in enumerate(operations.items()):
+            self.table.setItem(row, 0, QTableWidgetItem(name))
+            self.table.setItem(row, 1, _NumberItem(stats['count'], str(stats['count'])))
+            for column, key in enumerate(('p50_ms', 'p95_ms', 'max_ms'), start=2):
+                self.table.setItem(row, column, _NumberItem(stats[key], f"{stats[key]:.2f}"))
+            total = stats['total_ms'] / 1000
+            self.table.setItem(row, 5, _NumberItem(total, f"{total:.2f}"))
+        self.table.setSortingEnabled(True)
+
+        calls = sum(stats['count'] for stats in operations.values())
+        elapsed = time.time() - self.instruments.started
+        self.summary_label.setText(f"{len(operations)} operations · {calls} calls · "
+                                   f"{elapsed:.0f}s")
+        self.slow_text.setPlainText('\n'.join(
+            f"{time.strftime('%H:%M:%S', time.localtime(entry['at']))}  {entry['ms']:9.1f} ms  "
+            f"{entry['op']}" for entry in reversed(self.instruments.recent_slow())))
+
+    def export(self):
+        path = state_dir() / f"instruments-{time.strftime('%Y%m%d-%H%M%S')}.json"
+        try:
+            self.instruments.export(path, extra=self.extra() if self.extra else None)
+            self.summary_label.setText(f"✓ Exported {path}")
+        except OSError as e:
+            self.summary_label.setText(f"⚠ Export failed: {e}")
+
+    def reset(self):
+        self.instruments.reset()
+        self.refresh()
@@ -0,0 +1,309 @@
+"""
+PhiLaunch Engine
+Control Center logic without Qt: scripts, tasks, status, logs and remote hosts
+
+The GUI, philaunch_cli.py and the dashboard all drive the same engine.
+Components are created on first use, so a CLI command only pays for the
+modules it actually needs (listing scripts never imports the supervisor).
+"""
+
+import json
+import os
+import subprocess
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from philaunch_paths import automation_dir, log_dir, philaunch_home, remote_scripts_dir, state_dir
+from philaunch_sessions import SESSION_FORMAT, WATCH_SESSION, parse_session_line
+
+
+SCRIPT_SECTIONS = ("▼ AUTOMATION SCRIPTS", "▼ REMOTE SCRIPTS", "▼ PHILAUNCH SCRIPTS")
+
+
+class PhiLaunchEngine:
+    """
+    Everything the Control Center does, as plain method calls.
+
+    Methods block (subprocesses, sockets) and are safe to call from worker
+    threads; callbacks passed in (`on_scripts_changed`, `on_line`) run on
+    whichever thread produced the data.
+    """
+
+    def __init__(self, on_scripts_changed: Optional[Callable[[List], None]] = None):
+        self.philaunch_home = philaunch_home()
+        self.automation_dir = automation_dir()
+        self.on_scripts_changed = on_scripts_changed
+
+        self._catalog = None
+        self._sampler = None
+        self._supervisor = None
+        self._remote = None
+        self._archive = None
+        self._console_key = None  # Archive run for this process's console output
+        self._usage = None
+        self._usage_key = None  # Session names the usage roots were resolved for
+
+    # === Components (created on first use) ===
+
+    @property
+    def catalog(self):
+        if self._catalog is None:
+            from philaunch_catalog import ScriptCatalog
+            roots = (self.automation_dir, remote_scripts_dir(), self.philaunch_home)
+            self._catalog = ScriptCatalog(
+                zip(SCRIPT_SECTIONS, roots),
+                index_path=state_dir() / 'script_index.json',
+                on_change=self.on_scripts_changed,
+            )
+        return self._catalog
+
+    @property
+    def sampler(self):
+        if self._sampler is None:
+            from philaunch_metrics import SystemSampler
+            port = os.environ.get('PHILAUNCH_SSH_PORT', '')
+            self._sampler = SystemSampler(ssh_port=int(port) if port.isdigit() else None)
+        return self._sampler
+
+    @property
+    def supervisor(self):
+        if self._supervisor is None:
+            from philaunch_supervisor import SupervisorClient
+            self._supervisor = SupervisorClient()
+        return self._supervisor
+
+    @property
+    def remote(self):
+        if self._remote is None:
+            from philaunch_remote import SSHPool
+            self._remote = SSHPool()
+        return self._remote
+
+    @property
+    def archive(self):
+        if self._archive is None:
+            from philaunch_archive import OutputArchive
+            self._archive = OutputArchive()
+        return self._archive
+
+    # === Scripts ===
+
+    def scripts(self) -> List:
+        """[(section, [entry, ...])] after re-stat'ing the script roots"""
+        self.catalog.scan()
+        return self.catalog.sections()
+
+    def watch_scripts(self) -> str:
+        """Keep the catalog current (inotify or polling); changes go to on_scripts_changed"""
+        return self.catalog.start()
+
+    def resolve_script(self, script: str) -> Optional[Dict]:
+        """Catalog entry for a path, file name or stem (first section wins)"""
+        path = Path(script).expanduser()
+        if path.is_file():
+            self.catalog.scan()
+            return self.catalog.get(str(path.resolve())) or self.catalog.get(str(path)) or {
+                'path': str(path.resolve()), 'name': path.name, 'priority': '', 'exclusive': ''}
+        for _, entries in self.scripts():
+            for entry in entries:
+                if script in (entry['name'], Path(entry['name']).stem):
+                    return entry
+        return None
+
+    def launch_script(self, script: str, tmux: bool = True) -> Dict:
+        """Queue a script with the supervisor (catalog Priority/Exclusive apply)"""
+        from philaunch_supervisor import SupervisorError
+        entry = self.resolve_script(script)
+        if entry is None:
+            raise SupervisorError(f'no such script: {script}')
+        path = Path(entry['path'])
+        return self.supervisor.start(
+            ['bash', str(path)], name=path.stem, cwd=str(path.parent), tmux=tmux,
+            priority=(entry.get('priority') or 'normal').lower(),
+            exclusive=entry.get('exclusive') or None)
+
+    # === Tasks ===
+
+    def sessions(self) -> List[Dict]:
+        """tmux sessions (the control-mode watch session excluded)"""
+        try:
+            result = subprocess.run(['tmux', 'list-sessions', '-F', SESSION_FORMAT],
+                                    capture_output=True, text=True, timeout=5)
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            return []
+        if result.returncode != 0:
+            return []
+        sessions = [parse_session_line(line) for line in result.stdout.splitlines()]
+        return [session for session in sessions if session and session['name'] != WATCH_SESSION]
+
+    def tasks(self, include_finished: bool = False) -> List[Dict]:
+        """Supervised tasks, running and queued first (falls back to the state file)"""
+        from philaunch_supervisor import SupervisorError
+        try:
+            return self.supervisor.list_tasks(include_finished=include_finished)
+        except SupervisorError:
+            return []
+
+    def queued(self) -> List[Dict]:
+        """Supervised tasks still waiting for a run slot, in run order"""
+        return [task for task in self.tasks() if task['state'] == 'pending']
+
+    def stop_task(self, name: str) -> Dict:
+        """
+        Stop a supervised task (or cancel a queued one, by name or #id) and
+        kill a tmux session of the same name. Returns the supervisor record,
+        or {'name', 'state': 'killed'} for a plain tmux session; raises
+        SupervisorError if neither exists.
+        """
+        from philaunch_supervisor import SupervisorError
+        try:
+            record = self.supervisor.stop(name)
+        except SupervisorError as e:
+            record, reason = None, e  # Not supervised (or no daemon): a plain tmux session
+        if record is not None and record['state'] in ('pending', 'cancelled'):
+            return record
+        killed = False
+        if not name.startswith('#'):
+            try:
+                killed = subprocess.run(['tmux', 'kill-session', '-t', name],
+                                        capture_output=True, timeout=5).returncode == 0
+            except (OSError, subprocess.TimeoutExpired):
+                pass
+        if record is None and not killed:
+            raise SupervisorError(str(reason))
+        return record or {'name': name, 'state': 'killed'}
+
+    def task_usage(self, names: Iterable[str]) -> Dict[str, Dict]:
+        """Live CPU/RSS per task name (see philaunch_task_usage)"""
+        from philaunch_task_usage import TaskUsageCollector, tmux_pane_pids
+        names = frozenset(names)
+        if self._usage is None:
+            self._usage = TaskUsageCollector()
+        if names != self._usage_key:
+            # Pane pids only change with the session list; supervised tasks
+            # are measured from their own pid rather than the tmux viewer
+            roots = tmux_pane_pids()
+            for task in self.tasks():
+                if task['state'] == 'running' and task.get('pid'):
+                    roots[task['name']] = [task['pid']]
+            self._usage.set_roots({name: pids for name, pids in roots.items() if name in names})
+            self._usage_key = names
+        return self._usage.sample()
+
+    # === Status ===
+
+    def system_status(self, cpu_window: float = 0.0) -> Dict:
+        """
+        CPU, RAM and SSH liveness ({'cpu', 'ram', 'ssh', 'timestamp'}).
+        CPU is a delta between samples: one-shot callers pass `cpu_window`
+        to wait that long after the sampler is first created.
+        """
+        fresh = self._sampler is None
+        sampler = self.sampler
+        if fresh and cpu_window:
+            time.sleep(cpu_window)
+        return sampler.sample()
+
+    def status_report(self, timeout: float = 30) -> str:
+        """`home-control.sh status` output"""
+        control_script = self.automation_dir / 'home-control.sh'
+        if not control_script.exists():
+            return '✗ home-control.sh not found'
+        result = subprocess.run(['bash', str(control_script), 'status'],
+                                capture_output=True, text=True, timeout=timeout)
+        return result.stdout
+
+    # === Logs ===
+
+    def recent_logs(self, lines: int = 20, units: Iterable[str] = (),
+                    priority: Optional[str] = None) -> List[Dict]:
+        """Last journal entries, filtered by journalctl (see philaunch_journal)"""
+        from philaunch_journal import default_journalctl, journal_command, parse_record
+        command = journal_command(default_journalctl(), units=units, priority=priority,
+                                  lines=lines, follow=False)
+        try:
+            result = subprocess.run(command, capture_output=True, timeout=15)
+        except (OSError, subprocess.TimeoutExpired):
+            return []
+        entries = (parse_record(line) for line in result.stdout.splitlines() if line.strip())
+        return [entry for entry in entries if entry is not None]
+
+    # === Output archive ===
+
+    def search_output(self, query: str, limit: int = 100, source: Optional[str] = None,
+                      name: Optional[str] = None) -> Dict:
+        """Archived task/console lines matching `query`, newest first (see philaunch_archive)"""
+        return self.archive.search(query, limit, source, name)
+
+    def archive_console(self, text: str):
+        """Queue console output (LIVE OUTPUT, status checks) for the archive"""
+        if self._console_key is None:
+            self._console_key = f'console-{os.getpid()}-{time.time():.0f}'
+            self.archive.start_run(self._console_key, 'console', 'console')
+        # The console shows each emit as its own line (fan-out lines have no '\n')
+        self.archive.append(self._console_key, text if text.endswith('\n') else text + '\n')
+
+    # === Log files ===
+
+    def log_dirs(self) -> List[Path]:
+        """Monitor logs (PHILAUNCH_LOG_DIR) and supervised task logs"""
+        return [log_dir(), state_dir() / 'tasks']
+
+    def read_log(self, path: str, lines: int = 50, since: Optional[float] = None,
+                 until: Optional[float] = None) -> List[str]:
+        """Last lines, or a time window, of a plain or packed log (see philaunch_logpack)"""
+        from philaunch_logpack import read_between, tail_lines
+        if since is None and until is None:
+            return tail_lines(Path(path), lines)
+        return [line for _, line in read_between(Path(path), since, until)]
+
+    def pack_logs(self, older_than: float = 86400.0) -> List[Dict]:
+        """Compress logs idle for `older_than` seconds; running tasks' logs stay plain"""
+        from philaunch_logpack import pack_logs
+        running = [task['log'] for task in self.tasks() if task['state'] == 'running' and task.get('log')]
+        return pack_logs([path for path in self.log_dirs() if path.is_dir()], older_than,
+                         exclude=running)
+
+    # === Remote hosts ===
+
+    def run_remote(self, command, host: Optional[str] = None,
+                   timeout: Optional[float] = None) -> Dict:
+        """One command on one host over its pooled connection"""
+        return self.remote.run(command, host, timeout=timeout)
+
+    def fan_out_script(self, script: str, hosts: Optional[List[str]] = None,
+                       on_line: Optional[Callable[[str, str, str], None]] = None,
+                       parallel: Optional[int] = None, args: Iterable[str] = ()) -> List[Dict]:
+        """Run a local script on several hosts at once (all configured by default)"""
+        from philaunch_remote import default_parallel, fan_out, script_command
+        command, stdin = script_command(Path(script), list(args))
+        return fan_out(self.remote, hosts or list(self.remote.hosts), command, on_line,
+                       parallel or default_parallel(), input=stdin)
+
+    # === Lifecycle ===
+
+    def close(self):
+        if self._catalog is not None:
+            self._catalog.stop()
+        if self._archive is not None:
+            if self._console_key is not None:
+                self._archive.end_run(self._console_key)
+            self._archive.close()
+
+
+def dashboard_tasks(engine: PhiLaunchEngine) -> Dict:
+    """The dashboard's api/tasks.json document"""
+    sessions = engine.sessions()
+    supervised = engine.tasks(include_finished=True)
+    return {
+        'tasks': [{'name': session['name'], 'status': 'running', 'windows': session['windows']}
+                  for session in sessions],
+        'count': len(sessions),
+        'supervised': {'tasks': supervised, 'count': len(supervised)},
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+    }
+
+
+def to_json(data) -> str:
+    return json.dumps(data, indent=2, default=str)
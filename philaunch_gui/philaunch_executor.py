@@ -0,0 +1,161 @@
+"""
+PhiLaunch Job Executor
+Shared bounded worker pool with per-key request coalescing for background jobs
+"""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _Job:
+    """In-flight job shared by every request with the same key"""
+
+    def __init__(self, key: Tuple[str, Hashable], generation: int):
+        self.key = key
+        self.generation = generation
+        self.callbacks = []
+        self.submitted = time.monotonic()
+        self.started = None
+        self.future: Optional[Future] = None
+
+
+class JobExecutor:
+    """
+    Central executor for GUI background work.
+
+    Jobs are keyed by (kind, target). While a job is running, new requests for
+    the same key attach to it instead of starting another subprocess. Kinds
+    submitted with `latest_only=True` drop results of older jobs once a newer
+    job of the same kind was requested (e.g. output of a previously selected
+    task). Callbacks run on the worker thread - forward them through a signal.
+    After `shutdown()` new jobs are ignored (their future is returned cancelled).
+    """
+
+    def __init__(self, max_workers: int = 4, instruments=None):
+        self.instruments = instruments  # philaunch_instrument.Instruments, optional
+        self._pool = ThreadPoolExecutor(max_workers=max_workers,
+                                        thread_name_prefix='philaunch-job')
+        self._lock = threading.Lock()
+        self._closed = False
+        self._inflight: Dict[Tuple[str, Hashable], _Job] = {}
+        self._generations: Dict[str, int] = {}
+
+        self._queued = 0
+        self._running = 0
+        self._counters = {'submitted': 0, 'coalesced': 0, 'completed': 0,
+                          'failed': 0, 'dropped_stale': 0}
+        self._latency: Dict[str, Dict[str, float]] = {}
+
+    # === Public API ===
+
+    def submit(self, kind: str, target: Hashable, fn: Callable[[], Any],
+               on_result: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[Exception], None]] = None,
+               latest_only: bool = False) -> Future:
+        """Run fn() in the pool, or attach to the in-flight job with the same key"""
+        key = (kind, target)
+        with self._lock:
+            if self._closed:  # A timer or signal firing while the window closes
+                future = Future()
+                future.cancel()
+                return future
+            if latest_only:
+                self._generations[kind] = self._generations.get(kind, 0) + 1
+            generation = self._generations.get(kind, 0)
+
+            job = self._inflight.get(key)
+            if job is not None:
+                self._counters['coalesced'] += 1
+                job.generation = generation
+                job.callbacks.append((on_result, on_error))
+                return job.future
+
+            job = _Job(key, generation)
+            job.callbacks.append((on_result, on_error))
+            self._inflight[key] = job
+            self._queued += 1
+            self._counters['submitted'] += 1
+            job.future = self._pool.submit(self._run, job, fn)
+            return job.future
+
+    def stats(self) -> Dict:
+        """Queue depth, counters and per-kind latency (wait/run, ms)"""
+        with self._lock:
+            latency = {}
+            for kind, agg in self._latency.items():
+                count = agg['count'] or 1
+                latency[kind] = {
+                    'count': int(agg['count']),
+                    'wait_avg_ms': round(agg['wait_total'] * 1000 / count, 2),
+                    'run_avg_ms': round(agg['run_total'] * 1000 / count, 2),
+                    'run_max_ms': round(agg['run_max'] * 1000, 2),
+                }
+            return {
+                'queue_depth': self._queued,
+                'running': self._running,
+                'inflight_keys': len(self._inflight),
+                **self._counters,
+                'latency': latency,
+            }
+
+    def shutdown(self, wait: bool = False):
+        with self._lock:
+            self._closed = True
+        self._pool.shutdown(wait=wait)
+
+    # === Worker ===
+
+    def _run(self, job: _Job, fn: Callable[[], Any]):
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        job.started = time.monotonic()
+
+        result, error = None, None
+        try:
+            result = fn()
+        except Exception as e:  # Reported through on_error
+            error = e
+        finished = time.monotonic()
+
+        with self._lock:
+            self._running -= 1
+            self._inflight.pop(job.key, None)
+            kind = job.key[0]
+            stale = job.generation < self._generations.get(kind, 0)
+            self._record(kind, job.started - job.submitted, finished - job.started)
+            if stale:
+                self._counters['dropped_stale'] += 1
+            elif error is not None:
+                self._counters['failed'] += 1
+            else:
+                self._counters['completed'] += 1
+            callbacks = list(job.callbacks)
+
+        if self.instruments is not None:
+            self.instruments.record(f"job:{kind}", finished - job.started)
+            self.instruments.record(f"wait:{kind}", job.started - job.submitted)
+
+        if stale:
+            return None
+
+        for on_result, on_error in callbacks:
+            if error is not None:
+                if on_error:
+                    on_error(error)
+            elif on_result:
+                on_result(result)
+
+        if error is not None:
+            raise error
+        return result
+
+    def _record(self, kind: str, wait: float, run: float):
+        agg = self._latency.setdefault(
+            kind, {'count': 0, 'wait_total': 0.0, 'run_total': 0.0, 'run_max': 0.0})
+        agg['count'] += 1
+        agg['wait_total'] += wait
+        agg['run_total'] += run
+        agg['run_max'] = max(agg['run_max'], run)
@@ -4,41 +4,83 @@ PhiLaunch Control Center - Tactical Automation Dashboard
 Remote execution and monitoring interface for PhiLaunch automation framework
 """
 
+import time
+_STARTED = time.perf_counter()  # Origin for --profile-startup timings
+
 import os
 import sys
 import subprocess
-import threading
-import time
 from pathlib import Path
 from datetime import datetime
 
+try:
+    from philaunch_profiler import StartupProfiler
+except ImportError:
+    # Fallback if running from different directory
+    sys.path.insert(0, str(Path(__file__).parent))
+    from philaunch_profiler import StartupProfiler
+
+PROFILER = StartupProfiler(origin=_STARTED)
+
 # DPI fix MUST come before PyQt6 imports
 os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "0"
 os.environ["QT_SCALE_FACTOR"] = "1"
 os.environ["QT_ENABLE_HIGHDPI_SCALING"] = "0"
 
-from PyQt6.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QTreeWidget, QTreeWidgetItem, QTextEdit,
-    QSplitter, QFrame, QScrollArea
-)
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QObject
-from PyQt6.QtGui import QFont
-
-# Import color palette
-try:
-    from philaunch_colors import COLORS, INTERACTION_STATES, COMPONENT_COLORS
-except ImportError:
-    # Fallback if running from different directory
-    sys.path.insert(0, str(Path(__file__).parent))
-    from philaunch_colors import COLORS, INTERACTION_STATES, COMPONENT_COLORS
+with PROFILER.phase("import PyQt6"):
+    from PyQt6.QtWidgets import (
+        QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+        QPushButton, QLabel, QLineEdit, QTreeWidget, QTreeWidgetItem,
+        QSplitter, QFrame, QScrollArea
+    )
+    from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QObject
+    from PyQt6.QtGui import QFont
+
+with PROFILER.phase("import philaunch modules"):
+    from philaunch_colors import COLORS
+    from philaunch_engine import PhiLaunchEngine
+    from philaunch_sessions import TmuxSessionWatcher
+    from philaunch_task_tree import TaskTreeModel
+    from philaunch_console import OutputConsole
+    from philaunch_pane_stream import PaneStream
+    from philaunch_journal_view import JournalPanel
+    from philaunch_debug_view import DebugPanel
+    from philaunch_instrument import INSTRUMENTS, SLOW_LOG_FILE, install_subprocess_hooks
+    from philaunch_executor import JobExecutor
+    from philaunch_history import MetricHistory
+    from philaunch_sparkline import Sparkline
+    from philaunch_paths import state_dir
+    from philaunch_remote import RemoteError, default_parallel, format_summary
+    from philaunch_archive import format_results
+    from philaunch_logpack import format_pack_results
+    from philaunch_theme import DEFAULT_THEME, apply_theme, tag
+
+
+# Icons for well-known scripts; everything else in the catalog gets the default
+SCRIPT_ICONS = {
+    "home-control.sh": "🏠",
+    "launch-script.sh": "🚀",
+    "start-long-task.sh": "⏱",
+    "wow_monitor.sh": "🎮",
+    "wow_quick_check.sh": "✓",
+    "system_info_checker.sh": "📊",
+    "status_monitor.sh": "📈",
+}
+DEFAULT_SCRIPT_ICON = "📜"
 
 
 class PhiLaunchSignals(QObject):
     """Signal emitter for thread-safe UI updates"""
-    update_output = pyqtSignal(str)
-    update_tasks = pyqtSignal(list)
+    update_output = pyqtSignal(str)  # shown in LIVE OUTPUT and archived
+    show_output = pyqtSignal(str)  # shown only (pane streams, search results)
+    update_scripts = pyqtSignal(list)  # ScriptCatalog.sections()
+    update_tasks = pyqtSignal(list)  # session dicts (see philaunch_sessions)
+    update_task_usage = pyqtSignal(dict)  # {name: {'cpu', 'rss', 'procs'}}
+    update_queue = pyqtSignal(list)  # queued supervisor task dicts, in run order
     update_status = pyqtSignal(str, str)  # (metric_name, value)
+    session_window_changed = pyqtSignal(str, str)  # (session_name, window_id)
+    refresh_status = pyqtSignal()
+    delivery_probe = pyqtSignal(float)  # perf_counter() at emit, from a worker thread
 
 
 class PhiLaunchControlCenter(QMainWindow):
@@ -52,21 +94,50 @@ class PhiLaunchControlCenter(QMainWindow):
 
         # Paths
         self.home_dir = Path.home()
-        self.automation_dir = self.home_dir / "automation"
-        self.scripts_dir = self.home_dir
 
         # State
         self.dragging = False
         self.drag_position = None
         self.selected_script = None
         self.selected_task = None
-        self.monitoring_active = False
+        self.selected_pending = None  # "#<id>" of a queued supervisor task
+        self.journal_panel = None  # VIEW LOGS window, created on first use
+        self.debug_panel = None  # Perf window, created on first use
+        self.task_model = None  # Created with the RUNNING TASKS root in create_left_pane
+        self.initial_load_started = False
+        self.pending_loads = set()  # Deferred loads still running (for the startup profile)
+
+        # Metric trends (1 hour at 2 s), restored after the first paint
+        self.history = MetricHistory(['CPU', 'RAM', 'TASKS', 'SSH'], capacity=1800, interval=2.0)
+        self.history_path = state_dir() / 'metric_history.bin'
+        self.sparklines = {}
+        self.history_ticks = 0
+
+        # Latency histograms: every subprocess, executor job and slot below
+        INSTRUMENTS.slow_log = state_dir() / SLOW_LOG_FILE
+        install_subprocess_hooks(INSTRUMENTS)
+        slot = INSTRUMENTS.slot
 
         # Signals for thread-safe updates
         self.signals = PhiLaunchSignals()
-        self.signals.update_output.connect(self.append_output)
-        self.signals.update_tasks.connect(self.refresh_task_list)
-        self.signals.update_status.connect(self.update_metric)
+        self.signals.update_output.connect(slot(self.append_output))
+        self.signals.show_output.connect(slot(self.show_output))
+        self.signals.update_scripts.connect(slot(self.populate_scripts))
+        self.signals.update_tasks.connect(slot(self.refresh_task_list))
+        self.signals.update_task_usage.connect(slot(self.update_task_usage))
+        self.signals.update_queue.connect(slot(self.refresh_queue))
+        self.signals.update_status.connect(slot(self.update_metric))
+        self.signals.session_window_changed.connect(slot(self.on_session_window_changed))
+        self.signals.refresh_status.connect(slot(self.refresh_system_status))
+        self.signals.delivery_probe.connect(
+            lambda sent: INSTRUMENTS.record('signal delivery', time.perf_counter() - sent))
+
+        # Shared worker pool - identical in-flight jobs are coalesced
+        self.executor = JobExecutor(max_workers=4, instruments=INSTRUMENTS)
+
+        # Scripts, supervisor, /proc sampler and SSH pool - shared with
+        # philaunch_cli.py; the window only renders what the engine returns
+        self.engine = PhiLaunchEngine(on_scripts_changed=self.signals.update_scripts.emit)
 
         # Setup window
         self.setWindowTitle("PhiLaunch Control Center")
@@ -75,17 +146,67 @@ class PhiLaunchControlCenter(QMainWindow):
         self.setMinimumSize(1400, 800)
 
         # Build UI
-        self.setup_ui()
+        with PROFILER.phase("setup_ui"):
+            self.setup_ui()
 
-        # Start auto-refresh timer (every 2 seconds)
+        # Auto-refresh timer (every 2 seconds), started with the initial load
         self.refresh_timer = QTimer()
         self.refresh_timer.timeout.connect(self.auto_refresh)
-        self.refresh_timer.start(2000)
 
-        # Initial load
-        self.load_scripts()
-        self.refresh_tasks()
-        self.refresh_system_status()
+        # tmux control-mode watcher pushes session changes (no polling)
+        self.session_watcher = TmuxSessionWatcher(
+            on_sessions=self.signals.update_tasks.emit,
+            on_window_changed=self.signals.session_window_changed.emit,
+        )
+
+        # Live output of the selected task (tmux pipe-pane -> FIFO); supervised
+        # tasks are archived by the supervisor, so this is not archived again
+        self.pane_stream = PaneStream(on_output=self.signals.show_output.emit)
+
+        # Initial load is deferred until the window has painted once
+        # (see paintEvent); showEvent arms a fallback in case no paint arrives.
+
+    def showEvent(self, event):
+        """Arm the deferred initial load"""
+        super().showEvent(event)
+        if not self.initial_load_started:
+            QTimer.singleShot(250, self.start_initial_load)
+
+    def paintEvent(self, event):
+        """Kick off the initial load right after the first frame"""
+        super().paintEvent(event)
+        if not self.initial_load_started:
+            PROFILER.mark("first paint")
+            QTimer.singleShot(0, self.start_initial_load)
+
+    def start_initial_load(self):
+        """Fill the data-dependent panes without blocking the first paint"""
+        if self.initial_load_started:
+            return
+        self.initial_load_started = True
+        self.pending_loads = {'scripts', 'tasks'}
+
+        with PROFILER.phase("initial load (GUI thread)"):
+            self.history.load(self.history_path)
+            self.refresh_system_status()
+            self.load_scripts()
+            self.executor.submit('startup', 'sessions', self.session_watcher.start,
+                                 on_result=self._on_watcher_started)
+            self.refresh_timer.start(2000)
+
+    def _on_watcher_started(self, started: bool):
+        """Fall back to one tmux poll when control mode is unavailable (worker thread)"""
+        if not started:
+            self.refresh_tasks()
+
+    def _finish_load(self, name: str):
+        """Record a deferred load as done; print the profile after the last one"""
+        if name not in self.pending_loads:
+            return
+        self.pending_loads.discard(name)
+        PROFILER.mark(f"{name} loaded")
+        if not self.pending_loads:
+            PROFILER.print_report()
 
     def setup_ui(self):
         """Build the complete UI hierarchy"""
@@ -93,14 +214,7 @@ class PhiLaunchControlCenter(QMainWindow):
         central = QWidget()
         self.setCentralWidget(central)
 
-        # Apply base styling
-        central.setStyleSheet(f"""
-            QWidget {{
-                background-color: {COLORS['bg_base']};
-                color: {COLORS['text_primary']};
-                font-family: 'Monospace';
-            }}
-        """)
+        # Styling comes from the application-level sheet (philaunch_theme)
 
         # Main layout
         main_layout = QVBoxLayout(central)
@@ -108,21 +222,19 @@ class PhiLaunchControlCenter(QMainWindow):
         main_layout.setSpacing(0)
 
         # Add components
-        main_layout.addWidget(self.create_title_bar())
-        main_layout.addWidget(self.create_toolbar())
-        main_layout.addWidget(self.create_three_pane_layout())
-        main_layout.addWidget(self.create_status_bar())
+        for name, build in (("title bar", self.create_title_bar),
+                            ("toolbar", self.create_toolbar),
+                            ("panes", self.create_three_pane_layout),
+                            ("status bar", self.create_status_bar)):
+            with PROFILER.phase(name):
+                main_layout.addWidget(build())
 
     def create_title_bar(self) -> QWidget:
         """Custom title bar with window controls"""
         title_bar = QWidget()
         title_bar.setFixedHeight(32)
-        title_bar.setStyleSheet(f"""
-            QWidget {{
-                background-color: {COLORS['bg_panel']};
-                border-bottom: 2px solid {COLORS['border_bright']};
-            }}
-        """)
+        title_bar.setObjectName("titleBar")
+        tag(title_bar, surface="panel")
 
         layout = QHBoxLayout(title_bar)
         layout.setContentsMargins(10, 0, 10, 0)
@@ -130,7 +242,7 @@ class PhiLaunchControlCenter(QMainWindow):
         # Title
         title_label = QLabel("⚡ PHILAUNCH CONTROL CENTER")
         title_label.setFont(QFont("Monospace", 12, QFont.Weight.Bold))
-        title_label.setStyleSheet(f"color: {COLORS['primary']};")
+        tag(title_label, "title")
         layout.addWidget(title_label)
 
         layout.addStretch()
@@ -152,29 +264,14 @@ class PhiLaunchControlCenter(QMainWindow):
         btn.setFixedSize(32, 28)
         btn.setFont(QFont("Monospace", 14, QFont.Weight.Bold))
         btn.clicked.connect(callback)
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {COLORS['text_secondary']};
-                border: none;
-            }}
-            QPushButton:hover {{
-                background-color: {COLORS['bg_card']};
-                color: {COLORS['primary']};
-            }}
-        """)
-        return btn
+        return tag(btn, "window")
 
     def create_toolbar(self) -> QWidget:
         """System status toolbar with indicators"""
         toolbar = QWidget()
-        toolbar.setFixedHeight(50)
-        toolbar.setStyleSheet(f"""
-            QWidget {{
-                background-color: {COLORS['bg_panel']};
-                border-bottom: 1px solid {COLORS['border_dim']};
-            }}
-        """)
+        toolbar.setFixedHeight(62)
+        toolbar.setObjectName("toolbar")
+        tag(toolbar, surface="panel")
 
         layout = QHBoxLayout(toolbar)
         layout.setContentsMargins(15, 8, 15, 8)
@@ -199,33 +296,40 @@ class PhiLaunchControlCenter(QMainWindow):
         btn_refresh = self.create_action_button("🔄", "Refresh", self.refresh_all)
         btn_terminal = self.create_action_button("💻", "Terminal", self.open_terminal)
         btn_status = self.create_action_button("📊", "Status", self.run_status_check)
+        btn_perf = self.create_action_button("⏱", "Perf", self.show_debug_panel)
 
         layout.addWidget(btn_refresh)
         layout.addWidget(btn_terminal)
         layout.addWidget(btn_status)
+        layout.addWidget(btn_perf)
 
         return toolbar
 
     def create_indicator(self, label: str, value: str, color: str) -> QWidget:
         """Create status indicator widget"""
-        widget = QWidget()
+        widget = tag(QWidget(), surface="panel")
         layout = QVBoxLayout(widget)
         layout.setContentsMargins(10, 0, 10, 0)
         layout.setSpacing(2)
 
-        lbl_name = QLabel(label)
+        lbl_name = tag(QLabel(label), "indicatorName")
         lbl_name.setFont(QFont("Monospace", 8))
-        lbl_name.setStyleSheet(f"color: {COLORS['text_secondary']};")
         lbl_name.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-        lbl_value = QLabel(value)
+        lbl_value = tag(QLabel(value), "indicatorValue")
         lbl_value.setFont(QFont("Monospace", 11, QFont.Weight.Bold))
-        lbl_value.setStyleSheet(f"color: {color};")
         lbl_value.setAlignment(Qt.AlignmentFlag.AlignCenter)
         lbl_value.setObjectName(f"indicator_{label.lower()}_value")
 
+        # Trend line fed from MetricHistory (percentages use a fixed 0-100 scale)
+        ceiling = {'CPU': 100.0, 'RAM': 100.0, 'SSH': 1.0}.get(label)
+        spark = Sparkline(color, ceiling=ceiling)
+        spark.setObjectName(f"indicator_{label.lower()}_spark")
+        self.sparklines[label] = spark
+
         layout.addWidget(lbl_name)
         layout.addWidget(lbl_value)
+        layout.addWidget(spark, alignment=Qt.AlignmentFlag.AlignCenter)
 
         return widget
 
@@ -233,50 +337,19 @@ class PhiLaunchControlCenter(QMainWindow):
         """Create vertical separator line"""
         separator = QFrame()
         separator.setFrameShape(QFrame.Shape.VLine)
-        separator.setStyleSheet(f"""
-            QFrame {{
-                color: {COLORS['border_dim']};
-                max-width: 1px;
-            }}
-        """)
-        return separator
+        return tag(separator, "separator")
 
     def create_action_button(self, icon: str, text: str, callback) -> QPushButton:
         """Create toolbar action button"""
         btn = QPushButton(f"{icon} {text}")
         btn.setFont(QFont("Monospace", 10))
         btn.clicked.connect(callback)
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {INTERACTION_STATES['normal_bg']};
-                color: {COLORS['text_primary']};
-                border: 1px solid {COLORS['border_dim']};
-                border-radius: 4px;
-                padding: 6px 12px;
-            }}
-            QPushButton:hover {{
-                background-color: {INTERACTION_STATES['hover_bg']};
-                border: 1px solid {COLORS['border_bright']};
-                color: {COLORS['primary']};
-            }}
-            QPushButton:pressed {{
-                background-color: {INTERACTION_STATES['pressed_bg']};
-            }}
-        """)
-        return btn
+        return tag(btn, "toolbar")
 
     def create_three_pane_layout(self) -> QSplitter:
         """Main three-pane layout: Scripts | Output | Actions"""
         splitter = QSplitter(Qt.Orientation.Horizontal)
         splitter.setHandleWidth(3)
-        splitter.setStyleSheet(f"""
-            QSplitter::handle {{
-                background-color: {COLORS['border_dim']};
-            }}
-            QSplitter::handle:hover {{
-                background-color: {COLORS['border_bright']};
-            }}
-        """)
 
         # Left pane: Script tree (420px)
         splitter.addWidget(self.create_left_pane())
@@ -294,8 +367,7 @@ class PhiLaunchControlCenter(QMainWindow):
 
     def create_left_pane(self) -> QWidget:
         """Left pane: Script and task navigation tree"""
-        pane = QWidget()
-        pane.setStyleSheet(f"background-color: {COLORS['bg_panel']};")
+        pane = tag(QWidget(), surface="panel")
 
         layout = QVBoxLayout(pane)
         layout.setContentsMargins(10, 10, 10, 10)
@@ -303,7 +375,7 @@ class PhiLaunchControlCenter(QMainWindow):
         # Header
         header = QLabel("📜 AUTOMATION & TASKS")
         header.setFont(QFont("Monospace", 11, QFont.Weight.Bold))
-        header.setStyleSheet(f"color: {COLORS['primary']}; padding: 5px;")
+        tag(header, "header")
         layout.addWidget(header)
 
         # Tree widget
@@ -311,29 +383,20 @@ class PhiLaunchControlCenter(QMainWindow):
         self.tree.setHeaderHidden(True)
         self.tree.setFont(QFont("Monospace", 10))
         self.tree.itemClicked.connect(self.on_tree_item_clicked)
-        self.tree.setStyleSheet(f"""
-            QTreeWidget {{
-                background-color: {COLORS['bg_card']};
-                color: {COLORS['text_primary']};
-                border: 1px solid {COLORS['border_dim']};
-                border-radius: 4px;
-                padding: 5px;
-            }}
-            QTreeWidget::item {{
-                padding: 6px;
-                border-left: 3px solid transparent;
-            }}
-            QTreeWidget::item:hover {{
-                background-color: {INTERACTION_STATES['hover_bg']};
-                color: {COLORS['primary']};
-            }}
-            QTreeWidget::item:selected {{
-                background-color: {INTERACTION_STATES['selected_bg']};
-                border-left: 3px solid {COLORS['primary']};
-                color: {COLORS['primary']};
-                font-weight: bold;
-            }}
-        """)
+        self.tree.setObjectName("scriptTree")
+
+        # RUNNING TASKS lives for the whole session; script sections are
+        # (re)inserted above it by populate_scripts
+        self.tasks_root = QTreeWidgetItem(self.tree, ["▼ RUNNING TASKS"])
+        self.tasks_root.setFont(0, QFont("Monospace", 10, QFont.Weight.Bold))
+        self.task_model = TaskTreeModel(
+            self.tasks_root, self.palette().color(self.palette().ColorRole.Base))
+
+        # Supervisor run queue; hidden while nothing is waiting for a slot
+        self.pending_root = QTreeWidgetItem(self.tree, ["▼ PENDING (0)"])
+        self.pending_root.setFont(0, QFont("Monospace", 10, QFont.Weight.Bold))
+        self.pending_root.setHidden(True)
+        self.tree.expandAll()
 
         layout.addWidget(self.tree)
 
@@ -341,32 +404,35 @@ class PhiLaunchControlCenter(QMainWindow):
 
     def create_middle_pane(self) -> QWidget:
         """Middle pane: Live output viewer"""
-        pane = QWidget()
-        pane.setStyleSheet(f"background-color: {COLORS['bg_panel']};")
+        pane = tag(QWidget(), surface="panel")
 
         layout = QVBoxLayout(pane)
         layout.setContentsMargins(10, 10, 10, 10)
 
-        # Header
+        # Header with the output history search
+        header_row = QHBoxLayout()
         header = QLabel("📺 LIVE OUTPUT")
         header.setFont(QFont("Monospace", 11, QFont.Weight.Bold))
-        header.setStyleSheet(f"color: {COLORS['primary']}; padding: 5px;")
-        layout.addWidget(header)
-
-        # Output text area
-        self.output_text = QTextEdit()
-        self.output_text.setReadOnly(True)
+        tag(header, "header")
+        header_row.addWidget(header)
+        header_row.addStretch()
+
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("🔎 search output history")
+        self.search_edit.setFixedWidth(260)
+        self.search_edit.setToolTip("All archived task and LIVE OUTPUT lines, newest first\n"
+                                    "Words are ANDed; word* matches a prefix")
+        self.search_edit.returnPressed.connect(self.search_output)
+        header_row.addWidget(self.search_edit)
+        layout.addLayout(header_row)
+
+        # Output text area (bounded, batched, disk-backed scrollback)
+        line_cap = os.environ.get('PHILAUNCH_GUI_OUTPUT_LINES', '')
+        self.output_text = OutputConsole(line_cap=int(line_cap) if line_cap.isdigit() else 5000)
         self.output_text.setFont(QFont("Monospace", 9))
-        self.output_text.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: {COLORS['bg_input']};
-                color: {COLORS['text_primary']};
-                border: 1px solid {COLORS['border_dim']};
-                border-radius: 4px;
-                padding: 10px;
-            }}
-        """)
-        self.output_text.append(self.get_welcome_message())
+        self.output_text.flushed.connect(lambda line: self.status_label.setText(line[:80]))
+        self.output_text.setObjectName("liveOutput")
+        self.output_text.append_text(self.get_welcome_message())
 
         layout.addWidget(self.output_text)
 
@@ -374,8 +440,7 @@ class PhiLaunchControlCenter(QMainWindow):
 
     def create_right_pane(self) -> QWidget:
         """Right pane: Quick actions"""
-        pane = QWidget()
-        pane.setStyleSheet(f"background-color: {COLORS['bg_panel']};")
+        pane = tag(QWidget(), surface="panel")
 
         layout = QVBoxLayout(pane)
         layout.setContentsMargins(10, 10, 10, 10)
@@ -384,39 +449,26 @@ class PhiLaunchControlCenter(QMainWindow):
         # Header
         header = QLabel("⚡ QUICK ACTIONS")
         header.setFont(QFont("Monospace", 11, QFont.Weight.Bold))
-        header.setStyleSheet(f"color: {COLORS['primary']}; padding: 5px;")
+        tag(header, "header")
         layout.addWidget(header)
 
-        # Action buttons
+        # Action buttons (tone picks the text color from the theme)
         actions = [
-            ("▶ RUN SCRIPT", self.run_selected_script, COMPONENT_COLORS['task_running']),
-            ("🔴 STOP TASK", self.stop_selected_task, COMPONENT_COLORS['task_stopped']),
-            ("📋 VIEW LOGS", self.view_logs, COLORS['info']),
-            ("🔄 RESTART SSH", self.restart_ssh, COLORS['warning']),
-            ("📱 PHONE SHORTCUTS", self.show_phone_shortcuts, COLORS['info']),
+            ("▶ RUN SCRIPT", self.run_selected_script, "running"),
+            ("🔴 STOP TASK", self.stop_selected_task, "stopped"),
+            ("📋 VIEW LOGS", self.view_logs, "info"),
+            ("🌐 REMOTE STATUS", self.run_remote_status, "info"),
+            ("🛰 RUN ON ALL HOSTS", self.run_script_on_hosts, "running"),
+            ("📦 PACK OLD LOGS", self.pack_old_logs, "info"),
+            ("🔄 RESTART SSH", self.restart_ssh, "warning"),
+            ("📱 PHONE SHORTCUTS", self.show_phone_shortcuts, "info"),
         ]
 
-        for text, callback, color in actions:
-            btn = QPushButton(text)
+        for text, callback, tone in actions:
+            btn = tag(QPushButton(text), "quickAction", tone=tone)
             btn.setFont(QFont("Monospace", 10, QFont.Weight.Bold))
             btn.setMinimumHeight(45)
             btn.clicked.connect(callback)
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {COLORS['bg_card']};
-                    color: {color};
-                    border: 2px solid {COLORS['border_dim']};
-                    border-radius: 6px;
-                    padding: 10px;
-                }}
-                QPushButton:hover {{
-                    background-color: {INTERACTION_STATES['hover_bg']};
-                    border: 2px solid {COLORS['border_bright']};
-                }}
-                QPushButton:pressed {{
-                    background-color: {INTERACTION_STATES['pressed_bg']};
-                }}
-            """)
             layout.addWidget(btn)
 
         layout.addStretch()
@@ -427,26 +479,22 @@ class PhiLaunchControlCenter(QMainWindow):
         """Bottom status bar"""
         status_bar = QWidget()
         status_bar.setFixedHeight(28)
-        status_bar.setStyleSheet(f"""
-            QWidget {{
-                background-color: {COLORS['bg_panel']};
-                border-top: 1px solid {COLORS['border_dim']};
-            }}
-        """)
+        status_bar.setObjectName("statusBar")
+        tag(status_bar, surface="panel")
 
         layout = QHBoxLayout(status_bar)
         layout.setContentsMargins(15, 4, 15, 4)
 
-        self.status_label = QLabel("Ready")
+        self.status_label = tag(QLabel("Ready"), "status")
         self.status_label.setFont(QFont("Monospace", 9))
-        self.status_label.setStyleSheet(f"color: {COLORS['text_secondary']};")
 
         layout.addWidget(self.status_label)
         layout.addStretch()
 
-        version_label = QLabel("PhiLaunch v1.0 | 192.168.50.149:2222")
+        main_host = self.engine.remote.hosts.get('main')
+        endpoint = f" | {main_host['target'].rpartition('@')[2]}:{main_host['port']}" if main_host else ""
+        version_label = tag(QLabel(f"PhiLaunch v1.0{endpoint}"), "version")
         version_label.setFont(QFont("Monospace", 8))
-        version_label.setStyleSheet(f"color: {COLORS['text_dim']};")
         layout.addWidget(version_label)
 
         return status_bar
@@ -454,121 +502,121 @@ class PhiLaunchControlCenter(QMainWindow):
     # === Data Loading Methods ===
 
     def load_scripts(self):
-        """Load scripts into tree"""
-        self.tree.clear()
-
-        # Automation scripts
-        automation_root = QTreeWidgetItem(self.tree, ["▼ AUTOMATION SCRIPTS"])
-        automation_root.setFont(0, QFont("Monospace", 10, QFont.Weight.Bold))
-
-        automation_scripts = [
-            ("🏠", "home-control.sh"),
-            ("🚀", "launch-script.sh"),
-            ("⏱", "start-long-task.sh"),
-        ]
-
-        for icon, script in automation_scripts:
-            item = QTreeWidgetItem(automation_root, [f"  ├─ {icon} {script}"])
-            item.setData(0, Qt.ItemDataRole.UserRole, str(self.automation_dir / script))
-
-        # Monitoring scripts
-        monitor_root = QTreeWidgetItem(self.tree, ["▼ MONITORING"])
-        monitor_root.setFont(0, QFont("Monospace", 10, QFont.Weight.Bold))
-
-        monitor_scripts = [
-            ("🎮", "wow_monitor.sh"),
-            ("✓", "wow_quick_check.sh"),
-            ("📊", "system_info_checker.sh"),
-            ("📈", "status_monitor.sh"),
-        ]
-
-        for icon, script in monitor_scripts:
-            script_path = self.scripts_dir / script
-            if script_path.exists():
-                item = QTreeWidgetItem(monitor_root, [f"  ├─ {icon} {script}"])
-                item.setData(0, Qt.ItemDataRole.UserRole, str(script_path))
-
-        # Running tasks section (will be populated by refresh)
-        self.tasks_root = QTreeWidgetItem(self.tree, ["▼ RUNNING TASKS"])
-        self.tasks_root.setFont(0, QFont("Monospace", 10, QFont.Weight.Bold))
-
-        self.tree.expandAll()
+        """Scan for scripts in the background; the tree fills in via update_scripts"""
+        self.executor.submit('scripts', 'tree', self._scan_scripts,
+                             on_result=self.signals.update_scripts.emit, latest_only=True)
+
+    def _scan_scripts(self) -> list:
+        """Refresh the catalog and start watching it (worker thread - no widgets here)"""
+        sections = self.engine.scripts()
+        self.engine.watch_scripts()
+        return sections
+
+    def populate_scripts(self, sections: list):
+        """Replace the script sections above RUNNING TASKS (main thread)"""
+        self.tree.setUpdatesEnabled(False)
+        index = 0
+        while self.tree.topLevelItem(index) is not None:
+            if self.tree.topLevelItem(index) in (self.tasks_root, self.pending_root):
+                index += 1
+            else:
+                self.tree.takeTopLevelItem(index)
+
+        position = 0
+        for title, entries in sections:
+            if not entries:
+                continue
+            section = QTreeWidgetItem([title])
+            section.setFont(0, QFont("Monospace", 10, QFont.Weight.Bold))
+            for entry in entries:
+                icon = SCRIPT_ICONS.get(entry['name'], DEFAULT_SCRIPT_ICON)
+                item = QTreeWidgetItem(section, [f"  ├─ {icon} {entry['name']}"])
+                item.setData(0, Qt.ItemDataRole.UserRole, entry['path'])
+                item.setToolTip(0, self.format_script_tooltip(entry))
+            self.tree.insertTopLevelItem(position, section)
+            section.setExpanded(True)
+            position += 1
+        self.tree.setUpdatesEnabled(True)
+
+        self._finish_load('scripts')
+
+    def format_script_tooltip(self, entry: dict) -> str:
+        """Header metadata of a catalog entry"""
+        lines = [entry['purpose'] or entry['description'] or entry['name']]
+        if entry['dependencies']:
+            lines.append(f"Dependencies: {', '.join(entry['dependencies'])}")
+        if entry['sudo']:
+            lines.append(f"Sudo: {entry['sudo']}")
+        if entry['usage']:
+            lines.append(f"Usage: {entry['usage']}")
+        if entry['local']:
+            lines.append("🔒 LOCAL (written on this computer)")
+        return "\n".join(lines)
 
     def refresh_tasks(self):
         """Refresh running tmux sessions"""
-        try:
-            result = subprocess.run(
-                ['tmux', 'list-sessions', '-F', '#{session_name}'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-
-            if result.returncode == 0:
-                tasks = result.stdout.strip().split('\n') if result.stdout.strip() else []
-                self.signals.update_tasks.emit(tasks)
-            else:
-                self.signals.update_tasks.emit([])
+        if self.session_watcher.request_refresh():
+            return  # Result arrives through update_tasks
 
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            self.signals.update_tasks.emit([])
+        self.signals.update_tasks.emit(self.engine.sessions())
 
     def refresh_task_list(self, tasks: list):
-        """Update task list in tree (thread-safe)"""
-        # Clear existing tasks
-        while self.tasks_root.childCount() > 0:
-            self.tasks_root.removeChild(self.tasks_root.child(0))
-
-        # Add current tasks
-        for task in tasks:
-            if task:
-                item = QTreeWidgetItem(self.tasks_root, [f"  ├─ ▶ {task}"])
-                item.setData(0, Qt.ItemDataRole.UserRole, f"task:{task}")
-                item.setForeground(0, self.palette().color(self.palette().ColorRole.Base))
+        """Apply session deltas to the task tree (thread-safe)"""
+        delta = self.task_model.apply(tasks)
+        self._finish_load('tasks')
+
+        # Keep the selection pointed at the same session across renames
+        for old_name, session in delta['renamed']:
+            if self.selected_task == old_name:
+                self.selected_task = session['name']
+        if self.selected_task in delta['removed']:
+            self.selected_task = None
+            self.pane_stream.follow(None)
 
         # Update task count indicator
-        self.update_metric("TASKS", str(len(tasks)))
+        self.update_metric("TASKS", str(len(self.task_model)))
 
     def refresh_system_status(self):
-        """Refresh system metrics"""
-        threading.Thread(target=self._fetch_system_status, daemon=True).start()
-
-    def _fetch_system_status(self):
-        """Fetch system status in background thread"""
+        """Refresh system metrics from the /proc sampler"""
+        status = self.engine.system_status()
+
+        cpu = "??" if status['cpu'] is None else f"{status['cpu']:.1f}"
+        mem = "??" if status['ram'] is None else f"{status['ram']:.0f}"
+        ssh = "✓" if status['ssh'] else "✗"
+
+        self.update_metric("CPU", f"{cpu}%")
+        self.update_metric("RAM", f"{mem}%")
+        self.update_metric("SSH", ssh)
+
+        self.history.push({
+            'CPU': status['cpu'],
+            'RAM': status['ram'],
+            'TASKS': float(len(self.task_model)),
+            'SSH': 1.0 if status['ssh'] else 0.0,
+        }, status['timestamp'])
+        self.update_sparklines()
+
+        # Snapshot roughly once a minute so a crash loses little history
+        self.history_ticks += 1
+        if self.history_ticks % 30 == 0:
+            self.save_history()
+
+    def update_sparklines(self):
+        """Redraw indicator trends and their 1h min/avg/max tooltips"""
+        for name, spark in self.sparklines.items():
+            ring = self.history[name]
+            spark.set_values(ring.values())
+            stats = ring.stats()
+            if stats['avg'] is not None:
+                spark.parentWidget().setToolTip(
+                    f"{name} (last hour)\nmin {stats['min']:.1f}  "
+                    f"avg {stats['avg']:.1f}  max {stats['max']:.1f}")
+
+    def save_history(self):
+        """Persist metric history snapshot"""
         try:
-            # CPU usage (simplified)
-            cpu_result = subprocess.run(
-                ['sh', '-c', "top -bn1 | grep 'Cpu(s)' | awk '{print $2}' | cut -d'%' -f1"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            cpu = cpu_result.stdout.strip() if cpu_result.returncode == 0 else "??"
-
-            # Memory usage
-            mem_result = subprocess.run(
-                ['sh', '-c', "free | grep Mem | awk '{print int($3/$2 * 100)}'"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            mem = mem_result.stdout.strip() if mem_result.returncode == 0 else "??"
-
-            # SSH status
-            ssh_result = subprocess.run(
-                ['systemctl', 'is-active', 'ssh'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            ssh = "✓" if ssh_result.stdout.strip() == "active" else "✗"
-
-            # Update UI
-            self.signals.update_status.emit("CPU", f"{cpu}%")
-            self.signals.update_status.emit("RAM", f"{mem}%")
-            self.signals.update_status.emit("SSH", ssh)
-
-        except Exception:
+            self.history.save(self.history_path)
+        except OSError:
             pass
 
     def update_metric(self, name: str, value: str):
@@ -581,23 +629,79 @@ class PhiLaunchControlCenter(QMainWindow):
 
     def on_tree_item_clicked(self, item, column):
         """Handle tree item selection"""
+        if item is self.pending_root:
+            return
+        if item is self.tasks_root:
+            # Clicking the section header toggles the top-consumer ordering
+            by_usage = not self.task_model.sort_by_usage
+            self.task_model.set_sort_by_usage(by_usage)
+            self.tasks_root.setText(0, "▼ RUNNING TASKS" + (" (by CPU)" if by_usage else ""))
+            return
         data = item.data(0, Qt.ItemDataRole.UserRole)
         if data:
-            if str(data).startswith("task:"):
+            if str(data).startswith("pending:"):
+                self.selected_pending = str(data).split(":", 1)[1]
+                self.selected_task = None
+                self.selected_script = None
+                self.log_output(f"Selected queued task: {item.text(0).strip()}")
+            elif str(data).startswith("task:"):
                 self.selected_task = str(data).split(":", 1)[1]
+                self.selected_pending = None
                 self.selected_script = None
                 self.log_output(f"Selected task: {self.selected_task}")
                 self.show_task_output(self.selected_task)
             else:
                 self.selected_script = str(data)
                 self.selected_task = None
+                self.selected_pending = None
+                self.pane_stream.follow(None)
                 self.log_output(f"Selected script: {Path(self.selected_script).name}")
 
+    def on_session_window_changed(self, session: str, window_id: str):
+        """Re-attach the stream when the selected task switches window"""
+        if session == self.selected_task:
+            self.pane_stream.follow(session, reattach=True)
+
     def auto_refresh(self):
         """Auto-refresh handler (called every 2 seconds)"""
-        self.refresh_tasks()
-        if self.monitoring_active:
-            self.refresh_system_status()
+        if not self.session_watcher.active:
+            # Fallback polling when control mode is unavailable
+            self.refresh_tasks()
+        # /proc sampling is cheap enough to run every tick (feeds the history)
+        self.refresh_system_status()
+        self.executor.submit('queue', None, self.engine.queued,
+                             on_result=self.signals.update_queue.emit, latest_only=True)
+        if self.task_model is not None and len(self.task_model):
+            names = frozenset(self.task_model.sessions)
+            self.executor.submit('task_usage', None, lambda: self.engine.task_usage(names),
+                                 on_result=self.signals.update_task_usage.emit)
+        # Worker thread -> GUI thread hop, i.e. how long a queued signal waits for the event loop
+        self.executor.submit('probe', None, time.perf_counter,
+                             on_result=self.signals.delivery_probe.emit)
+
+    def update_task_usage(self, usage: dict):
+        """Show live per-task usage in the tree (main thread)"""
+        self.task_model.set_usage(usage)
+
+    def refresh_queue(self, queued: list):
+        """Rebuild the PENDING section (main thread)"""
+        self.pending_root.setText(0, f"▼ PENDING ({len(queued)})")
+        self.pending_root.setHidden(not queued)
+
+        current = [self.pending_root.child(i).data(0, Qt.ItemDataRole.UserRole)
+                   for i in range(self.pending_root.childCount())]
+        if current != [f"pending:#{task['id']}" for task in queued]:
+            self.pending_root.takeChildren()
+            for task in queued:
+                item = QTreeWidgetItem(self.pending_root)
+                item.setData(0, Qt.ItemDataRole.UserRole, f"pending:#{task['id']}")
+        for index, task in enumerate(queued):
+            item = self.pending_root.child(index)
+            item.setText(0, f"  ├─ ⏸ {task['name']} [{task['priority']}] "
+                            f"{task['wait']:.0f}s")
+            item.setToolTip(0, f"{task['name']} (#{task['id']})\nPriority: {task['priority']}\n"
+                               f"Exclusive: {task['exclusive']}\nWaiting: {task['wait']:.0f}s")
+        self.pending_root.setExpanded(True)
 
     # === Action Methods ===
 
@@ -607,74 +711,160 @@ class PhiLaunchControlCenter(QMainWindow):
             self.log_output("⚠ No script selected")
             return
 
-        script_path = Path(self.selected_script)
-        script_name = script_path.stem
+        script = self.selected_script
+        script_name = Path(script).stem
 
         self.log_output(f"🚀 Launching {script_name} in background...")
 
-        try:
-            # Use start-long-task.sh to run in tmux
-            launcher = self.automation_dir / "start-long-task.sh"
-            if launcher.exists():
-                subprocess.Popen([
-                    'bash',
-                    str(launcher),
-                    script_name,
-                    f'bash {script_path}'
-                ])
-                self.log_output(f"✓ Task '{script_name}' started in tmux session")
-                QTimer.singleShot(1000, self.refresh_tasks)
-            else:
-                # Direct execution
-                subprocess.Popen(['bash', str(script_path)])
-                self.log_output(f"✓ Script executed directly")
+        # Queued by the supervisor (PHILAUNCH_MAX_TASKS slots, priority, one
+        # run per exclusive key); runs under a pty with a tmux viewer on its log
+        self.executor.submit(
+            'run_script', script_name, lambda: self.engine.launch_script(script),
+            on_result=self._on_task_started,
+            on_error=lambda e: self.log_output(f"✗ Error: {e}"),
+        )
 
-        except Exception as e:
-            self.log_output(f"✗ Error: {str(e)}")
+    def _on_task_started(self, task: dict):
+        """Report a supervised launch (worker thread)"""
+        if task['state'] == 'pending':
+            self.log_output(f"⏸ Task '{task['name']}' queued (#{task['id']}, "
+                            f"{task['priority']} priority)")
+            self.executor.submit('queue', None, self.engine.queued,
+                                 on_result=self.signals.update_queue.emit, latest_only=True)
+            return
+        if task['state'] != 'running':
+            self.log_output(f"✗ Task '{task['name']}' {task['state']}: {task.get('error') or ''}")
+            return
+        self.log_output(f"✓ Task '{task['name']}' started (pid {task['pid']})")
+        self.log_output(f"  Log: {task['log']}")
+        if not task['tmux_session']:
+            self.log_output("  (no tmux viewer - tmux missing or session name taken)")
+        self.refresh_tasks()
 
     def stop_selected_task(self):
-        """Stop the selected tmux task"""
+        """Stop the selected tmux task, or cancel the selected queued one"""
+        if self.selected_pending:
+            queued = self.selected_pending
+            self.selected_pending = None
+            self.log_output(f"🔴 Cancelling queued task {queued}")
+            self.executor.submit(
+                'cancel_task', queued, lambda: self.engine.stop_task(queued),
+                on_result=lambda task: self.log_output(f"✓ Task '{task['name']}' cancelled"),
+                on_error=lambda e: self.log_output(f"✗ Error: {e}"))
+            return
         if not self.selected_task:
             self.log_output("⚠ No task selected")
             return
 
-        self.log_output(f"🔴 Stopping task: {self.selected_task}")
+        task = self.selected_task
+        self.log_output(f"🔴 Stopping task: {task}")
+        self.executor.submit('kill_task', task, lambda: self._kill_task(task))
 
+    def _kill_task(self, task: str):
+        """Stop a supervised task, or kill a plain tmux session, in background"""
         try:
-            subprocess.run(['tmux', 'kill-session', '-t', self.selected_task], timeout=5)
-            self.log_output(f"✓ Task '{self.selected_task}' stopped")
-            QTimer.singleShot(500, self.refresh_tasks)
+            self.engine.stop_task(task)
+            self.log_output(f"✓ Task '{task}' stopped")
+            self.refresh_tasks()
         except Exception as e:
             self.log_output(f"✗ Error: {str(e)}")
 
     def view_logs(self):
-        """View recent logs"""
-        self.log_output("📋 Fetching recent logs...")
-        threading.Thread(target=self._fetch_logs, daemon=True).start()
+        """Open the journal window (follows new entries while it is open)"""
+        if self.journal_panel is None:
+            self.journal_panel = JournalPanel()
+        self.log_output("📋 Following the system journal...")
+        self.journal_panel.show()
+        self.journal_panel.raise_()
+        self.journal_panel.activateWindow()
+
+    def show_debug_panel(self):
+        """Open the latency window (p50/p95/max per subprocess, job and slot)"""
+        if self.debug_panel is None:
+            self.debug_panel = DebugPanel(INSTRUMENTS, extra=lambda: {'executor': self.executor.stats()})
+        self.debug_panel.show()
+        self.debug_panel.raise_()
+        self.debug_panel.activateWindow()
+
+    def run_remote_status(self):
+        """home-control.sh status on the main host, over its pooled connection"""
+        self.log_output("🌐 Remote status check...")
+        self.executor.submit('remote', 'status', self._run_remote_status)
+
+    def _run_remote_status(self):
+        """Run the remote status check in background"""
+        try:
+            result = self.engine.run_remote('bash ~/automation/home-control.sh status', timeout=30)
+        except RemoteError as e:
+            self.signals.update_output.emit(f"✗ Remote: {e}\n")
+            return
+        except subprocess.TimeoutExpired:
+            self.signals.update_output.emit("✗ Remote status timed out\n")
+            return
+        self.signals.update_output.emit(
+            f"\n=== {result['host']} ({result['duration'] * 1000:.0f} ms) ===\n"
+            f"{result['stdout']}{result['stderr']}\n")
 
-    def _fetch_logs(self):
-        """Fetch logs in background"""
+    def run_script_on_hosts(self):
+        """Run the selected script on every configured host at once"""
+        if not self.selected_script:
+            self.log_output("⚠ No script selected")
+            return
+        hosts = list(self.engine.remote.hosts)
+        if not hosts:
+            self.log_output("⚠ No remote hosts configured (PHILAUNCH_SSH_CONN / PHILAUNCH_REMOTE_HOSTS)")
+            return
+
+        script_path = Path(self.selected_script)
+        self.log_output(f"🛰 Running {script_path.name} on {len(hosts)} hosts "
+                        f"({default_parallel()} at a time)...")
+        self.executor.submit('fanout', str(script_path),
+                             lambda: self._run_script_on_hosts(script_path, hosts))
+
+    def _run_script_on_hosts(self, script_path: Path, hosts: list):
+        """Fan the script out and stream host-prefixed output (worker thread)"""
+        width = max(map(len, hosts))
         try:
-            result = subprocess.run(
-                ['journalctl', '-n', '20', '--no-pager'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode == 0:
-                self.signals.update_output.emit(f"\n=== RECENT LOGS ===\n{result.stdout}\n")
-            else:
-                self.signals.update_output.emit("✗ Failed to fetch logs\n")
-        except Exception as e:
-            self.signals.update_output.emit(f"✗ Error: {str(e)}\n")
+            results = self.engine.fan_out_script(
+                str(script_path), hosts,
+                lambda host, stream, line: self.signals.update_output.emit(f"{host:<{width}} | {line}"))
+        except OSError as e:
+            self.signals.update_output.emit(f"✗ {e}\n")
+            return
+        self.signals.update_output.emit(
+            f"\n=== {script_path.name} on {len(hosts)} hosts ===\n{format_summary(results)}\n")
+
+    def search_output(self):
+        """Search the output archive; hits are listed in LIVE OUTPUT"""
+        query = self.search_edit.text().strip()
+        if not query:
+            return
+        self.executor.submit(
+            'search', query, lambda: self.engine.search_output(query),
+            on_result=lambda result: self.signals.show_output.emit(f"\n{format_results(result)}\n"),
+            on_error=lambda e: self.log_output(f"✗ Search: {e}"),
+            latest_only=True)
+
+    def pack_old_logs(self):
+        """Compress monitor and task logs not written for a day"""
+        self.log_output("📦 Packing logs idle for 24h...")
+        self.executor.submit(
+            'pack_logs', None, self.engine.pack_logs,
+            on_result=lambda results: self.signals.update_output.emit(
+                f"{format_pack_results(results)}\n"),
+            on_error=lambda e: self.log_output(f"✗ Error: {e}"))
 
     def restart_ssh(self):
         """Restart SSH server"""
         self.log_output("🔄 Restarting SSH server...")
+        self.executor.submit('restart_ssh', None, self._restart_ssh)
+
+    def _restart_ssh(self):
+        """Restart SSH server in background"""
         try:
             subprocess.run(['sudo', 'systemctl', 'restart', 'ssh'], timeout=10)
             self.log_output("✓ SSH server restarted")
-            QTimer.singleShot(1000, self.refresh_system_status)
+            self.signals.refresh_status.emit()
         except Exception as e:
             self.log_output(f"✗ Error: {str(e)}")
 
@@ -688,45 +878,19 @@ class PhiLaunchControlCenter(QMainWindow):
             self.log_output("⚠ PHONE-SHORTCUTS.md not found")
 
     def show_task_output(self, task_name: str):
-        """Show live output from tmux task"""
+        """Stream live output from tmux task (detaches the previous one)"""
         self.log_output(f"\n=== OUTPUT FROM: {task_name} ===\n")
-        threading.Thread(target=self._capture_task_output, args=(task_name,), daemon=True).start()
-
-    def _capture_task_output(self, task_name: str):
-        """Capture tmux task output"""
-        try:
-            result = subprocess.run(
-                ['tmux', 'capture-pane', '-pt', task_name, '-S', '-50'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                self.signals.update_output.emit(result.stdout + "\n")
-            else:
-                self.signals.update_output.emit(f"✗ Could not capture output from {task_name}\n")
-        except Exception as e:
-            self.signals.update_output.emit(f"✗ Error: {str(e)}\n")
+        self.pane_stream.follow(task_name)
 
     def run_status_check(self):
         """Run home-control.sh status"""
         self.log_output("📊 Running system status check...")
-        threading.Thread(target=self._run_status_check, daemon=True).start()
+        self.executor.submit('status_check', None, self._run_status_check)
 
     def _run_status_check(self):
         """Run status check in background"""
         try:
-            control_script = self.automation_dir / "home-control.sh"
-            if control_script.exists():
-                result = subprocess.run(
-                    ['bash', str(control_script), 'status'],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-                self.signals.update_output.emit(f"\n{result.stdout}\n")
-            else:
-                self.signals.update_output.emit("✗ home-control.sh not found\n")
+            self.signals.update_output.emit(f"\n{self.engine.status_report()}\n")
         except Exception as e:
             self.signals.update_output.emit(f"✗ Error: {str(e)}\n")
 
@@ -748,7 +912,6 @@ class PhiLaunchControlCenter(QMainWindow):
         self.load_scripts()
         self.refresh_tasks()
         self.refresh_system_status()
-        self.monitoring_active = True
         self.log_output("✓ Refresh complete")
 
     # === Helper Methods ===
@@ -758,12 +921,13 @@ class PhiLaunchControlCenter(QMainWindow):
         self.signals.update_output.emit(f"[{datetime.now().strftime('%H:%M:%S')}] {message}\n")
 
     def append_output(self, text: str):
-        """Append text to output area (must be called from main thread)"""
-        self.output_text.append(text)
-        self.output_text.verticalScrollBar().setValue(
-            self.output_text.verticalScrollBar().maximum()
-        )
-        self.status_label.setText(text.strip().split('\n')[-1][:80])
+        """Queue text for the output area and the archive (must be called from main thread)"""
+        self.output_text.append_text(text)
+        self.engine.archive_console(text)
+
+    def show_output(self, text: str):
+        """Queue text for the output area without archiving it (main thread)"""
+        self.output_text.append_text(text)
 
     def get_welcome_message(self) -> str:
         """Get welcome message"""
@@ -786,6 +950,29 @@ Quick Actions:
 
     # === Window Control Methods ===
 
+    def set_theme(self, name: str = DEFAULT_THEME):
+        """Swap the application theme at runtime (one stylesheet, one cascade)"""
+        apply_theme(QApplication.instance(), name)
+
+    def closeEvent(self, event):
+        """Stop the refresh timer and detach the tmux watcher and pane stream before closing"""
+        self.refresh_timer.stop()
+        self.session_watcher.stop()
+        self.engine.close()
+        self.pane_stream.close()
+        if self.journal_panel is not None:
+            self.journal_panel.close()
+        if self.debug_panel is not None:
+            self.debug_panel.close()
+        self.executor.shutdown(wait=False)
+        self.save_history()
+        try:
+            # Latest session's latencies; compare runs with philaunch_instrument.py diff
+            INSTRUMENTS.export(extra={'executor': self.executor.stats()})
+        except OSError:
+            pass
+        super().closeEvent(event)
+
     def toggle_maximize(self):
         """Toggle maximize/restore window"""
         if self.isMaximized():
@@ -813,17 +1000,28 @@ Quick Actions:
 
 def main():
     """Application entry point"""
-    app = QApplication(sys.argv)
-    app.setFont(QFont("Monospace", 10))
+    if '--profile-startup' in sys.argv:
+        sys.argv.remove('--profile-startup')
+        PROFILER.enabled = True
 
-    # Check X server
-    if 'DISPLAY' not in os.environ:
+    # Check X server (before QApplication, which aborts without a display)
+    if not os.environ.get('DISPLAY') and not os.environ.get('WAYLAND_DISPLAY'):
         print("Error: No X server detected!")
         print("WSL users: Ensure WSLg is installed or VcXsrv is running")
+        print(f"Without a display, use {Path(__file__).parent / 'philaunch_cli.py'} "
+              "(scripts, tasks, run, stop, status, logs)")
         sys.exit(1)
 
-    window = PhiLaunchControlCenter()
-    window.show()
+    with PROFILER.phase("QApplication"):
+        app = QApplication(sys.argv)
+        app.setFont(QFont("Monospace", 10))
+    with PROFILER.phase("apply_theme"):
+        apply_theme(app)
+
+    with PROFILER.phase("PhiLaunchControlCenter()"):
+        window = PhiLaunchControlCenter()
+    with PROFILER.phase("window.show"):
+        window.show()
 
     sys.exit(app.exec())
 
@@ -0,0 +1,151 @@
+"""
+PhiLaunch Metric History
+Fixed-size, array-backed ring buffers per metric with a compact on-disk snapshot
+"""
+
+import math
+import os
+import struct
+import time
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+SNAPSHOT_MAGIC = b'PLH1'
+_HEADER = struct.Struct('<H')              # name length
+_RING = struct.Struct('<IddI')             # capacity, interval, last_ts, count
+
+
+class MetricRing:
+    """
+    One metric sampled at a fixed interval.
+
+    Values live in a preallocated array('f'); gaps (missed ticks, GUI restarts)
+    are stored as NaN so every slot still maps to a point in time.
+    """
+
+    def __init__(self, capacity: int = 1800, interval: float = 2.0):
+        self.capacity = capacity
+        self.interval = interval
+        self._values = array('f', [math.nan]) * capacity
+        self._head = 0          # next slot to write
+        self._count = 0
+        self.last_ts = None
+
+    def __len__(self):
+        return self._count
+
+    def push(self, value: Optional[float], ts: Optional[float] = None):
+        """Record a value for `ts` (now), padding skipped ticks with NaN"""
+        ts = time.time() if ts is None else ts
+        if self.last_ts is not None:
+            steps = int(round((ts - self.last_ts) / self.interval))
+            if steps <= 0:
+                # Same tick - overwrite the newest slot
+                self._values[(self._head - 1) % self.capacity] = _nan(value)
+                return
+            for _ in range(min(steps - 1, self.capacity)):
+                self._append(math.nan)
+        self._append(_nan(value))
+        self.last_ts = ts
+
+    def values(self, seconds: Optional[float] = None) -> List[float]:
+        """Chronological values for the last `seconds` (all by default)"""
+        n = self._count
+        if seconds is not None:
+            n = min(n, max(1, int(seconds / self.interval)))
+        start = (self._head - n) % self.capacity
+        if start + n <= self.capacity:
+            return self._values[start:start + n].tolist()
+        return (self._values[start:] + self._values[:self._head]).tolist()
+
+    def stats(self, seconds: Optional[float] = None) -> Dict[str, Optional[float]]:
+        """min/max/avg over the window, ignoring gaps"""
+        present = [v for v in self.values(seconds) if not math.isnan(v)]
+        if not present:
+            return {'min': None, 'max': None, 'avg': None}
+        return {'min': min(present), 'max': max(present), 'avg': sum(present) / len(present)}
+
+    def _append(self, value: float):
+        self._values[self._head] = value
+        self._head = (self._head + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    # === Serialization ===
+
+    def to_bytes(self) -> bytes:
+        ordered = array('f', self.values())
+        return _RING.pack(self.capacity, self.interval, self.last_ts or 0.0,
+                          len(ordered)) + ordered.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: memoryview) -> Tuple['MetricRing', int]:
+        capacity, interval, last_ts, count = _RING.unpack_from(data)
+        offset = _RING.size
+        values = array('f')
+        values.frombytes(bytes(data[offset:offset + count * values.itemsize]))
+        ring = cls(capacity, interval)
+        for value in values[-capacity:]:
+            ring._append(value)
+        ring.last_ts = last_ts or None
+        return ring, offset + count * values.itemsize
+
+
+class MetricHistory:
+    """Named MetricRings plus snapshot save/load"""
+
+    def __init__(self, metrics: Iterable[str], capacity: int = 1800, interval: float = 2.0):
+        self.capacity = capacity
+        self.interval = interval
+        self.rings: Dict[str, MetricRing] = {name: MetricRing(capacity, interval) for name in metrics}
+
+    def __getitem__(self, name: str) -> MetricRing:
+        return self.rings[name]
+
+    def push(self, samples: Dict[str, Optional[float]], ts: Optional[float] = None):
+        ts = time.time() if ts is None else ts
+        for name, value in samples.items():
+            if name in self.rings:
+                self.rings[name].push(value, ts)
+
+    def save(self, path: Path):
+        """Write all rings atomically (a few KB per metric)"""
+        parts = [SNAPSHOT_MAGIC]
+        for name, ring in self.rings.items():
+            encoded = name.encode()
+            parts.append(_HEADER.pack(len(encoded)) + encoded + ring.to_bytes())
+        tmp = Path(str(path) + '.tmp')
+        tmp.write_bytes(b''.join(parts))
+        os.replace(tmp, path)
+
+    def load(self, path: Path) -> bool:
+        """Restore rings saved by save(); unknown or resized metrics are skipped"""
+        try:
+            data = memoryview(Path(path).read_bytes())
+        except OSError:
+            return False
+        if bytes(data[:4]) != SNAPSHOT_MAGIC:
+            return False
+
+        offset = 4
+        try:
+            while offset < len(data):
+                (length,) = _HEADER.unpack_from(data, offset)
+                offset += _HEADER.size
+                name = bytes(data[offset:offset + length]).decode()
+                offset += length
+                ring, used = MetricRing.from_bytes(data[offset:])
+                offset += used
+                if name in self.rings and ring.interval == self.interval:
+                    target = self.rings[name]
+                    for value in ring.values()[-target.capacity:]:
+                        target._append(value)
+                    target.last_ts = ring.last_ts
+        except (struct.error, UnicodeDecodeError):
+            return False
+        return True
+
+
+def _nan(value: Optional[float]) -> float:
+    return math.nan if value is None else float(value)
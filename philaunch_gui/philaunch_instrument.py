@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+PhiLaunch Instrumentation
+Latency histograms for subprocess calls, executor jobs and signal handlers
+
+Every operation name gets a log-bucketed histogram (8 buckets per doubling,
+1 µs to ~4 min, so percentiles are within ~9%); recording is one lock and
+a few arithmetic operations. Durations above the slow threshold
+(PHILAUNCH_SLOW_OP_MS, default 250) also go to `<state>/slow_ops.log`.
+Snapshots export as JSON, and `diff` compares two exports so a regression
+shows up as a p95 change.
+
+Usage:
+    philaunch_instrument.py report [FILE]        (default: <state>/instruments.json)
+    philaunch_instrument.py diff BEFORE AFTER [--min-change PCT]
+    philaunch_instrument.py slow [-n LINES]
+"""
+
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from philaunch_paths import state_dir
+
+
+EXPORT_FILE = 'instruments.json'
+SLOW_LOG_FILE = 'slow_ops.log'
+DEFAULT_SLOW_MS = 250.0
+BUCKETS_PER_DOUBLING = 8
+MIN_SECONDS = 1e-6
+BUCKET_COUNT = BUCKETS_PER_DOUBLING * 28  # Up to ~268 s
+
+
+def _bucket(seconds: float) -> int:
+    if seconds <= MIN_SECONDS:
+        return 0
+    return min(BUCKET_COUNT - 1, int(math.log2(seconds / MIN_SECONDS) * BUCKETS_PER_DOUBLING))
+
+
+def _bucket_limit(index: int) -> float:
+    return MIN_SECONDS * 2 ** ((index + 1) / BUCKETS_PER_DOUBLING)
+
+
+class Histogram:
+    """Counts per logarithmic bucket plus exact count, total and max"""
+
+    __slots__ = ('counts', 'count', 'total', 'max')
+
+    def __init__(self):
+        self.counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float):
+        self.counts[_bucket(seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, fraction: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * fraction))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(_bucket_limit(index), self.max)
+        return self.max
+
+    def summary(self) -> Dict:
+        return {
+            'count': self.count,
+            'p50_ms': round(self.percentile(0.50) * 1000, 3),
+            'p95_ms': round(self.percentile(0.95) * 1000, 3),
+            'max_ms': round(self.max * 1000, 3),
+            'mean_ms': round(self.total * 1000 / self.count, 3) if self.count else 0.0,
+            'total_ms': round(self.total * 1000, 1),
+        }
+
+
+class Instruments:
+    """
+    Named histograms shared by every thread.
+
+    `record` is the primitive; `timer` (context manager), `wrap` (callable)
+    and `slot` (Qt slot, same thing under a "slot:" name) build on it.
+    """
+
+    def __init__(self, slow_ms: Optional[float] = None, slow_log: Optional[Path] = None):
+        if slow_ms is None:
+            configured = os.environ.get('PHILAUNCH_SLOW_OP_MS', '')
+            try:
+                slow_ms = float(configured) if configured else DEFAULT_SLOW_MS
+            except ValueError:
+                slow_ms = DEFAULT_SLOW_MS
+        self.slow_seconds = slow_ms / 1000
+        self.slow_log = slow_log
+        self._slow_ops: deque = deque(maxlen=200)  # Most recent slow operations (under _lock)
+        self.started = time.time()
+        self._histograms: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    # === Recording ===
+
+    def record(self, name: str, seconds: float, detail: str = ''):
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.add(seconds)
+        if seconds >= self.slow_seconds:
+            self._slow(name, seconds, detail)
+
+    @contextmanager
+    def timer(self, name: str, detail: str = ''):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start, detail)
+
+    def wrap(self, name: str, fn: Callable) -> Callable:
+        @wraps(fn)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.record(name, time.perf_counter() - start)
+        return timed
+
+    def slot(self, fn: Callable, name: Optional[str] = None) -> Callable:
+        """A signal handler timed as `slot:<name>` (its __name__ by default)"""
+        return self.wrap(f"slot:{name or fn.__name__}", fn)
+
+    def _slow(self, name: str, seconds: float, detail: str):
+        entry = {'at': time.time(), 'op': name, 'ms': round(seconds * 1000, 1), 'detail': detail}
+        with self._lock:
+            self._slow_ops.append(entry)
+        if self.slow_log is None:
+            return
+        stamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(entry['at']))
+        try:
+            with open(self.slow_log, 'a') as f:
+                f.write(f"{stamp}  {entry['ms']:9.1f} ms  {name}"
+                        f"{'  ' + detail if detail else ''}\n")
+        except OSError:
+            pass
+
+    # === Reading ===
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """{name: {'count', 'p50_ms', 'p95_ms', 'max_ms', 'mean_ms', 'total_ms'}}"""
+        with self._lock:
+            return {name: histogram.summary() for name, histogram in sorted(self._histograms.items())}
+
+    def recent_slow(self) -> List[Dict]:
+        """Copy of the recent slow operations, oldest first (safe while workers record)"""
+        with self._lock:
+            return list(self._slow_ops)
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._slow_ops.clear()
+        self.started = time.time()
+
+    def export(self, path: Optional[Path] = None, extra: Optional[Dict] = None) -> Path:
+        """Write the snapshot (plus recent slow ops and `extra`) as JSON"""
+        path = Path(path) if path else state_dir() / EXPORT_FILE
+        document = {
+            'started': self.started,
+            'exported': time.time(),
+            'slow_threshold_ms': self.slow_seconds * 1000,
+            'operations': self.snapshot(),
+            'slow': self.recent_slow(),
+            **(extra or {}),
+        }
+        tmp = path.with_name(path.name + '.tmp')
+        tmp.write_text(json.dumps(document, indent=2))
+        os.replace(tmp, path)
+        return path
+
+
+INSTRUMENTS = Instruments()
+
+
+# === Subprocess hooks ===
+
+def command_label(args) -> str:
+    """`tmux list-sessions`, `bash home-control.sh`: program plus first non-option argument"""
+    if isinstance(args, (str, bytes)):
+        words = os.fsdecode(args).split()
+    else:
+        words = [os.fsdecode(word) for word in args]
+    if not words:
+        return '?'
+    label = [os.path.basename(words[0])]
+    for word in words[1:]:
+        if not word.startswith('-'):
+            label.append(os.path.basename(word) if '/' in word else word)
+            break
+    return ' '.join(label)[:60]
+
+
+_hooks_installed = False
+
+
+def install_subprocess_hooks(instruments: Instruments = INSTRUMENTS):
+    """
+    Time every subprocess this process starts: `run:<command>` for
+    subprocess.run (start to exit) and `spawn:<command>` for each Popen
+    (fork/exec only - long-lived children are not held against it).
+    """
+    global _hooks_installed
+    if _hooks_installed:
+        return
+    _hooks_installed = True
+    original_run = subprocess.run
+    original_popen = subprocess.Popen
+
+    class TimedPopen(original_popen):
+        def __init__(self, args, *rest, **kwargs):
+            start = time.perf_counter()
+            try:
+                super().__init__(args, *rest, **kwargs)
+            finally:
+                instruments.record(f"spawn:{command_label(args)}", time.perf_counter() - start)
+
+    @wraps(original_run)
+    def timed_run(*args, **kwargs):
+        command = args[0] if args else kwargs.get('args', '?')
+        start = time.perf_counter()
+        try:
+            return original_run(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            detail = command if isinstance(command, str) else ' '.join(map(os.fsdecode, command))
+            instruments.record(f"run:{command_label(command)}", elapsed, detail=detail[:200])
+
+    subprocess.Popen = TimedPopen
+    subprocess.run = timed_run
+
+
+# === Reports ===
+
+def format_table(operations: Dict[str, Dict]) -> str:
+    lines = [f"{'operation':<40} {'count':>7} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9} {'total s':>8}"]
+    for name, stats in sorted(operations.items(), key=lambda item: -item[1]['total_ms']):
+        lines.append(f"{name[:40]:<40} {stats['count']:>7} {stats['p50_ms']:>9.2f} "
+                     f"{stats['p95_ms']:>9.2f} {stats['max_ms']:>9.2f} {stats['total_ms'] / 1000:>8.2f}")
+    return '\n'.join(lines)
+
+
+def diff_exports(before: Dict, after: Dict, min_change: float = 20.0) -> List[Dict]:
+    """Operations whose p95 moved by at least `min_change` percent, worst first"""
+    changes = []
+    old, new = before.get('operations', {}), after.get('operations', {})
+    for name in sorted(set(old) | set(new)):
+        if name not in old or name not in new:
+            changes.append({'op': name, 'before': old.get(name, {}).get('p95_ms'),
+                            'after': new.get(name, {}).get('p95_ms'), 'change': None})
+            continue
+        was, now = old[name]['p95_ms'], new[name]['p95_ms']
+        change = (now - was) * 100 / was if was else 0.0
+        if abs(change) >= min_change:
+            changes.append({'op': name, 'before': was, 'after': now, 'change': change})
+    return sorted(changes, key=lambda c: -(c['change'] if c['change'] is not None else 0))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    report = sub.add_parser('report', help='table of an export')
+    report.add_argument('file', nargs='?', type=Path)
+
+    diff = sub.add_parser('diff', help='p95 changes between two exports')
+    diff.add_argument('before', type=Path)
+    diff.add_argument('after', type=Path)
+    diff.add_argument('--min-change', type=float, default=20.0, metavar='PCT')
+
+    slow = sub.add_parser('slow', help='tail of the slow operation log')
+    slow.add_argument('-n', '--lines', type=int, default=20)
+
+    args = parser.parse_args(argv)
+    try:
+        if args.command == 'report':
+            document = json.loads((args.file or state_dir() / EXPORT_FILE).read_text())
+            print(format_table(document['operations']))
+        elif args.command == 'diff':
+            changes = diff_exports(json.loads(args.before.read_text()),
+                                   json.loads(args.after.read_text()), args.min_change)
+            for change in changes:
+                if change['change'] is None:
+                    state = 'new' if change['before'] is None else 'gone'
+                    print(f"  {change['op']:<40} {state}")
+                else:
+                    print(f"  {change['op']:<40} p95 {change['before']:9.2f} -> "
+                          f"{change['after']:9.2f} ms ({change['change']:+.0f}%)")
+            if not changes:
+                print(f"No p95 change of {args.min_change:.0f}% or more")
+        else:
+            with open(state_dir() / SLOW_LOG_FILE) as f:
+                print(''.join(deque(f, maxlen=args.lines)), end='')
+    except (OSError, ValueError, KeyError) as e:
+        print(f"✗ {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+"""
+PhiLaunch Journal Follower
+Incremental journald reader (cursor + JSON output) with a file-backed stand-in
+
+The follower keeps one `journalctl --follow --output=json` child running and
+remembers the cursor of the last entry it delivered. If the child exits it is
+restarted with `--after-cursor`, so nothing is re-read or missed; unit and
+priority filters are passed to journalctl rather than applied here.
+
+Without systemd (or for tests) set PHILAUNCH_JOURNAL_FILE to a JSON-lines
+file: the follower then runs this module's `replay` command, which accepts
+the same journalctl options and applies them to the file.
+
+Usage:
+    philaunch_journal.py follow [-u UNIT] [-p PRIORITY] [-n LINES]
+    philaunch_journal.py replay --file FILE [journalctl options]
+    philaunch_journal.py write --file FILE [-u UNIT] [-p PRIORITY] MESSAGE...
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import select
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+
+PRIORITY_NAMES = ('emerg', 'alert', 'crit', 'err', 'warning', 'notice', 'info', 'debug')
+DEFAULT_PRIORITY = 6
+STAND_IN_ENV = 'PHILAUNCH_JOURNAL_FILE'
+
+
+# === Records ===
+
+def parse_record(line) -> Optional[Dict]:
+    """One `journalctl --output=json` line -> entry dict (None if unparseable)"""
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(record, dict):
+        return None
+
+    message = record.get('MESSAGE')
+    if isinstance(message, list):
+        # Non-UTF-8 payloads are exported as byte arrays
+        message = bytes(message).decode('utf-8', 'replace')
+    try:
+        priority = int(record.get('PRIORITY', DEFAULT_PRIORITY))
+    except (TypeError, ValueError):
+        priority = DEFAULT_PRIORITY
+    try:
+        stamp = int(record.get('__REALTIME_TIMESTAMP') or 0) / 1e6
+    except (TypeError, ValueError):
+        stamp = 0.0
+
+    unit = record.get('_SYSTEMD_UNIT') or record.get('UNIT') or ''
+    return {
+        'cursor': record.get('__CURSOR'),
+        'time': stamp,
+        'priority': priority,
+        'unit': unit,
+        'ident': record.get('SYSLOG_IDENTIFIER') or record.get('_COMM') or unit or 'kernel',
+        'pid': record.get('_PID') or record.get('SYSLOG_PID'),
+        'message': message if isinstance(message, str) else '',
+    }
+
+
+def format_entry(entry: Dict) -> str:
+    """Single-line `journalctl --output=short` style rendering"""
+    stamp = datetime.fromtimestamp(entry['time']).strftime('%b %d %H:%M:%S')
+    pid = f"[{entry['pid']}]" if entry['pid'] else ''
+    message = entry['message'].replace('\n', ' ↵ ')
+    return f"{stamp} {entry['ident']}{pid}: {message}"
+
+
+def parse_priority(value) -> Optional[range]:
+    """`err`, `3` or `warning..err` -> accepted priority numbers"""
+    if value is None or value == '':
+        return None
+
+    def level(text) -> int:
+        text = str(text).strip().lower()
+        if text.isdigit() and int(text) < len(PRIORITY_NAMES):
+            return int(text)
+        if text in PRIORITY_NAMES:
+            return PRIORITY_NAMES.index(text)
+        raise ValueError(f'unknown priority: {text}')
+
+    low, sep, high = str(value).partition('..')
+    if not sep:
+        return range(0, level(low) + 1)
+    first, last = sorted((level(low) if low else 0, level(high) if high else 7))
+    return range(first, last + 1)
+
+
+def journal_command(journalctl: Sequence[str], cursor: Optional[str] = None,
+                    units: Iterable[str] = (), priority: Optional[str] = None,
+                    lines: int = 200, follow: bool = True) -> List[str]:
+    """journalctl arguments: resume after `cursor`, or start from the last `lines`"""
+    command = list(journalctl) + ['--output=json', '--no-pager']
+    if follow:
+        command.append('--follow')
+    if cursor:
+        command.append(f'--after-cursor={cursor}')
+    else:
+        command.append(f'--lines={lines}')
+    command.extend(f'--unit={unit}' for unit in units)
+    if priority:
+        command.append(f'--priority={priority}')
+    return command
+
+
+def default_journalctl() -> List[str]:
+    """journalctl, or the replay stand-in when PHILAUNCH_JOURNAL_FILE is set"""
+    stand_in = os.environ.get(STAND_IN_ENV)
+    if stand_in:
+        return [sys.executable, str(Path(__file__).resolve()), 'replay', '--file', stand_in]
+    return ['journalctl']
+
+
+# === Follower ===
+
+class JournalFollower:
+    """
+    Streams journal entries to `on_entries(entries, reset)` in batches.
+
+    A worker thread reads the journalctl child's stdout and delivers at most
+    one batch per `batch_interval`. `reset` is True for the first batch of a
+    fresh read - the first start() or a set_filter(), possibly empty - so the
+    consumer can clear its view; a later start() resumes after the cursor.
+    When the child exits it is restarted from the last cursor after a
+    growing backoff; `on_error(message)` reports why.
+    """
+
+    def __init__(self, on_entries: Callable[[List[Dict], bool], None],
+                 on_error: Optional[Callable[[str], None]] = None,
+                 journalctl: Optional[Sequence[str]] = None,
+                 units: Iterable[str] = (), priority: Optional[str] = None,
+                 initial_lines: int = 200, batch_interval: float = 0.1,
+                 backoff: Sequence[float] = (1.0, 30.0)):
+        self.on_entries = on_entries
+        self.on_error = on_error
+        self.journalctl = list(journalctl) if journalctl else default_journalctl()
+        self.units = tuple(units)
+        self.priority = priority
+        self.initial_lines = initial_lines
+        self.batch_interval = batch_interval
+        self.backoff = backoff
+
+        self.cursor = None        # Cursor of the last delivered entry
+        self.delivered = 0
+        self._generation = 0      # Bumped by set_filter(); restarts the child
+        self._proc = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._wake_r, self._wake_w = os.pipe()
+
+    # === Public API ===
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._interrupt()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    def set_filter(self, units: Iterable[str] = (), priority: Optional[str] = None):
+        """Restart with new server-side filters (the view starts over)"""
+        with self._lock:
+            self.units = tuple(units)
+            self.priority = priority or None
+            self.cursor = None
+            self._generation += 1
+        self._interrupt()
+
+    # === Worker ===
+
+    def _interrupt(self):
+        with self._lock:
+            proc = self._proc
+        if proc is not None and proc.poll() is None:
+            proc.terminate()
+        try:
+            os.write(self._wake_w, b'x')
+        except OSError:
+            pass
+
+    def _run(self):
+        delay = self.backoff[0]
+        reset = self.cursor is None  # Resuming after stop() keeps the consumer's view
+        while not self._stop.is_set():
+            with self._lock:
+                generation = self._generation
+                command = journal_command(self.journalctl, self.cursor, self.units,
+                                          self.priority, self.initial_lines)
+            try:
+                proc = subprocess.Popen(command, stdout=subprocess.PIPE,
+                                        stderr=subprocess.PIPE, stdin=subprocess.DEVNULL)
+            except OSError as e:
+                self._report(f'{command[0]}: {e.strerror}')
+                self._pause(delay)
+                delay = min(delay * 2, self.backoff[1])
+                continue
+            with self._lock:
+                self._proc = proc
+
+            received = self._pump(proc, generation, reset)
+            reset = False
+            if proc.poll() is None:
+                proc.terminate()
+            try:
+                _, stderr = proc.communicate(timeout=2)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                _, stderr = proc.communicate()
+            with self._lock:
+                self._proc = None
+                restarted = generation != self._generation
+
+            if self._stop.is_set():
+                break
+            if restarted:
+                reset, delay = True, self.backoff[0]
+                continue
+            if received:
+                delay = self.backoff[0]
+            message = stderr.decode('utf-8', 'replace').strip().splitlines()
+            self._report(message[-1] if message else f'journal reader exited ({proc.returncode})')
+            self._pause(delay)
+            delay = min(delay * 2, self.backoff[1])
+
+    def _pump(self, proc: subprocess.Popen, generation: int, reset: bool) -> int:
+        """Read until EOF, stop or a filter change; returns entries delivered"""
+        fd = proc.stdout.fileno()
+        os.set_blocking(fd, False)
+        partial = b''
+        batch: List[Dict] = []
+        received = 0
+        flush_at = time.monotonic() + self.batch_interval
+        eof = False
+        while not eof and not self._stop.is_set() and generation == self._generation:
+            timeout = max(0.0, flush_at - time.monotonic()) if (batch or reset) else None
+            readable, _, _ = select.select([fd, self._wake_r], [], [], timeout)
+            if self._wake_r in readable:
+                os.read(self._wake_r, 64)
+            if fd in readable:
+                try:
+                    data = os.read(fd, 65536)
+                except BlockingIOError:
+                    data = None
+                if data == b'':
+                    eof = True
+                elif data:
+                    lines = (partial + data).split(b'\n')
+                    partial = lines.pop()
+                    for line in lines:
+                        entry = parse_record(line) if line.strip() else None
+                        if entry is not None:
+                            batch.append(entry)
+
+            if (batch or reset) and (eof or time.monotonic() >= flush_at):
+                received += self._deliver(batch, reset, generation)
+                batch, reset = [], False
+            if not batch:
+                flush_at = time.monotonic() + self.batch_interval
+        if batch:
+            received += self._deliver(batch, reset, generation)
+        return received
+
+    def _deliver(self, batch: List[Dict], reset: bool, generation: int) -> int:
+        with self._lock:
+            if generation != self._generation:
+                return 0  # Filter changed while reading; drop the stale batch
+            for entry in reversed(batch):
+                if entry['cursor']:
+                    self.cursor = entry['cursor']
+                    break
+            self.delivered += len(batch)
+        self.on_entries(batch, reset)
+        return len(batch)
+
+    def _report(self, message: str):
+        if self.on_error:
+            self.on_error(message)
+
+    def _pause(self, seconds: float):
+        readable, _, _ = select.select([self._wake_r], [], [], seconds)
+        if readable:
+            os.read(self._wake_r, 64)
+
+
+# === File stand-in ===
+
+def _unit_patterns(units: Iterable[str]) -> List[str]:
+    # journalctl -u appends .service to bare names
+    return [unit if '.' in unit or '*' in unit else f'{unit}.service' for unit in units]
+
+
+def _matches(record: Dict, patterns: List[str], priorities: Optional[range]) -> bool:
+    if patterns:
+        unit = record.get('_SYSTEMD_UNIT') or record.get('UNIT') or ''
+        if not any(fnmatch.fnmatchcase(unit, pattern) for pattern in patterns):
+            return False
+    if priorities is not None:
+        try:
+            return int(record.get('PRIORITY', DEFAULT_PRIORITY)) in priorities
+        except (TypeError, ValueError):
+            return False
+    return True
+
+
+def replay_journal(path: Path, out, after_cursor: Optional[str] = None,
+                   units: Iterable[str] = (), priority: Optional[str] = None,
+                   lines: Optional[int] = None, follow: bool = False,
+                   poll_interval: float = 0.2) -> int:
+    """
+    Emit the records of a JSON-lines journal file like `journalctl --output=json`.
+
+    Records without __CURSOR get one derived from their line number. With
+    `follow`, appended records are emitted as they arrive (a truncated file
+    is read again from the start).
+    """
+    patterns = _unit_patterns(units)
+    priorities = parse_priority(priority)
+    offset, number = 0, 0
+    seeking = after_cursor is not None
+    # Like journalctl: --follow alone starts from the last 10 entries
+    tail = lines if lines is not None else (10 if follow else None)
+
+    def read_new() -> List[str]:
+        nonlocal offset, number, seeking
+        try:
+            with open(path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size < offset:
+                    offset, number = 0, 0  # Truncated/rotated
+                f.seek(offset)
+                data = f.read()
+        except FileNotFoundError:
+            return []
+        end = data.rfind(b'\n') + 1
+        offset += end
+        emitted = []
+        for raw in data[:end].splitlines():
+            number += 1
+            try:
+                record = json.loads(raw)
+            except ValueError:
+                continue
+            if '__CURSOR' not in record:
+                record['__CURSOR'] = f's=philaunch;i={number:x}'
+                raw = json.dumps(record).encode()
+            if seeking:
+                seeking = record['__CURSOR'] != after_cursor
+                continue
+            if _matches(record, patterns, priorities):
+                emitted.append(raw.decode('utf-8', 'replace'))
+        return emitted
+
+    first = read_new()
+    if seeking and after_cursor is not None:
+        print(f'Failed to seek to cursor: {after_cursor}', file=sys.stderr)
+        return 1
+    if tail is not None and after_cursor is None:
+        first = first[-tail:] if tail else []
+    for line in first:
+        out.write(line + '\n')
+    out.flush()
+
+    while follow:
+        time.sleep(poll_interval)
+        fresh = read_new()
+        if fresh:
+            out.write('\n'.join(fresh) + '\n')
+            out.flush()
+    return 0
+
+
+def write_record(path: Path, message: str, unit: str = 'philaunch.service',
+                 priority: int = DEFAULT_PRIORITY, ident: Optional[str] = None):
+    """Append one record to a stand-in journal"""
+    record = {
+        '__REALTIME_TIMESTAMP': str(int(time.time() * 1e6)),
+        'PRIORITY': str(priority),
+        '_SYSTEMD_UNIT': unit,
+        'SYSLOG_IDENTIFIER': ident or unit.rsplit('.', 1)[0],
+        '_PID': str(os.getpid()),
+        'MESSAGE': message,
+    }
+    with open(path, 'a') as f:
+        f.write(json.dumps(record) + '\n')
+
+
+# === CLI ===
+
+def _journal_options(parser: argparse.ArgumentParser):
+    parser.add_argument('-u', '--unit', action='append', default=[])
+    parser.add_argument('-p', '--priority')
+    parser.add_argument('-n', '--lines', type=int)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    follow = sub.add_parser('follow', help='print entries as the follower receives them')
+    _journal_options(follow)
+
+    replay = sub.add_parser('replay', help='journalctl stand-in over a JSON-lines file')
+    replay.add_argument('--file', required=True, type=Path)
+    replay.add_argument('-o', '--output', default='json', choices=['json'])
+    replay.add_argument('--no-pager', action='store_true')
+    replay.add_argument('-f', '--follow', action='store_true')
+    replay.add_argument('--after-cursor')
+    _journal_options(replay)
+
+    write = sub.add_parser('write', help='append a record to a stand-in journal')
+    write.add_argument('--file', required=True, type=Path)
+    write.add_argument('-u', '--unit', default='philaunch.service')
+    write.add_argument('-p', '--priority', default=str(DEFAULT_PRIORITY))
+    write.add_argument('message', nargs='+')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'replay':
+        try:
+            parse_priority(args.priority)
+            return replay_journal(args.file, sys.stdout, args.after_cursor, args.unit,
+                                  args.priority, args.lines, args.follow)
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            return 1
+        except (BrokenPipeError, KeyboardInterrupt):
+            return 0
+
+    if args.command == 'write':
+        level = parse_priority(args.priority)
+        write_record(args.file, ' '.join(args.message), _unit_patterns([args.unit])[0],
+                     level[-1] if level else DEFAULT_PRIORITY)
+        return 0
+
+    follower = JournalFollower(
+        lambda entries, reset: print('\n'.join(map(format_entry, entries)), flush=True)
+        if entries else None,
+        on_error=lambda message: print(f'! {message}', file=sys.stderr),
+        units=args.unit, priority=args.priority,
+        initial_lines=args.lines if args.lines is not None else 20)
+    follower.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        follower.stop()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,162 @@
+"""
+PhiLaunch Journal View
+Virtualized journal window: a list model over the entries, filters applied by journalctl
+"""
+
+from typing import Dict, List, Optional
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, Qt, pyqtSignal
+from PyQt6.QtGui import QColor, QFont
+from PyQt6.QtWidgets import (
+    QComboBox, QHBoxLayout, QLabel, QLineEdit, QListView, QPushButton, QVBoxLayout, QWidget
+)
+
+from philaunch_colors import COLORS
+from philaunch_journal import PRIORITY_NAMES, JournalFollower, format_entry
+from philaunch_theme import tag
+
+
+# Priority -> text color (everything at notice and below uses the default)
+PRIORITY_COLORS = {0: 'error', 1: 'error', 2: 'error', 3: 'error', 4: 'warning'}
+
+
+class JournalModel(QAbstractListModel):
+    """
+    Journal entries as list rows.
+
+    Rows are only formatted when the view asks for them, so the cost of a
+    refresh follows the number of visible rows, not the number held. At most
+    `max_entries` are kept; the oldest are dropped in one block.
+    """
+
+    def __init__(self, max_entries: int = 100_000, parent=None):
+        super().__init__(parent)
+        self.max_entries = max_entries
+        self.entries: List[Dict] = []
+        self._colors = {priority: QColor(COLORS[key]) for priority, key in PRIORITY_COLORS.items()}
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.entries)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self.entries[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return format_entry(entry)
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self._colors.get(entry['priority'])
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return (f"{entry['unit'] or entry['ident']} · {PRIORITY_NAMES[entry['priority']]}\n"
+                    f"{entry['message']}")
+        return None
+
+    def append(self, entries: List[Dict]):
+        """Add a batch at the end, dropping the oldest rows past max_entries"""
+        if not entries:
+            return
+        entries = entries[-self.max_entries:]
+        overflow = len(self.entries) + len(entries) - self.max_entries
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            del self.entries[:overflow]
+            self.endRemoveRows()
+        first = len(self.entries)
+        self.beginInsertRows(QModelIndex(), first, first + len(entries) - 1)
+        self.entries.extend(entries)
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self.entries = []
+        self.endResetModel()
+
+
+class JournalPanel(QWidget):
+    """
+    Journal window opened by VIEW LOGS.
+
+    Unit and priority filters restart the follower with new journalctl
+    arguments; the list keeps following the newest entry while scrolled to
+    the bottom.
+    """
+
+    entries_ready = pyqtSignal(list, bool)  # (entries, reset) from the follower thread
+    error = pyqtSignal(str)
+
+    def __init__(self, max_entries: int = 100_000, initial_lines: int = 500,
+                 journalctl: Optional[List[str]] = None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("PhiLaunch Journal")
+        self.resize(1000, 600)
+        tag(self, surface="panel")
+
+        self.model = JournalModel(max_entries, self)
+        self.follower = JournalFollower(self.entries_ready.emit, on_error=self.error.emit,
+                                        journalctl=journalctl, initial_lines=initial_lines)
+        self.entries_ready.connect(self._on_entries)
+        self.error.connect(lambda message: self.count_label.setText(f"⚠ {message}"))
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(10, 10, 10, 10)
+
+        # Filter bar
+        bar = QHBoxLayout()
+        header = tag(QLabel("📋 JOURNAL"), "header")
+        header.setFont(QFont("Monospace", 11, QFont.Weight.Bold))
+        bar.addWidget(header)
+
+        self.unit_edit = QLineEdit()
+        self.unit_edit.setPlaceholderText("units (ssh, cron, ...)")
+        self.unit_edit.returnPressed.connect(self.apply_filter)
+        bar.addWidget(self.unit_edit, 1)
+
+        self.priority_box = QComboBox()
+        self.priority_box.addItem("all priorities", None)
+        for name in PRIORITY_NAMES[:-1]:
+            self.priority_box.addItem(f"{name} and above", name)
+        self.priority_box.currentIndexChanged.connect(self.apply_filter)
+        bar.addWidget(self.priority_box)
+
+        apply_button = tag(QPushButton("APPLY"), "quickAction", tone="info")
+        apply_button.clicked.connect(self.apply_filter)
+        bar.addWidget(apply_button)
+
+        self.count_label = tag(QLabel(""), "indicatorName")
+        bar.addWidget(self.count_label)
+        layout.addLayout(bar)
+
+        # Only visible rows are laid out and painted
+        self.view = QListView()
+        self.view.setObjectName("journalView")
+        self.view.setModel(self.model)
+        self.view.setUniformItemSizes(True)
+        self.view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.view.setBatchSize(500)
+        self.view.setFont(QFont("Monospace", 9))
+        self.view.setSelectionMode(QListView.SelectionMode.ExtendedSelection)
+        layout.addWidget(self.view)
+
+    # === Follower ===
+
+    def apply_filter(self):
+        units = [unit.strip() for unit in self.unit_edit.text().replace(',', ' ').split()]
+        self.follower.set_filter(units, self.priority_box.currentData())
+
+    def _on_entries(self, entries: list, reset: bool):
+        bar = self.view.verticalScrollBar()
+        following = reset or bar.value() >= bar.maximum() - 1
+        if reset:
+            self.model.clear()
+        self.model.append(entries)
+        if following:
+            self.view.scrollToBottom()
+        self.count_label.setText(f"{len(self.model.entries):,} entries")
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.follower.start()
+
+    def closeEvent(self, event):
+        self.follower.stop()
+        super().closeEvent(event)
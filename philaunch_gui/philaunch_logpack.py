@@ -0,0 +1,543 @@
+#!/usr/bin/env python3
+"""
+PhiLaunch Log Packs
+Compressed task/monitor logs in independently decodable blocks with a seek index
+
+A pack (`name.logz`, next to the `name.log` it replaces) is a sequence of
+zlib blocks of whole lines (~64 KiB of text each) followed by an index with,
+per block, its file offset, first line number, line count and time range.
+Reading lines N..M, the last N lines or a time window decompresses only the
+blocks that overlap it. Line times come from a leading `[YYYY-mm-dd HH:MM:SS]`
+(or ISO) stamp; lines without one inherit the previous line's time.
+
+Layout:  MAGIC | block... | index (BLOCK_ENTRY each) | TRAILER
+
+The module-level readers (tail_lines, read_lines, read_between) accept either
+a plain .log or a pack, so callers don't care which one is on disk.
+
+Usage:
+    philaunch_logpack.py pack [--keep] [--older-than HOURS] PATH...
+    philaunch_logpack.py cat FILE [--lines A:B] [--since TIME] [--until TIME]
+    philaunch_logpack.py tail [-n LINES] [--dashboard] FILE...
+    philaunch_logpack.py info FILE...
+"""
+
+import argparse
+import json
+import os
+import re
+import struct
+import sys
+import time
+import zlib
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+MAGIC = b'PHLOGZ\x00\x01'
+PACK_SUFFIX = '.logz'
+BLOCK_SIZE = 64 * 1024
+BLOCK_ENTRY = struct.Struct('<QIQIdd')  # offset, compressed size, first line, lines, first ts, last ts
+TRAILER = struct.Struct('<QIIQ8s')  # index offset, blocks, crc32 of the text, text bytes, MAGIC
+STAMP = re.compile(rb'^\s*\[?(\d{4}-\d{2}-\d{2}[ T]\d{2}):(\d{2}):(\d{2})')
+NAME_STAMP = re.compile(r'(\d{8})(?:-(\d{6}))?')
+
+
+class LogPackError(Exception):
+    """Not a pack, or a damaged one"""
+
+
+_HOURS: Dict[bytes, Optional[float]] = {}  # b'YYYY-mm-dd HH' -> local epoch of that hour
+
+
+def line_time(line: bytes, previous: Optional[float]) -> Optional[float]:
+    """Leading timestamp of a line (local time), else `previous`"""
+    match = STAMP.match(line)
+    if not match:
+        return previous
+    hour, minutes, seconds = match.groups()
+    start = _HOURS.get(hour, -1.0)
+    if start == -1.0:
+        # mktime once per hour of log rather than once per line
+        try:
+            start = time.mktime(time.strptime(hour[:10].decode() + ' ' + hour[11:].decode(),
+                                              '%Y-%m-%d %H'))
+        except ValueError:
+            start = None
+        if len(_HOURS) > 100000:
+            _HOURS.clear()
+        _HOURS[hour] = start
+    if start is None:
+        return previous
+    return start + int(minutes) * 60 + int(seconds)
+
+
+def name_time(path: Path) -> float:
+    """Start time implied by a log name (`..._20261013.log`, `...-20261013-210411.log`), else 0"""
+    match = NAME_STAMP.search(path.name)
+    if not match:
+        return 0.0
+    try:
+        return time.mktime(time.strptime(match.group(1) + (match.group(2) or '000000'),
+                                         '%Y%m%d%H%M%S'))
+    except ValueError:
+        return 0.0
+
+
+# === Writing ===
+
+class LogPackWriter:
+    """
+    Streams lines into a new pack. The file is written as `<path>.tmp` and
+    renamed by close(), so a reader never sees a pack without its index.
+    """
+
+    def __init__(self, path: Path, block_size: int = BLOCK_SIZE, level: int = 6,
+                 start_time: float = 0.0):
+        self.path = Path(path)
+        self.block_size = block_size
+        self.level = level
+        self._tmp = self.path.with_name(self.path.name + '.tmp')
+        self._file = open(self._tmp, 'wb')
+        self._file.write(MAGIC)
+        self._index = []
+        self._lines: List[bytes] = []
+        self._partial = b''  # Unterminated last line (kept as-is, without a newline)
+        self._size = 0
+        self._first_line = 0
+        self._time = start_time
+        self._block_start = start_time
+        self._crc = 0
+        self.text_bytes = 0
+        self.line_count = 0
+
+    def write(self, data: bytes):
+        """Raw log bytes; lines may be split across calls"""
+        pieces = (self._partial + data).split(b'\n')
+        self._partial = pieces.pop()
+        for piece in pieces:
+            self._add(piece + b'\n')
+
+    def _add(self, line: bytes):
+        self._lines.append(line)
+        self._size += len(line)
+        if self._size >= self.block_size:
+            self._flush_block()
+
+    def _flush_block(self):
+        if not self._lines:
+            return
+        # Stamps only matter at block edges: the block starts at the time
+        # inherited from the previous one and ends at its last stamped line
+        self._block_start = self._time
+        for line in reversed(self._lines):
+            stamp = line_time(line, None)
+            if stamp is not None:
+                self._time = stamp
+                break
+        text = b''.join(self._lines)
+        data = zlib.compress(text, self.level)
+        self._index.append(BLOCK_ENTRY.pack(self._file.tell(), len(data), self._first_line,
+                                            len(self._lines), self._block_start, self._time))
+        self._file.write(data)
+        self._crc = zlib.crc32(text, self._crc)
+        self.text_bytes += len(text)
+        self._first_line += len(self._lines)
+        self.line_count = self._first_line
+        self._lines = []
+        self._size = 0
+
+    def close(self):
+        if self._partial:
+            self._add(self._partial)
+            self._partial = b''
+        self._flush_block()
+        index_offset = self._file.tell()
+        self._file.write(b''.join(self._index))
+        self._file.write(TRAILER.pack(index_offset, len(self._index), self._crc,
+                                      self.text_bytes, MAGIC))
+        self._file.close()
+        os.replace(self._tmp, self.path)
+
+    def abort(self):
+        self._file.close()
+        try:
+            self._tmp.unlink()
+        except FileNotFoundError:
+            pass
+
+
+# === Reading ===
+
+class LogPack:
+    """Random access to a pack: line ranges, tail and time windows"""
+
+    def __init__(self, path: Path, cache_blocks: int = 8):
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        try:
+            size = self._file.seek(0, 2)
+            if size < len(MAGIC) + TRAILER.size:
+                raise LogPackError(f'{self.path}: too short for a log pack')
+            self._file.seek(size - TRAILER.size)
+            index_offset, count, self.crc, self.text_bytes, magic = \
+                TRAILER.unpack(self._file.read(TRAILER.size))
+            if magic != MAGIC:
+                raise LogPackError(f'{self.path}: not a log pack (or not closed)')
+            self._file.seek(index_offset)
+            raw = self._file.read(count * BLOCK_ENTRY.size)
+        except BaseException:
+            self._file.close()
+            raise
+        self.blocks = [BLOCK_ENTRY.unpack_from(raw, i * BLOCK_ENTRY.size) for i in range(count)]
+        self.line_count = self.blocks[-1][2] + self.blocks[-1][3] if self.blocks else 0
+        self.packed_bytes = size
+        self._cache: 'OrderedDict[int, List[bytes]]' = OrderedDict()
+        self._cache_blocks = cache_blocks
+
+    def __len__(self):
+        return self.line_count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._file.close()
+
+    def time_range(self) -> Tuple[float, float]:
+        if not self.blocks:
+            return (0.0, 0.0)
+        return (self.blocks[0][4], self.blocks[-1][5])
+
+    def block(self, number: int) -> List[bytes]:
+        """Lines of one block (with their newlines), decompressed on demand"""
+        lines = self._cache.get(number)
+        if lines is not None:
+            self._cache.move_to_end(number)
+            return lines
+        offset, size = self.blocks[number][:2]
+        self._file.seek(offset)
+        try:
+            text = zlib.decompress(self._file.read(size))
+        except zlib.error as e:
+            raise LogPackError(f'{self.path}: block {number} is damaged ({e})')
+        pieces = text.split(b'\n')  # Not splitlines(): a \r is part of its line
+        lines = [piece + b'\n' for piece in pieces[:-1]] + ([pieces[-1]] if pieces[-1] else [])
+        self._cache[number] = lines
+        while len(self._cache) > self._cache_blocks:
+            self._cache.popitem(last=False)
+        return lines
+
+    def _block_for_line(self, line: int) -> int:
+        low, high = 0, len(self.blocks) - 1
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self.blocks[middle][2] <= line:
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+    def lines(self, start: int = 0, stop: Optional[int] = None) -> List[bytes]:
+        """Lines [start, stop), like a slice (negative indexes count from the end)"""
+        start, stop, _ = slice(start, stop).indices(self.line_count)
+        result = []
+        number = self._block_for_line(start) if start < stop else len(self.blocks)
+        while start < stop and number < len(self.blocks):
+            first = self.blocks[number][2]
+            block = self.block(number)
+            result.extend(block[start - first:stop - first])
+            start = first + len(block)
+            number += 1
+        return result
+
+    def tail(self, count: int) -> List[bytes]:
+        return self.lines(max(0, self.line_count - count)) if count > 0 else []
+
+    def between(self, since: Optional[float] = None,
+                until: Optional[float] = None) -> Iterator[Tuple[float, bytes]]:
+        """(time, line) for lines stamped in [since, until]; skips blocks outside it"""
+        for number, entry in enumerate(self.blocks):
+            first_ts, last_ts = entry[4], entry[5]
+            if (since is not None and last_ts < since) or (until is not None and first_ts > until):
+                continue
+            stamp = first_ts
+            for line in self.block(number):
+                stamp = line_time(line, stamp)
+                if (since is None or stamp >= since) and (until is None or stamp <= until):
+                    yield stamp, line
+
+    def verify(self) -> bool:
+        """Decompress everything and compare with the checksum taken while packing"""
+        crc, size = 0, 0
+        for number in range(len(self.blocks)):
+            offset, length = self.blocks[number][:2]
+            self._file.seek(offset)
+            text = zlib.decompress(self._file.read(length))
+            crc = zlib.crc32(text, crc)
+            size += len(text)
+        return crc == self.crc and size == self.text_bytes
+
+
+# === Plain or packed ===
+
+def is_pack(path: Path) -> bool:
+    return Path(path).suffix == PACK_SUFFIX
+
+
+def resolve(path: Path) -> Path:
+    """The file holding a log: itself, or its pack once it has been converted"""
+    path = Path(path)
+    if not path.exists() and not is_pack(path):
+        packed = path.with_suffix(PACK_SUFFIX)
+        if packed.exists():
+            return packed
+    return path
+
+
+def _text(line: bytes) -> str:
+    """A line without its newline; a CRLF ending (pty output) counts as one newline"""
+    if line.endswith(b'\n'):
+        line = line[:-1]
+    if line.endswith(b'\r'):
+        line = line[:-1]
+    return line.decode('utf-8', 'replace')
+
+
+def _split(data: bytes) -> List[str]:
+    """Lines split on \\n only, like a pack (an inner \\r stays in its line)"""
+    pieces = data.split(b'\n')
+    if pieces[-1] == b'':
+        pieces.pop()
+    return [_text(piece) for piece in pieces]
+
+
+def tail_lines(path: Path, count: int) -> List[str]:
+    """Last `count` lines of a plain log (read backwards) or a pack"""
+    path = resolve(path)
+    if is_pack(path):
+        with LogPack(path) as pack:
+            return [_text(line) for line in pack.tail(count)]
+    with open(path, 'rb') as f:
+        end = f.seek(0, 2)
+        position, data = end, b''
+        while position > 0 and data.count(b'\n') <= count:
+            step = min(BLOCK_SIZE, position)
+            position -= step
+            f.seek(position)
+            data = f.read(step) + data
+    lines = _split(data)
+    return lines[-count:] if count > 0 else []
+
+
+def read_lines(path: Path, start: int = 0, stop: Optional[int] = None) -> List[str]:
+    """Lines [start, stop) of a plain log or a pack"""
+    path = resolve(path)
+    if is_pack(path):
+        with LogPack(path) as pack:
+            return [_text(line) for line in pack.lines(start, stop)]
+    with open(path, 'rb') as f:
+        lines = _split(f.read())
+    return lines[start:stop]
+
+
+def read_between(path: Path, since: Optional[float] = None,
+                 until: Optional[float] = None) -> List[Tuple[float, str]]:
+    """(time, line) for lines in a time window, from a plain log or a pack"""
+    path = resolve(path)
+    if is_pack(path):
+        with LogPack(path) as pack:
+            return [(stamp, _text(line))
+                    for stamp, line in pack.between(since, until)]
+    result, stamp = [], name_time(path)
+    with open(path, 'rb') as f:
+        for line in f:
+            stamp = line_time(line, stamp)
+            if (since is None or stamp >= since) and (until is None or stamp <= until):
+                result.append((stamp, _text(line)))
+    return result
+
+
+def log_info(path: Path) -> Dict:
+    """{'path', 'packed', 'lines', 'bytes', 'text_bytes', 'first', 'last'} (lines: None if plain)"""
+    path = resolve(path)
+    if is_pack(path):
+        with LogPack(path) as pack:
+            first, last = pack.time_range()
+            return {'path': str(path), 'packed': True, 'lines': len(pack),
+                    'bytes': pack.packed_bytes, 'text_bytes': pack.text_bytes,
+                    'first': first, 'last': last}
+    stat = path.stat()
+    return {'path': str(path), 'packed': False, 'lines': None, 'bytes': stat.st_size,
+            'text_bytes': stat.st_size, 'first': name_time(path), 'last': stat.st_mtime}
+
+
+# === Converter ===
+
+def pack_file(source: Path, keep: bool = False, level: int = 6) -> Dict:
+    """
+    Convert one plain log to `<stem>.logz`. The source is only removed after
+    the pack has been read back and its checksum matches.
+    """
+    source = Path(source)
+    target = source.with_suffix(PACK_SUFFIX)
+    writer = LogPackWriter(target, level=level, start_time=name_time(source))
+    try:
+        with open(source, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                writer.write(chunk)
+        writer.close()
+    except BaseException:
+        writer.abort()
+        raise
+    with LogPack(target) as pack:
+        if not pack.verify() or pack.text_bytes != source.stat().st_size:
+            target.unlink()
+            raise LogPackError(f'{source}: pack did not verify; original kept')
+        packed = pack.packed_bytes
+    if not keep:
+        source.unlink()
+    return {'source': str(source), 'pack': str(target), 'lines': writer.line_count,
+            'bytes_in': writer.text_bytes, 'bytes_out': packed}
+
+
+def pack_logs(paths: Iterable[Path], older_than: float = 86400.0, keep: bool = False,
+              exclude: Iterable[str] = (), min_size: int = 4096) -> List[Dict]:
+    """
+    Pack every `*.log` under the given files/directories that has not been
+    written for `older_than` seconds (logs still being appended stay plain)
+    and is big enough to gain from it. Failures are reported per file as
+    {'source', 'error'}.
+    """
+    excluded = {str(Path(path)) for path in exclude}
+    now = time.time()
+    results = []
+    for path in map(Path, paths):
+        candidates = sorted(path.glob('*.log')) if path.is_dir() else [path]
+        for source in candidates:
+            if str(source) in excluded or not source.is_file():
+                continue
+            try:
+                stat = source.stat()
+                if now - stat.st_mtime < older_than or stat.st_size < min_size:
+                    continue
+                results.append(pack_file(source, keep=keep))
+            except (OSError, LogPackError) as e:
+                results.append({'source': str(source), 'error': str(e)})
+    return results
+
+
+def format_pack_results(results: List[Dict]) -> str:
+    lines = []
+    total_in = total_out = 0
+    for result in results:
+        name = Path(result['source']).name
+        if 'error' in result:
+            lines.append(f"✗ {name}: {result['error']}")
+            continue
+        total_in += result['bytes_in']
+        total_out += result['bytes_out']
+        ratio = result['bytes_out'] / result['bytes_in'] if result['bytes_in'] else 1.0
+        lines.append(f"✓ {name}: {result['lines']} lines, {result['bytes_in'] / 1e3:.0f} kB"
+                     f" -> {result['bytes_out'] / 1e3:.0f} kB ({ratio:.0%})")
+    if total_in:
+        lines.append(f"Saved {(total_in - total_out) / 1e6:.1f} MB")
+    return '\n'.join(lines) or 'Nothing to pack'
+
+
+def dashboard_logs(paths: Iterable[Path], count: int = 5) -> Dict:
+    """The dashboard's api/logs.json: last lines of each log, stamp split from message"""
+    entries = []
+    for path in paths:
+        try:
+            lines = tail_lines(Path(path), count)
+        except (OSError, LogPackError):
+            continue
+        for line in lines:
+            if not line.strip():
+                continue
+            match = re.match(r'^\s*\[([^\]]+)\]\s*(.*)$', line)
+            entries.append({'timestamp': match.group(1) if match else '',
+                            'message': match.group(2) if match else line.strip()})
+    return {'logs': entries, 'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())}
+
+
+def _parse_time(text: str) -> float:
+    """Epoch seconds or 'YYYY-mm-dd[ HH:MM[:SS]]'"""
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    for layout in ('%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M', '%Y-%m-%d'):
+        try:
+            return time.mktime(time.strptime(text, layout))
+        except ValueError:
+            continue
+    raise argparse.ArgumentTypeError(f'not a time: {text}')
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    pack = sub.add_parser('pack', help='convert plain logs (files or directories) to packs')
+    pack.add_argument('paths', nargs='+', type=Path)
+    pack.add_argument('--keep', action='store_true', help='keep the plain logs')
+    pack.add_argument('--older-than', type=float, default=24.0, metavar='HOURS',
+                      help='skip logs written more recently (default 24)')
+
+    cat = sub.add_parser('cat', help='print lines of a log or pack')
+    cat.add_argument('file', type=Path)
+    cat.add_argument('--lines', help='A:B line slice (0-based, end exclusive)')
+    cat.add_argument('--since', type=_parse_time)
+    cat.add_argument('--until', type=_parse_time)
+
+    tail = sub.add_parser('tail', help='last lines of logs or packs')
+    tail.add_argument('files', nargs='+', type=Path)
+    tail.add_argument('-n', '--lines', type=int, default=10)
+    tail.add_argument('--dashboard', action='store_true', help="the dashboard's logs.json")
+
+    info = sub.add_parser('info', help='lines, sizes and time range')
+    info.add_argument('files', nargs='+', type=Path)
+
+    args = parser.parse_args(argv)
+    try:
+        if args.command == 'pack':
+            print(format_pack_results(pack_logs(args.paths, args.older_than * 3600, args.keep)))
+        elif args.command == 'cat':
+            if args.since is not None or args.until is not None:
+                lines = [line for _, line in read_between(args.file, args.since, args.until)]
+            else:
+                start, _, stop = (args.lines or '').partition(':')
+                lines = read_lines(args.file, int(start or 0), int(stop) if stop else None)
+            print('\n'.join(lines))
+        elif args.command == 'tail':
+            if args.dashboard:
+                print(json.dumps(dashboard_logs(args.files, args.lines), indent=2))
+            else:
+                for path in args.files:
+                    print('\n'.join(tail_lines(path, args.lines)))
+        else:
+            for path in args.files:
+                entry = log_info(path)
+                span = ' - '.join(datetime.fromtimestamp(t).strftime('%Y-%m-%d %H:%M')
+                                  for t in (entry['first'], entry['last']) if t)
+                lines = '?' if entry['lines'] is None else entry['lines']
+                ratio = entry['bytes'] / entry['text_bytes'] if entry['text_bytes'] else 1.0
+                print(f"{entry['path']}: {lines} lines, {entry['bytes'] / 1e3:.0f} kB "
+                      f"({ratio:.0%} of text), {span or 'no timestamps'}")
+    except BrokenPipeError:
+        return 0
+    except (OSError, LogPackError) as e:
+        print(f"✗ {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
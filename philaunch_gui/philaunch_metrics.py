@@ -0,0 +1,153 @@
+"""
+PhiLaunch System Metrics Sampler
+Reads CPU, memory and SSH liveness straight from /proc (no subprocesses)
+"""
+
+import os
+import socket
+import time
+from typing import Dict, Optional
+
+
+class SystemSampler:
+    """
+    Persistent /proc sampler for the Control Center toolbar.
+
+    CPU usage is computed as the delta between two /proc/stat reads, so the
+    sampler has to stay alive between refreshes. Call sample() on every tick
+    and read `latest` wherever the values are needed.
+    """
+
+    SSHD_NAMES = ('sshd',)
+
+    def __init__(self, proc_root: str = '/proc', ssh_port: Optional[int] = None,
+                 ssh_rescan_interval: float = 10.0):
+        self.proc_root = proc_root
+        self.ssh_port = ssh_port
+        self.ssh_rescan_interval = ssh_rescan_interval
+
+        self._prev_cpu = None          # (total, idle) jiffies from last read
+        self._sshd_pid = None          # cached pid of a live sshd
+        self._last_ssh_scan = float('-inf')
+
+        self.latest = {'cpu': None, 'ram': None, 'ssh': None, 'timestamp': None}
+
+        # Prime the CPU counters so the first sample() already has a delta
+        self._prev_cpu = self._read_cpu_times()
+
+    # === Public API ===
+
+    def sample(self) -> Dict:
+        """Take a new sample and return the updated `latest` dict"""
+        self.latest = {
+            'cpu': self._cpu_percent(),
+            'ram': self._ram_percent(),
+            'ssh': self._ssh_alive(),
+            'timestamp': time.time(),
+        }
+        return self.latest
+
+    # === CPU ===
+
+    def _read_cpu_times(self):
+        """Return (total, idle) jiffies from the aggregate cpu line"""
+        try:
+            with open(os.path.join(self.proc_root, 'stat')) as f:
+                fields = f.readline().split()
+        except OSError:
+            return None
+
+        if not fields or fields[0] != 'cpu':
+            return None
+
+        # user nice system idle iowait irq softirq steal (guest is already in user)
+        values = [int(v) for v in fields[1:9]]
+        idle = values[3] + (values[4] if len(values) > 4 else 0)
+        return sum(values), idle
+
+    def _cpu_percent(self) -> Optional[float]:
+        current = self._read_cpu_times()
+        previous, self._prev_cpu = self._prev_cpu, current
+
+        if current is None or previous is None:
+            return None
+
+        total_delta = current[0] - previous[0]
+        idle_delta = current[1] - previous[1]
+        if total_delta <= 0:
+            # Sampled twice within one jiffy - keep the last known value
+            return self.latest.get('cpu')
+
+        return round(100.0 * (total_delta - idle_delta) / total_delta, 1)
+
+    # === Memory ===
+
+    def _ram_percent(self) -> Optional[float]:
+        meminfo = {}
+        try:
+            with open(os.path.join(self.proc_root, 'meminfo')) as f:
+                for line in f:
+                    key, _, rest = line.partition(':')
+                    if key in ('MemTotal', 'MemAvailable', 'MemFree', 'Buffers', 'Cached'):
+                        meminfo[key] = int(rest.split()[0])
+                    if len(meminfo) == 5:
+                        break
+        except (OSError, ValueError, IndexError):
+            return None
+
+        total = meminfo.get('MemTotal')
+        if not total:
+            return None
+
+        available = meminfo.get('MemAvailable')
+        if available is None:
+            # Pre-3.14 kernels have no MemAvailable
+            available = meminfo.get('MemFree', 0) + meminfo.get('Buffers', 0) + meminfo.get('Cached', 0)
+
+        return round(100.0 * (total - available) / total, 1)
+
+    # === SSH ===
+
+    def _ssh_alive(self) -> bool:
+        """Check sshd via the process table, falling back to a socket probe"""
+        if self._sshd_pid is not None and self._pid_is_sshd(self._sshd_pid):
+            return True
+
+        self._sshd_pid = None
+        now = time.monotonic()
+        if now - self._last_ssh_scan >= self.ssh_rescan_interval:
+            self._last_ssh_scan = now
+            self._sshd_pid = self._find_sshd()
+            if self._sshd_pid is not None:
+                return True
+
+        if self.ssh_port:
+            return self._probe_port(self.ssh_port)
+
+        return False
+
+    def _pid_is_sshd(self, pid: int) -> bool:
+        try:
+            with open(os.path.join(self.proc_root, str(pid), 'comm')) as f:
+                return f.read().strip() in self.SSHD_NAMES
+        except OSError:
+            return False
+
+    def _find_sshd(self) -> Optional[int]:
+        try:
+            entries = os.listdir(self.proc_root)
+        except OSError:
+            return None
+
+        for entry in entries:
+            if entry.isdigit() and self._pid_is_sshd(int(entry)):
+                return int(entry)
+        return None
+
+    @staticmethod
+    def _probe_port(port: int, host: str = '127.0.0.1', timeout: float = 0.2) -> bool:
+        try:
+            with socket.create_connection((host, port), timeout=timeout):
+                return True
+        except OSError:
+            return False
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+PhiLaunch Connectivity Probe
+Async TCP/UDP reachability checks with a cached result and per-target backoff
+
+Targets come from PHILAUNCH_PROBE_TARGETS as `name=host:port[/udp]` entries
+separated by spaces or commas; the host `gateway` stands for the default
+route's gateway. Without it: the gateway, the WoW server (WOW_SERVER_IP,
+realm port 3724) and 1.1.1.1:443.
+
+A TCP probe counts a refused connection as reachable (the host answered).
+A UDP probe needs a reply or an ICMP port-unreachable, so point UDP targets
+at something that answers - a DNS server (port 53 gets a real query) on the
+far side of the VPN, for example. A failing target is retried after
+interval * 2^failures, capped at PROBE_MAX_BACKOFF. Every round is written
+to `<state>/connectivity.json` for readers in other processes (metrics.sh).
+
+Usage:
+    philaunch_netprobe.py check [--json]     (one round, printed)
+    philaunch_netprobe.py watch              (probe forever, keeping the cache file fresh)
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from philaunch_paths import state_dir
+
+
+CACHE_FILE = 'connectivity.json'
+PROBE_INTERVAL = 10.0
+PROBE_TIMEOUT = 1.0
+PROBE_MAX_BACKOFF = 300.0
+WOW_REALM_PORT = 3724
+LOCAL_TARGETS = ('gateway',)  # Reachable gateway alone does not mean "Connected"
+
+# Root NS query: any DNS server answers it, so UDP/53 targets get a real reply
+DNS_QUERY = bytes.fromhex('5048010000010000000000000000020001')
+
+
+def default_gateway(route_table: str = '/proc/net/route') -> Optional[str]:
+    """IPv4 gateway of the default route, or None"""
+    try:
+        with open(route_table) as f:
+            next(f)
+            for line in f:
+                fields = line.split()
+                if len(fields) > 2 and fields[1] == '00000000' and fields[2] != '00000000':
+                    return socket.inet_ntoa(int(fields[2], 16).to_bytes(4, 'little'))
+    except (OSError, StopIteration, ValueError):
+        pass
+    return None
+
+
+def parse_targets(spec: Optional[str] = None) -> List[Dict]:
+    """[{'name', 'host', 'port', 'proto'}] from PHILAUNCH_PROBE_TARGETS (or the defaults)"""
+    if spec is None:
+        spec = os.environ.get('PHILAUNCH_PROBE_TARGETS', '')
+    if not spec.strip():
+        wow = os.environ.get('WOW_SERVER_IP', '103.4.115.248')
+        spec = f"gateway=gateway:53/udp wow={wow}:{WOW_REALM_PORT} internet=1.1.1.1:443"
+    targets = []
+    for entry in spec.replace(',', ' ').split():
+        name, _, address = entry.rpartition('=')
+        address, _, proto = address.partition('/')
+        host, _, port = address.rpartition(':')
+        if not host or not port.isdigit():
+            raise ValueError(f"bad probe target '{entry}' (want name=host:port[/udp])")
+        targets.append({'name': name or host, 'host': host, 'port': int(port),
+                        'proto': proto.lower() or 'tcp'})
+    return targets
+
+
+class _UDPReply(asyncio.DatagramProtocol):
+    def __init__(self, answered: asyncio.Future):
+        self.answered = answered
+
+    def datagram_received(self, data, addr):
+        if not self.answered.done():
+            self.answered.set_result(True)
+
+    def error_received(self, exc):
+        if self.answered.done():
+            return
+        if isinstance(exc, ConnectionRefusedError):
+            # ICMP port unreachable: the host is there, the port is closed
+            self.answered.set_result(True)
+        else:
+            self.answered.set_exception(exc)
+
+
+async def probe(host: str, port: int, proto: str = 'tcp', timeout: float = PROBE_TIMEOUT) -> Dict:
+    """One reachability check: {'up', 'rtt_ms', 'error'}"""
+    start = time.perf_counter()
+    try:
+        if proto == 'udp':
+            loop = asyncio.get_running_loop()
+            answered = loop.create_future()
+            transport, _ = await loop.create_datagram_endpoint(
+                lambda: _UDPReply(answered), remote_addr=(host, port))
+            try:
+                transport.sendto(DNS_QUERY if port == 53 else b'\0')
+                await asyncio.wait_for(answered, timeout)
+            finally:
+                transport.close()
+        else:
+            try:
+                _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+                writer.close()
+            except ConnectionRefusedError:
+                pass  # RST from the host itself
+    except asyncio.TimeoutError:
+        return {'up': False, 'rtt_ms': None, 'error': 'timeout'}
+    except OSError as e:
+        return {'up': False, 'rtt_ms': None, 'error': e.strerror or str(e)}
+    return {'up': True, 'rtt_ms': round((time.perf_counter() - start) * 1000, 1), 'error': None}
+
+
+class ConnectivityProber:
+    """
+    Background prober keeping the latest result per target.
+
+    `result()` never waits on the network; it returns whatever the last
+    probes found (targets not probed yet have up=None). `run()` exits once
+    nobody has called `touch()` for `idle_after` seconds, so an embedding
+    server stops probing when nobody is looking.
+    """
+
+    def __init__(self, targets: Optional[List[Dict]] = None, interval: float = PROBE_INTERVAL,
+                 timeout: float = PROBE_TIMEOUT, max_backoff: float = PROBE_MAX_BACKOFF,
+                 cache_path: Optional[Path] = None):
+        self.interval = interval
+        self.timeout = timeout
+        self.max_backoff = max_backoff
+        self.cache_path = cache_path
+        self.targets = []
+        for target in (targets if targets is not None else parse_targets()):
+            self.targets.append({**target, 'up': None, 'rtt_ms': None, 'error': None,
+                                 'checked': None, 'failures': 0, 'due': 0.0})
+        self._last_demand = time.monotonic()
+        self._task: Optional[asyncio.Future] = None
+
+    def touch(self):
+        self._last_demand = time.monotonic()
+
+    def ensure_running(self, idle_after: float = 60.0):
+        """Start the probe loop if it is not running (call from the event loop)"""
+        self.touch()
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self.run(idle_after))
+
+    async def run(self, idle_after: Optional[float] = None):
+        while idle_after is None or time.monotonic() - self._last_demand < idle_after:
+            await self.probe_due()
+            wake = min(target['due'] for target in self.targets) if self.targets else 0.0
+            await asyncio.sleep(max(0.5, min(wake - time.monotonic(), self.interval)))
+
+    async def probe_due(self):
+        """Probe every target whose (backed-off) time has come, concurrently"""
+        now = time.monotonic()
+        due = [target for target in self.targets if target['due'] <= now]
+        if not due:
+            return
+        results = await asyncio.gather(*(self._probe(target) for target in due))
+        for target, found in zip(due, results):
+            target.update(found, checked=time.time())
+            if found['up']:
+                target['failures'] = 0
+                delay = self.interval
+            else:
+                target['failures'] += 1
+                delay = min(self.interval * 2 ** target['failures'], self.max_backoff)
+            target['due'] = time.monotonic() + delay
+        if self.cache_path is not None:
+            self._write_cache()
+
+    async def _probe(self, target: Dict) -> Dict:
+        host = target['host']
+        if host == 'gateway':
+            host = default_gateway()
+            if host is None:
+                return {'up': False, 'rtt_ms': None, 'error': 'no default route'}
+        return await probe(host, target['port'], target['proto'], self.timeout)
+
+    def result(self) -> Dict:
+        """The dashboard's network section: overall status plus each target"""
+        targets = [{key: target[key] for key in ('name', 'host', 'port', 'proto', 'up',
+                                                  'rtt_ms', 'error', 'checked', 'failures')}
+                   for target in self.targets]
+        remote = [target for target in targets if target['name'] not in LOCAL_TARGETS] or targets
+        if any(target['up'] for target in remote):
+            status, connected = 'Connected', True
+        elif all(target['up'] is None for target in remote):
+            status, connected = 'Checking', None
+        elif any(target['up'] for target in targets):
+            status, connected = 'LAN only', False
+        else:
+            status, connected = 'Disconnected', False
+        checked = [target['checked'] for target in targets if target['checked']]
+        return {'status': status, 'connected': connected, 'targets': targets,
+                'checked': max(checked) if checked else None}
+
+    def _write_cache(self):
+        tmp = self.cache_path.with_name(self.cache_path.name + '.tmp')
+        try:
+            tmp.write_text(json.dumps(self.result()))
+            os.replace(tmp, self.cache_path)
+        except OSError:
+            pass
+
+
+def format_result(result: Dict) -> str:
+    lines = [f"Network: {result['status']}"]
+    for target in result['targets']:
+        state = {True: '✓', False: '✗', None: '?'}[target['up']]
+        detail = f"{target['rtt_ms']:.1f} ms" if target['up'] else (target['error'] or 'not probed')
+        lines.append(f"  {state} {target['name']:<10} {target['host']}:{target['port']}/"
+                     f"{target['proto']:<4} {detail}")
+    return '\n'.join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    sub = parser.add_subparsers(dest='command', required=True)
+    check = sub.add_parser('check', help='probe every target once')
+    check.add_argument('--json', action='store_true')
+    watch = sub.add_parser('watch', help='keep probing and updating the cache file')
+    watch.add_argument('--interval', type=float, default=PROBE_INTERVAL)
+    args = parser.parse_args(argv)
+
+    try:
+        cache = state_dir() / CACHE_FILE
+        if args.command == 'check':
+            prober = ConnectivityProber(cache_path=cache)
+            asyncio.run(prober.probe_due())
+            result = prober.result()
+            print(json.dumps(result, indent=2) if args.json else format_result(result))
+        else:
+            prober = ConnectivityProber(interval=args.interval, cache_path=cache)
+            asyncio.run(prober.run())
+    except ValueError as e:
+        print(f"✗ {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,230 @@
+"""
+PhiLaunch tmux Pane Stream
+Live output from a tmux pane via `tmux pipe-pane` into a FIFO
+"""
+
+import codecs
+import os
+import re
+import select
+import shlex
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from typing import Callable, Optional
+
+
+# CSI / OSC / two-character escape sequences - the console is plain text
+ANSI_ESCAPE = re.compile(r'\x1b(?:\[[0-?]*[ -/]*[@-~]|\][^\x07\x1b]*(?:\x07|\x1b\\)|[@-Z\\-_])')
+
+
+def clean_terminal_text(text: str) -> str:
+    """Strip escape sequences and carriage returns from raw pane output"""
+    text = ANSI_ESCAPE.sub('', text)
+    return text.replace('\r\n', '\n').replace('\r', '')
+
+
+class PaneStream:
+    """
+    Follows one tmux pane at a time.
+
+    follow(target) is non-blocking: a single worker thread owns every tmux call
+    and the FIFO, detaches the previous pane (`pipe-pane` with no command),
+    attaches the new one and delivers output to `on_output` in batches of at
+    most one per `flush_interval`. If the consumer falls behind, only the newest
+    `max_pending` bytes are kept and a skip marker is emitted instead of
+    letting the backlog grow.
+    """
+
+    def __init__(self, on_output: Callable[[str], None],
+                 snapshot_lines: int = 50,
+                 flush_interval: float = 0.05,
+                 max_pending: int = 256 * 1024,
+                 tmux_bin: str = 'tmux'):
+        self.on_output = on_output
+        self.snapshot_lines = snapshot_lines
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.tmux_bin = tmux_bin
+
+        self.target = None            # target currently piped (as requested)
+        self._pane = None             # resolved pane id (%N), survives renames
+        self._desired = None          # target requested by the GUI
+        self._reattach = False        # re-resolve the pane even if the target is unchanged
+        self._lock = threading.Lock()
+        self._closed = False
+        self._thread = None
+
+        self._fifo_dir = None
+        self._fifo_path = None
+        self._fifo_fd = None
+        self._keepalive_fd = None     # our own writer, so the FIFO never reports EOF
+        self._wake_r, self._wake_w = os.pipe()
+
+        self._pending = []
+        self._pending_bytes = 0
+        self._skipped = 0
+        self._decoder = codecs.getincrementaldecoder('utf-8')('replace')
+
+    # === Public API ===
+
+    def follow(self, target: Optional[str], reattach: bool = False):
+        """Stream `target` (a tmux target such as a session name), or stop with None"""
+        with self._lock:
+            self._desired = target
+            self._reattach = self._reattach or reattach
+            if self._thread is None and target is not None and shutil.which(self.tmux_bin):
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        self._wake()
+
+    def close(self):
+        """Detach and release the FIFO"""
+        with self._lock:
+            self._closed = True
+            self._desired = None
+        self._wake()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+
+    # === Worker ===
+
+    def _wake(self):
+        try:
+            os.write(self._wake_w, b'x')
+        except OSError:
+            pass
+
+    def _run(self):
+        last_flush = time.monotonic()
+        try:
+            while True:
+                with self._lock:
+                    desired, closed, reattach = self._desired, self._closed, self._reattach
+                    self._reattach = False
+                if desired != self.target or reattach:
+                    self._switch(desired)
+                if closed:
+                    break
+
+                fds = [self._wake_r] + ([self._fifo_fd] if self._fifo_fd is not None else [])
+                timeout = self.flush_interval if self._pending else None
+                readable, _, _ = select.select(fds, [], [], timeout)
+
+                if self._wake_r in readable:
+                    os.read(self._wake_r, 4096)
+                if self._fifo_fd is not None and self._fifo_fd in readable:
+                    self._read_available()
+
+                now = time.monotonic()
+                if self._pending and now - last_flush >= self.flush_interval:
+                    self._flush()
+                    last_flush = now
+        finally:
+            self._switch(None)
+            self._teardown_fifo()
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+
+    def _read_available(self):
+        while True:
+            try:
+                chunk = os.read(self._fifo_fd, 65536)
+            except BlockingIOError:
+                return
+            if not chunk:
+                return
+            self._pending.append(chunk)
+            self._pending_bytes += len(chunk)
+
+            # Backpressure: keep only the newest max_pending bytes
+            while self._pending_bytes > self.max_pending and len(self._pending) > 1:
+                dropped = self._pending.pop(0)
+                self._pending_bytes -= len(dropped)
+                self._skipped += len(dropped)
+
+    def _flush(self):
+        data = b''.join(self._pending)
+        self._pending = []
+        self._pending_bytes = 0
+
+        text = clean_terminal_text(self._decoder.decode(data))
+        if self._skipped:
+            text = f"[... {self._skipped} bytes skipped ...]\n" + text
+            self._skipped = 0
+        if text:
+            self.on_output(text)
+
+    # === tmux plumbing ===
+
+    def _switch(self, target: Optional[str]):
+        if self._pane is not None:
+            self._tmux('pipe-pane', '-t', self._pane)  # No command = close pipe
+            if self._pending:
+                self._flush()
+            self._drain_fifo()
+        self.target = self._pane = None
+
+        if target is None:
+            return
+
+        pane = (self._tmux('display-message', '-p', '-t', target, '#{pane_id}') or '').strip()
+        if not pane:
+            self.on_output(f"✗ Could not capture output from {target}\n")
+            self.target = target  # Don't retry until the selection changes
+            return
+
+        self._ensure_fifo()
+        self._decoder.reset()
+
+        if self.snapshot_lines:
+            snapshot = self._tmux('capture-pane', '-p', '-t', pane, '-S', f'-{self.snapshot_lines}')
+            if snapshot:
+                self.on_output(snapshot.rstrip('\n') + '\n')
+
+        command = f"exec cat > {shlex.quote(self._fifo_path)}"
+        if self._tmux('pipe-pane', '-t', pane, command) is None:
+            self.on_output(f"✗ Could not stream output from {target}\n")
+        else:
+            self._pane = pane
+        self.target = target
+
+    def _tmux(self, *args) -> Optional[str]:
+        try:
+            result = subprocess.run([self.tmux_bin, *args], capture_output=True,
+                                    text=True, timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        return result.stdout if result.returncode == 0 else None
+
+    def _ensure_fifo(self):
+        if self._fifo_fd is not None:
+            return
+        self._fifo_dir = tempfile.mkdtemp(prefix='philaunch-pane-')
+        self._fifo_path = os.path.join(self._fifo_dir, 'pane.fifo')
+        os.mkfifo(self._fifo_path, 0o600)
+        # Reader first (non-blocking), then a writer we hold so EOF never fires
+        self._fifo_fd = os.open(self._fifo_path, os.O_RDONLY | os.O_NONBLOCK)
+        self._keepalive_fd = os.open(self._fifo_path, os.O_WRONLY | os.O_NONBLOCK)
+
+    def _drain_fifo(self):
+        """Discard anything the previous pane wrote after detaching"""
+        if self._fifo_fd is None:
+            return
+        while True:
+            try:
+                if not os.read(self._fifo_fd, 65536):
+                    return
+            except BlockingIOError:
+                return
+
+    def _teardown_fifo(self):
+        for fd in (self._fifo_fd, self._keepalive_fd):
+            if fd is not None:
+                os.close(fd)
+        self._fifo_fd = self._keepalive_fd = None
+        if self._fifo_dir:
+            shutil.rmtree(self._fifo_dir, ignore_errors=True)
+            self._fifo_dir = self._fifo_path = None
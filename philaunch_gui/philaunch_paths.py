@@ -0,0 +1,52 @@
+"""
+PhiLaunch Paths
+Shared locations for on-disk state written by the Control Center
+"""
+
+import os
+from pathlib import Path
+
+
+def state_dir() -> Path:
+    """
+    Directory for persistent GUI state (metric history, caches, archives).
+    PHILAUNCH_STATE_DIR wins; otherwise $XDG_STATE_HOME/philaunch.
+    """
+    configured = os.environ.get('PHILAUNCH_STATE_DIR')
+    if configured:
+        path = Path(configured).expanduser()
+    else:
+        xdg = os.environ.get('XDG_STATE_HOME') or str(Path.home() / '.local' / 'state')
+        path = Path(xdg) / 'philaunch'
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def philaunch_home() -> Path:
+    """
+    PhiLaunch checkout the scripts live in.
+    PHILAUNCH_HOME wins; otherwise the directory above philaunch_gui/
+    (the same fallback config/load-config.sh uses).
+    """
+    configured = os.environ.get('PHILAUNCH_HOME')
+    if configured:
+        return Path(configured).expanduser()
+    return Path(__file__).resolve().parent.parent
+
+
+def automation_dir() -> Path:
+    """PHILAUNCH_AUTOMATION_DIR, or automation/ under philaunch_home()"""
+    configured = os.environ.get('PHILAUNCH_AUTOMATION_DIR')
+    return Path(configured).expanduser() if configured else philaunch_home() / 'automation'
+
+
+def remote_scripts_dir() -> Path:
+    """PHILAUNCH_REMOTE_SCRIPTS_DIR, or remote-scripts/ under philaunch_home()"""
+    configured = os.environ.get('PHILAUNCH_REMOTE_SCRIPTS_DIR')
+    return Path(configured).expanduser() if configured else philaunch_home() / 'remote-scripts'
+
+
+def log_dir() -> Path:
+    """PHILAUNCH_LOG_DIR, or logs/ under philaunch_home()"""
+    configured = os.environ.get('PHILAUNCH_LOG_DIR')
+    return Path(configured).expanduser() if configured else philaunch_home() / 'logs'
@@ -0,0 +1,63 @@
+"""
+PhiLaunch Startup Profiler
+Per-phase import and construction timings for `--profile-startup`
+"""
+
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+
+class StartupProfiler:
+    """
+    Records nested phases and one-off milestones relative to `origin`.
+
+    Recording is always on (a perf_counter call per phase), so phases that run
+    before argument parsing - module imports - are captured too; the report is
+    only printed when profiling was requested.
+    """
+
+    def __init__(self, origin: Optional[float] = None):
+        self.origin = time.perf_counter() if origin is None else origin
+        self.enabled = False
+        self.records: List[Dict] = []
+        self._depth = 0
+        self._reported = False
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a block; phases may nest"""
+        start = time.perf_counter()
+        record = {'name': name, 'start': start - self.origin, 'duration': None,
+                  'depth': self._depth}
+        self.records.append(record)
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            record['duration'] = time.perf_counter() - start
+
+    def mark(self, name: str):
+        """Record a milestone (first paint, data arrived, ...)"""
+        self.records.append({'name': name, 'start': time.perf_counter() - self.origin,
+                             'duration': None, 'depth': self._depth})
+
+    def report(self) -> str:
+        """Human-readable table, offsets and durations in ms"""
+        lines = [f"{'at ms':>9}  {'took ms':>9}  phase"]
+        for record in self.records:
+            took = '' if record['duration'] is None else f"{record['duration'] * 1000:9.1f}"
+            indent = '  ' * record['depth']
+            marker = '' if record['duration'] is not None else '• '
+            lines.append(f"{record['start'] * 1000:9.1f}  {took:>9}  {indent}{marker}{record['name']}")
+        return '\n'.join(lines)
+
+    def print_report(self, stream=None):
+        """Print the report once (no-op unless enabled)"""
+        if not self.enabled or self._reported:
+            return
+        self._reported = True
+        print("\n=== PhiLaunch startup profile ===", file=stream or sys.stderr)
+        print(self.report(), file=stream or sys.stderr)
@@ -0,0 +1,494 @@
+"""
+PhiLaunch Remote Execution
+Pooled SSH connections (OpenSSH ControlMaster) to the configured PhiLaunch hosts
+
+Every host gets one persistent master connection; commands run as
+multiplexed sessions over it, so they pay a round trip instead of a TCP +
+key exchange + auth handshake. A master that fails to come up is retried
+with exponential backoff; a master that died under a running command is
+re-established once before the command is reported as failed.
+
+fan_out() runs one command or local script on many hosts at once (bounded
+parallelism), streaming host-prefixed lines and ending with a summary table.
+
+Usage:
+    philaunch_remote.py hosts
+    philaunch_remote.py run [--host NAME] [--timeout S] -- COMMAND...
+    philaunch_remote.py fanout [--hosts A,B] [--parallel N] (--script FILE [ARGS...] | -- COMMAND...)
+    philaunch_remote.py check [--host NAME]
+    philaunch_remote.py close [--host NAME]
+"""
+
+import argparse
+import os
+import selectors
+import shlex
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    from philaunch_paths import state_dir
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from philaunch_paths import state_dir
+
+
+DEFAULT_PORT = 22
+DEFAULT_PARALLEL = 4
+# ssh exits 255 for its own errors; these mean the master went away under us
+MUX_ERRORS = ('control socket', 'mux_client', 'master is dead', 'controlsocket')
+
+
+class RemoteError(Exception):
+    """Host unknown, unreachable, or backing off after failed connects"""
+
+
+def parse_host(spec: str, default_port: int = DEFAULT_PORT) -> Dict:
+    """`name=user@host:port` (name and port optional) -> host dict"""
+    name, sep, target = spec.partition('=')
+    if not sep:
+        name, target = '', spec
+    port = default_port
+    address, colon, tail = target.rpartition(':')
+    if colon and tail.isdigit() and ']' not in tail:
+        target, port = address, int(tail)
+    target = target.strip('[]') if target.startswith('[') else target
+    host = target.rpartition('@')[2]
+    return {'name': name or host, 'target': target, 'port': port}
+
+
+def configured_hosts(environ=None) -> Dict[str, Dict]:
+    """
+    Hosts from the PhiLaunch config: PHILAUNCH_SSH_CONN / PHILAUNCH_SSH_PORT
+    as "main", plus any `name=user@host:port` entries in PHILAUNCH_REMOTE_HOSTS.
+    """
+    env = os.environ if environ is None else environ
+    port = env.get('PHILAUNCH_SSH_PORT', '')
+    port = int(port) if port.isdigit() else DEFAULT_PORT
+    hosts = {}
+    conn = env.get('PHILAUNCH_SSH_CONN')
+    if conn:
+        hosts['main'] = {'name': 'main', 'target': conn, 'port': port}
+    for spec in env.get('PHILAUNCH_REMOTE_HOSTS', '').split():
+        host = parse_host(spec, port)
+        hosts[host['name']] = host
+    return hosts
+
+
+class _Master:
+    """Connection state for one host"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.alive = False
+        self.last_used = 0.0
+        self.failures = 0
+        self.retry_at = 0.0
+        self.last_error = None
+
+
+class SSHPool:
+    """
+    One multiplexed SSH connection per host, shared by every command.
+
+    Control sockets live in `<state dir>/ssh/` (named by ssh's %C hash, so
+    the same path is usable from shell scripts); ControlPersist keeps an idle
+    master for `persist` seconds after the last session. Connects are
+    non-interactive (BatchMode), so hosts need key authentication.
+    """
+
+    def __init__(self, hosts: Optional[Dict[str, Dict]] = None,
+                 control_dir: Optional[Path] = None, ssh_bin: str = 'ssh',
+                 persist: int = 600, connect_timeout: int = 5,
+                 backoff: Sequence[float] = (1.0, 60.0),
+                 options: Sequence[str] = ()):
+        self.hosts = configured_hosts() if hosts is None else dict(hosts)
+        self.control_dir = Path(control_dir) if control_dir else state_dir() / 'ssh'
+        self.control_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
+        self.ssh_bin = ssh_bin
+        self.persist = persist
+        self.connect_timeout = connect_timeout
+        self.backoff = backoff
+        self.options = list(options)
+
+        self._masters: Dict[str, _Master] = {}
+        self._lock = threading.Lock()
+
+    # === Public API ===
+
+    def host(self, name: Optional[str] = None) -> Dict:
+        """Look up a host by name (None: "main", or the only host)"""
+        if name is None:
+            if 'main' in self.hosts:
+                return self.hosts['main']
+            if len(self.hosts) == 1:
+                return next(iter(self.hosts.values()))
+            raise RemoteError('no default host (set PHILAUNCH_SSH_CONN)')
+        if name in self.hosts:
+            return self.hosts[name]
+        if '@' in name or '.' in name or name == 'localhost':
+            return parse_host(name)  # Ad-hoc user@host[:port]
+        raise RemoteError(f'unknown host: {name}')
+
+    def ssh_args(self, host: Dict) -> List[str]:
+        """ssh options that attach to this pool's master for `host`"""
+        return [
+            '-o', f'ControlPath={self.control_dir}/%C',
+            '-o', 'BatchMode=yes',
+            '-o', f'ConnectTimeout={self.connect_timeout}',
+            '-p', str(host['port']),
+            *self.options,
+        ]
+
+    def connect(self, name: Optional[str] = None) -> Dict:
+        """Make sure the master for a host is up; raises RemoteError if not"""
+        host = self.host(name)
+        state = self._state(host)
+        with state.lock:
+            now = time.monotonic()
+            # Recently used masters are trusted; an idle one may have hit
+            # ControlPersist, and ssh would silently fall back to a full handshake
+            if state.alive and now - state.last_used < self.persist / 2:
+                return host
+            if self._check(host):
+                state.alive, state.last_used = True, now
+                return host
+            state.alive = False
+
+            if now < state.retry_at:
+                raise RemoteError(f"{host['name']}: reconnect in {state.retry_at - now:.1f}s "
+                                  f"({state.last_error})")
+
+            # The backgrounded master keeps our stderr open: use a file, not a pipe
+            with tempfile.TemporaryFile() as errors:
+                try:
+                    returncode = subprocess.run(
+                        [self.ssh_bin, *self.ssh_args(host), '-o', 'ControlMaster=yes',
+                         '-o', f'ControlPersist={self.persist}', '-o', 'ServerAliveInterval=15',
+                         '-N', '-f', host['target']],
+                        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=errors,
+                        timeout=self.connect_timeout + 10).returncode
+                except subprocess.TimeoutExpired:
+                    returncode = None  # Hung before authenticating (e.g. a prompt)
+                errors.seek(0)
+                stderr = errors.read().decode('utf-8', 'replace')
+            if returncode != 0:
+                state.failures += 1
+                delay = min(self.backoff[0] * 2 ** (state.failures - 1), self.backoff[1])
+                state.retry_at = time.monotonic() + delay
+                fallback = 'connect timed out' if returncode is None else 'connect failed'
+                state.last_error = (stderr.strip().splitlines() or [fallback])[-1]
+                raise RemoteError(f"{host['name']}: {state.last_error}")
+
+            state.alive = True
+            state.last_used = time.monotonic()
+            state.failures = 0
+            state.retry_at = 0.0
+            state.last_error = None
+            return host
+
+    def run(self, command, name: Optional[str] = None, timeout: Optional[float] = None,
+            input: Optional[str] = None) -> Dict:
+        """
+        Run a command on a host over its master connection.
+
+        `command` is a shell string or an argv list (quoted for the remote
+        shell). Returns {'host', 'exit_code', 'stdout', 'stderr', 'duration'}.
+        """
+        remote = command if isinstance(command, str) else ' '.join(map(shlex.quote, command))
+        started = time.monotonic()
+        for attempt in (1, 2):
+            host = self.connect(name)
+            result = subprocess.run(
+                [self.ssh_bin, *self.ssh_args(host), '-o', 'ControlMaster=no',
+                 host['target'], '--', remote],
+                input=input, stdin=None if input is not None else subprocess.DEVNULL,
+                capture_output=True, text=True, timeout=timeout)
+            if result.returncode == 255 and attempt == 1 and self._mux_failed(result.stderr):
+                self._state(host).alive = False  # Master died; reconnect once
+                continue
+            self._state(host).last_used = time.monotonic()
+            break
+        return {
+            'host': host['name'],
+            'exit_code': result.returncode,
+            'stdout': result.stdout,
+            'stderr': result.stderr,
+            'duration': round(time.monotonic() - started, 4),
+        }
+
+    def stream(self, command, name: Optional[str] = None,
+               on_line: Optional[Callable[[str, str, str], None]] = None,
+               timeout: Optional[float] = None, input: Optional[bytes] = None) -> Dict:
+        """
+        Like run(), but hands each output line to `on_line(host, stream, line)`
+        as it arrives instead of collecting it. Returns {'host', 'exit_code',
+        'duration', 'lines', 'error'}; exit_code is None if it timed out.
+        """
+        remote = command if isinstance(command, str) else ' '.join(map(shlex.quote, command))
+        started = time.monotonic()
+        deadline = started + timeout if timeout else None
+        for attempt in (1, 2):
+            host = self.connect(name)
+            proc = subprocess.Popen(
+                [self.ssh_bin, *self.ssh_args(host), '-o', 'ControlMaster=no',
+                 host['target'], '--', remote],
+                stdin=subprocess.PIPE if input is not None else subprocess.DEVNULL,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            if input is not None:
+                # Fed from a thread so a chatty command can't deadlock on a full pipe
+                threading.Thread(target=self._feed, args=(proc.stdin, input), daemon=True).start()
+            lines, errors, timed_out = self._pump(proc, host['name'], on_line, deadline)
+            if (proc.returncode == 255 and attempt == 1 and lines == len(errors)
+                    and self._mux_failed('\n'.join(errors))):
+                self._state(host).alive = False  # Master died before the command ran
+                continue
+            self._state(host).last_used = time.monotonic()
+            break
+        error = None
+        if timed_out:
+            error = 'timed out'
+        elif proc.returncode == 255 and errors:
+            error = errors[-1]
+        return {
+            'host': host['name'],
+            'exit_code': None if timed_out else proc.returncode,
+            'duration': round(time.monotonic() - started, 4),
+            'lines': lines,
+            'error': error,
+        }
+
+    def status(self) -> List[Dict]:
+        """Known hosts with their connection state"""
+        rows = []
+        for name, host in self.hosts.items():
+            state = self._state(host)
+            rows.append({**host, 'alive': state.alive, 'failures': state.failures,
+                         'retry_in': max(0.0, round(state.retry_at - time.monotonic(), 1)),
+                         'error': state.last_error})
+        return rows
+
+    def close(self, name: Optional[str] = None):
+        """Tear down one master (or all of them)"""
+        hosts = [self.host(name)] if name else list(self.hosts.values())
+        for host in hosts:
+            subprocess.run([self.ssh_bin, *self.ssh_args(host), '-O', 'exit', host['target']],
+                           stdin=subprocess.DEVNULL, capture_output=True, timeout=10)
+            self._state(host).alive = False
+
+    # === Internals ===
+
+    def _state(self, host: Dict) -> _Master:
+        key = f"{host['target']}:{host['port']}"
+        with self._lock:
+            return self._masters.setdefault(key, _Master())
+
+    def _check(self, host: Dict) -> bool:
+        # A master started by another process (or an earlier run) also counts
+        try:
+            result = subprocess.run([self.ssh_bin, *self.ssh_args(host), '-O', 'check',
+                                     host['target']],
+                                    stdin=subprocess.DEVNULL, capture_output=True, timeout=10)
+        except subprocess.TimeoutExpired:
+            return False  # A master that does not answer is as good as none
+        return result.returncode == 0
+
+    @staticmethod
+    def _feed(pipe, data: bytes):
+        try:
+            pipe.write(data)
+        except (BrokenPipeError, ValueError):
+            pass
+        finally:
+            try:
+                pipe.close()
+            except OSError:
+                pass
+
+    @staticmethod
+    def _pump(proc: subprocess.Popen, host: str, on_line, deadline: Optional[float]
+              ) -> Tuple[int, List[str], bool]:
+        """Read both pipes line by line until EOF; (lines, last stderr lines, timed out)"""
+        selector = selectors.DefaultSelector()
+        partial = {}
+        for name, pipe in (('stdout', proc.stdout), ('stderr', proc.stderr)):
+            os.set_blocking(pipe.fileno(), False)
+            selector.register(pipe, selectors.EVENT_READ, name)
+            partial[name] = b''
+        lines, errors, timed_out = 0, [], False
+
+        def emit(name: str, raw: bytes):
+            nonlocal lines
+            line = raw.decode('utf-8', 'replace').rstrip('\r')
+            lines += 1
+            if name == 'stderr':
+                errors.append(line)
+                del errors[:-20]
+            if on_line:
+                on_line(host, name, line)
+
+        while selector.get_map():
+            wait = None if deadline is None else deadline - time.monotonic()
+            if wait is not None and wait <= 0:
+                timed_out = True
+                proc.kill()
+                break
+            for key, _ in selector.select(wait):
+                data = os.read(key.fileobj.fileno(), 65536)
+                if not data:
+                    selector.unregister(key.fileobj)
+                    if partial[key.data]:
+                        emit(key.data, partial[key.data])
+                    continue
+                chunks = (partial[key.data] + data).split(b'\n')
+                partial[key.data] = chunks.pop()
+                for chunk in chunks:
+                    emit(key.data, chunk)
+        selector.close()
+        proc.stdout.close()
+        proc.stderr.close()
+        proc.wait()
+        return lines, errors, timed_out
+
+    @staticmethod
+    def _mux_failed(stderr: str) -> bool:
+        text = stderr.lower()
+        return any(marker in text for marker in MUX_ERRORS)
+
+
+# === Fan-out ===
+
+def script_command(path: Path, args: Sequence[str] = ()) -> Tuple[str, bytes]:
+    """(remote command, stdin) that runs a local script on a host without copying it"""
+    command = ' '.join(['bash', '-s', '--', *map(shlex.quote, args)])
+    return command, Path(path).read_bytes()
+
+
+def fan_out(pool: SSHPool, hosts: Sequence[str], command,
+            on_line: Optional[Callable[[str, str, str], None]] = None,
+            parallel: int = DEFAULT_PARALLEL, timeout: Optional[float] = None,
+            input: Optional[bytes] = None) -> List[Dict]:
+    """
+    Run one command on every host, at most `parallel` at a time.
+
+    Output lines reach `on_line(host, stream, line)` from worker threads as
+    they arrive. Returns one result per host, in `hosts` order; unreachable
+    hosts get exit_code None and the connect error.
+    """
+    def one(name: str) -> Dict:
+        started = time.monotonic()
+        try:
+            return pool.stream(command, name, on_line, timeout, input)
+        except (RemoteError, OSError, subprocess.SubprocessError) as e:
+            return {'host': name, 'exit_code': None, 'lines': 0, 'error': str(e),
+                    'duration': round(time.monotonic() - started, 4)}
+
+    with ThreadPoolExecutor(max_workers=max(1, parallel), thread_name_prefix='fanout') as workers:
+        return list(workers.map(one, hosts))
+
+
+def default_parallel() -> int:
+    configured = os.environ.get('PHILAUNCH_REMOTE_PARALLEL', '')
+    return int(configured) if configured.isdigit() and int(configured) > 0 else DEFAULT_PARALLEL
+
+
+def format_summary(results: List[Dict]) -> str:
+    """Per-host exit code and duration as a table"""
+    width = max([len(result['host']) for result in results] + [4])
+    rows = [f"{'HOST':<{width}}  {'EXIT':>4}  {'TIME':>8}  NOTE"]
+    for result in results:
+        code = '-' if result['exit_code'] is None else str(result['exit_code'])
+        note = result.get('error') or ''
+        rows.append(f"{result['host']:<{width}}  {code:>4}  {result['duration']:>7.2f}s  {note}".rstrip())
+    ok = sum(1 for result in results if result['exit_code'] == 0)
+    slowest = max((result['duration'] for result in results), default=0.0)
+    rows.append(f"{len(results)} hosts: {ok} ok, {len(results) - ok} failed "
+                f"(slowest {slowest:.2f}s)")
+    return '\n'.join(rows)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('hosts', help='list configured hosts and connection state')
+    run = sub.add_parser('run', help='run a command over the pooled connection')
+    run.add_argument('--host')
+    run.add_argument('--timeout', type=float)
+    run.add_argument('argv', nargs=argparse.REMAINDER)
+    fanout = sub.add_parser('fanout', help='run a command or local script on many hosts')
+    fanout.add_argument('--hosts', help='comma-separated host names (default: all configured)')
+    fanout.add_argument('--parallel', type=int, default=default_parallel())
+    fanout.add_argument('--timeout', type=float)
+    fanout.add_argument('--script', type=Path, help='local script, sent over stdin')
+    fanout.add_argument('argv', nargs=argparse.REMAINDER)
+    for command in ('check', 'close'):
+        sub.add_parser(command).add_argument('--host')
+    args = parser.parse_args(argv)
+
+    if not shutil.which('ssh'):
+        print('✗ ssh not found', file=sys.stderr)
+        return 1
+    pool = SSHPool()
+    try:
+        if args.command == 'hosts':
+            for host in pool.status():
+                print(f"{host['name']:<12} {host['target']}:{host['port']}")
+        elif args.command == 'check':
+            host = pool.connect(args.host)
+            print(f"✓ {host['name']} connected ({host['target']}:{host['port']})")
+        elif args.command == 'close':
+            pool.close(args.host)
+        elif args.command == 'fanout':
+            return _fanout_cli(parser, pool, args)
+        else:
+            command = args.argv[1:] if args.argv[:1] == ['--'] else args.argv
+            if not command:
+                parser.error('run needs a command')
+            result = pool.run(command[0] if len(command) == 1 else command,
+                              args.host, timeout=args.timeout)
+            sys.stdout.write(result['stdout'])
+            sys.stderr.write(result['stderr'])
+            return result['exit_code']
+    except RemoteError as e:
+        print(f'✗ {e}', file=sys.stderr)
+        return 255
+    except subprocess.TimeoutExpired:
+        print('✗ timed out', file=sys.stderr)
+        return 124
+    return 0
+
+
+def _fanout_cli(parser, pool: SSHPool, args) -> int:
+    hosts = args.hosts.split(',') if args.hosts else list(pool.hosts)
+    if not hosts:
+        parser.error('no hosts configured (PHILAUNCH_SSH_CONN / PHILAUNCH_REMOTE_HOSTS)')
+    rest = args.argv[1:] if args.argv[:1] == ['--'] else args.argv
+    if args.script:
+        command, stdin = script_command(args.script, rest)
+    elif rest:
+        command, stdin = (rest[0] if len(rest) == 1 else rest), None
+    else:
+        parser.error('fanout needs --script FILE or a command')
+
+    width = max(map(len, hosts))
+    lock = threading.Lock()
+
+    def print_line(host: str, stream: str, line: str):
+        with lock:
+            print(f"{host:<{width}} | {line}", file=sys.stderr if stream == 'stderr' else sys.stdout,
+                  flush=True)
+
+    results = fan_out(pool, hosts, command, print_line, args.parallel, args.timeout, stdin)
+    print('\n' + format_summary(results))
+    return 0 if all(result['exit_code'] == 0 for result in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,223 @@
+"""
+PhiLaunch tmux Session Watcher
+Keeps one tmux control-mode client attached and reports session changes as events
+"""
+
+import shutil
+import subprocess
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+
+# Hidden session the control client attaches to (filtered out of task lists)
+WATCH_SESSION = '_philaunch_watch'
+
+# Name goes last because it may contain ':'
+SESSION_FORMAT = 'S:#{session_id}:#{session_created}:#{session_windows}:#{session_attached}:#{session_name}'
+
+
+def parse_session_line(line: str) -> Optional[Dict]:
+    """Parse one SESSION_FORMAT line into a session dict"""
+    if not line.startswith('S:'):
+        return None
+    parts = line[2:].split(':', 4)
+    if len(parts) != 5:
+        return None
+    session_id, created, windows, attached, name = parts
+    try:
+        return {
+            'id': session_id,
+            'name': name,
+            'created': int(created),
+            'windows': int(windows),
+            'attached': int(attached) > 0,
+        }
+    except ValueError:
+        return None
+
+
+def diff_sessions(known: Dict[str, Dict], incoming: List[Dict]) -> Dict[str, List]:
+    """
+    Compute deltas between the known sessions (keyed by name) and a new list.
+
+    Returns {'added': [session], 'removed': [name], 'renamed': [(old, session)],
+    'updated': [session]}. A rename is a session id that reappears under a new
+    name, so selection and per-item state survive `tmux rename-session`.
+    """
+    incoming_names = {s['name'] for s in incoming}
+    known_by_id = {s.get('id'): name for name, s in known.items() if s.get('id')}
+
+    delta = {'added': [], 'removed': [], 'renamed': [], 'updated': []}
+    renamed_from = set()
+
+    for session in incoming:
+        name = session['name']
+        if name in known:
+            if known[name] != session:
+                delta['updated'].append(session)
+            continue
+
+        old_name = known_by_id.get(session.get('id'))
+        if old_name is not None and old_name not in incoming_names:
+            delta['renamed'].append((old_name, session))
+            renamed_from.add(old_name)
+        else:
+            delta['added'].append(session)
+
+    delta['removed'] = [name for name in known
+                        if name not in incoming_names and name not in renamed_from]
+    return delta
+
+
+class TmuxSessionWatcher:
+    """
+    Event-driven tmux session tracker built on `tmux -C`.
+
+    A single control-mode client stays attached to a hidden session. Whenever
+    tmux sends %sessions-changed, %session-renamed or %session-window-changed
+    the watcher re-lists sessions over the same control channel (no extra
+    subprocess) and hands the result to `on_sessions`. Callbacks run on the
+    watcher thread - GUI callers should forward them through a Qt signal.
+    """
+
+    REFRESH_EVENTS = ('%sessions-changed', '%session-renamed', '%session-window-changed')
+
+    def __init__(self,
+                 on_sessions: Callable[[List[Dict]], None],
+                 on_window_changed: Optional[Callable[[str, str], None]] = None,
+                 tmux_bin: str = 'tmux',
+                 max_backoff: float = 30.0):
+        self.on_sessions = on_sessions
+        self.on_window_changed = on_window_changed
+        self.tmux_bin = tmux_bin
+        self.max_backoff = max_backoff
+
+        self.sessions = None          # latest session list (hidden session excluded)
+        self._names_by_id = {}
+        self._proc = None
+        self._thread = None
+        self._write_lock = threading.Lock()
+        self._stopping = threading.Event()
+
+    # === Lifecycle ===
+
+    def start(self) -> bool:
+        """Start the watcher thread. Returns False if tmux is not installed."""
+        if shutil.which(self.tmux_bin) is None:
+            return False
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self):
+        """Detach the control client (the hidden session destroys itself)"""
+        self._stopping.set()
+        proc = self._proc
+        if proc and proc.poll() is None:
+            try:
+                proc.stdin.close()
+                proc.wait(timeout=2)
+            except (OSError, subprocess.TimeoutExpired):
+                proc.kill()
+
+    @property
+    def active(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def request_refresh(self) -> bool:
+        """Ask for a fresh session list over the control channel"""
+        return self._send(f"list-sessions -F '{SESSION_FORMAT}'")
+
+    # === Control channel ===
+
+    def _send(self, command: str) -> bool:
+        proc = self._proc
+        if proc is None or proc.poll() is not None:
+            return False
+        try:
+            with self._write_lock:
+                proc.stdin.write(command + '\n')
+                proc.stdin.flush()
+            return True
+        except (OSError, ValueError):
+            return False
+
+    def _run(self):
+        backoff = 1.0
+        while not self._stopping.is_set():
+            started = time.monotonic()
+            self._attach()
+            if self._stopping.is_set():
+                break
+
+            # Server went away (last session killed, tmux restarted...)
+            self._publish([])
+            if time.monotonic() - started > self.max_backoff:
+                backoff = 1.0
+            self._stopping.wait(backoff)
+            backoff = min(backoff * 2, self.max_backoff)
+
+    def _attach(self):
+        try:
+            self._proc = subprocess.Popen(
+                [self.tmux_bin, '-C', 'new-session', '-A', '-s', WATCH_SESSION,
+                 'exec sleep 2147483647'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+            )
+        except OSError:
+            return
+
+        self._send(f'set-option -t {WATCH_SESSION} destroy-unattached on')
+        self._send('refresh-client -f no-output')
+        self.request_refresh()
+
+        block = None
+        for raw in self._proc.stdout:
+            line = raw.rstrip('\n')
+
+            if block is not None:
+                if line.startswith('%end') or line.startswith('%error'):
+                    self._handle_block(block)
+                    block = None
+                else:
+                    block.append(line)
+                continue
+
+            if line.startswith('%begin'):
+                block = []
+            elif line.startswith(self.REFRESH_EVENTS):
+                self.request_refresh()
+                if line.startswith('%session-window-changed'):
+                    self._notify_window_changed(line)
+            elif line.startswith('%exit'):
+                break
+
+        self._proc.wait()
+
+    def _handle_block(self, lines: List[str]):
+        sessions = [s for s in (parse_session_line(l) for l in lines) if s]
+        if not sessions:
+            return  # Output of some other command
+        self._names_by_id = {s['id']: s['name'] for s in sessions}
+        self._publish([s for s in sessions if s['name'] != WATCH_SESSION])
+
+    def _notify_window_changed(self, line: str):
+        if not self.on_window_changed:
+            return
+        parts = line.split()
+        if len(parts) >= 3:
+            session = self._names_by_id.get(parts[1], parts[1])
+            if session != WATCH_SESSION:
+                self.on_window_changed(session, parts[2])
+
+    def _publish(self, sessions: List[Dict]):
+        if sessions == self.sessions:
+            return
+        self.sessions = sessions
+        self.on_sessions(sessions)
@@ -0,0 +1,65 @@
+"""
+PhiLaunch Sparkline
+Tiny QPainter trend line for the toolbar indicators
+"""
+
+import math
+from typing import List, Optional
+
+from PyQt6.QtCore import QPointF
+from PyQt6.QtGui import QColor, QPainter, QPen, QPolygonF
+from PyQt6.QtWidgets import QWidget
+
+
+class Sparkline(QWidget):
+    """
+    Draws the last N values as a single polyline.
+
+    Only set_values() triggers a repaint; NaN gaps split the line. With a
+    fixed `ceiling` (e.g. 100 for percentages) the scale does not jump around.
+    """
+
+    def __init__(self, color: str, ceiling: Optional[float] = None,
+                 width: int = 72, height: int = 16, parent=None):
+        super().__init__(parent)
+        self.setFixedSize(width, height)
+        self.ceiling = ceiling
+        self._pen = QPen(QColor(color))
+        self._pen.setWidthF(1.0)
+        self._values: List[float] = []
+
+    def set_values(self, values: List[float]):
+        # Never draw more points than we have pixels
+        if len(values) > self.width():
+            step = len(values) / self.width()
+            values = [values[int(i * step)] for i in range(self.width())]
+        self._values = values
+        self.update()
+
+    def paintEvent(self, event):
+        present = [v for v in self._values if not math.isnan(v)]
+        if len(present) < 2:
+            return
+
+        top = self.ceiling if self.ceiling is not None else max(present)
+        bottom = 0.0 if self.ceiling is not None else min(present)
+        span = (top - bottom) or 1.0
+        w, h = self.width() - 1, self.height() - 2
+        x_step = w / max(1, len(self._values) - 1)
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+        painter.setPen(self._pen)
+
+        segment = QPolygonF()
+        for i, value in enumerate(self._values):
+            if math.isnan(value):
+                if segment.size() > 1:
+                    painter.drawPolyline(segment)
+                segment = QPolygonF()
+                continue
+            y = 1 + h - (min(value, top) - bottom) / span * h
+            segment.append(QPointF(i * x_step, y))
+        if segment.size() > 1:
+            painter.drawPolyline(segment)
+        painter.end()
@@ -0,0 +1,785 @@
+#!/usr/bin/env python3
+"""
+PhiLaunch Task Supervisor
+Runs background tasks under a pty and records timing, exit status and rusage
+
+One daemon per user owns every task. The GUI, automation/home-control.sh and
+the dashboard talk to it over a unix socket (JSON, one request per
+connection) and can read the last published state from supervisor.json
+when the daemon is not running.
+
+Usage:
+    philaunch_supervisor.py daemon
+    philaunch_supervisor.py start [--name NAME] [--cwd DIR] [--tmux]
+                                  [--priority high|normal|low] [--exclusive KEY] -- COMMAND...
+    philaunch_supervisor.py stop NAME|#ID
+    philaunch_supervisor.py list [--all] [--json]
+    philaunch_supervisor.py status NAME [--json]
+    philaunch_supervisor.py logs NAME [-n LINES]
+"""
+
+import asyncio
+import fcntl
+import json
+import os
+import pty
+import re
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import termios
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    from philaunch_paths import state_dir
+except ImportError:
+    # Fallback if running from different directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from philaunch_paths import state_dir
+
+
+STATE_FILE = 'supervisor.json'
+SOCKET_FILE = 'supervisor.sock'
+LOCK_FILE = 'supervisor.lock'
+LOG_SUBDIR = 'tasks'
+
+PENDING = 'pending'
+RUNNING = 'running'
+FINISHED_STATES = ('exited', 'failed', 'killed', 'cancelled', 'lost')
+
+# Queue order; low-priority tasks also run niced
+PRIORITIES = ('high', 'normal', 'low')
+LOW_PRIORITY_NICE = 10
+DEFAULT_MAX_RUNNING = 2
+
+RUSAGE_FIELDS = ('ru_utime', 'ru_stime', 'ru_maxrss', 'ru_minflt', 'ru_majflt',
+                 'ru_inblock', 'ru_oublock', 'ru_nvcsw', 'ru_nivcsw')
+
+
+class SupervisorError(Exception):
+    """Request rejected by the supervisor, or the daemon is unreachable"""
+
+
+def task_name_for(argv: List[str]) -> str:
+    """Default task name: script stem of the command (tmux-safe)"""
+    words = argv[0].split() if len(argv) == 1 else argv
+    for word in words:
+        if word not in ('bash', 'sh', 'python3', 'python', 'env', 'exec'):
+            return re.sub(r'[^A-Za-z0-9_-]', '_', Path(word).stem) or 'task'
+    return 'task'
+
+
+def _rusage_dict(usage) -> Dict:
+    return {field[3:]: round(getattr(usage, field), 3) if field in ('ru_utime', 'ru_stime')
+            else getattr(usage, field) for field in RUSAGE_FIELDS}
+
+
+def _write_json(path: Path, data: Dict):
+    tmp = Path(str(path) + '.tmp')
+    tmp.write_text(json.dumps(data, indent=1))
+    os.replace(tmp, path)
+
+
+class _Task:
+    """One supervised process and its pty (queued until a slot is free)"""
+
+    def __init__(self, task_id: int, name: str, argv: List[str], cwd: str,
+                 priority: str = 'normal', exclusive: Optional[str] = None,
+                 tmux: bool = False):
+        self.id = task_id
+        self.name = name
+        self.argv = argv
+        self.cwd = cwd
+        self.priority = priority
+        self.exclusive = exclusive or name   # At most one running task per key
+        self.tmux = tmux
+        self.log_path = None
+        self.pid = None
+        self.state = PENDING
+        self.queued = time.time()
+        self.started = None
+        self.ended = None
+        self.error = None
+        self.exit_code = None
+        self.signal = None
+        self.rusage = None
+        self.tmux_session = None
+        self.stop_requested = False
+
+        self.proc: Optional[subprocess.Popen] = None
+        self.pidfd = None
+        self.master_fd = None
+        self.log = None
+        self.exited: Optional['asyncio.Future'] = None       # (status, rusage) once reaped
+        self.output_done: Optional['asyncio.Future'] = None
+        self.viewer: Optional['asyncio.Task'] = None
+
+    def to_dict(self) -> Dict:
+        now = time.time()
+        end = self.ended if self.ended is not None else now
+        began = self.started if self.started is not None else end
+        return {
+            'id': self.id,
+            'name': self.name,
+            'argv': self.argv,
+            'cwd': self.cwd,
+            'pid': self.pid,
+            'state': self.state,
+            'priority': self.priority,
+            'exclusive': self.exclusive,
+            'queued': self.queued,
+            'started': self.started,
+            'ended': self.ended,
+            'wait': round(began - self.queued, 3),      # Time spent in the queue
+            'duration': round(end - began, 3),          # Run time
+            'exit_code': self.exit_code,
+            'signal': self.signal,
+            'rusage': self.rusage,
+            'log': str(self.log_path) if self.log_path else None,
+            'tmux_session': self.tmux_session,
+            'error': self.error,
+        }
+
+
+class TaskSupervisor:
+    """
+    asyncio core of the daemon.
+
+    Each task gets its own pty (its controlling terminal, so sudo/ssh
+    prompts work); the master side is drained with loop.add_reader() into
+    `<state>/tasks/<name>-<timestamp>.log`. The child is reaped with
+    os.wait4(WNOHANG) when its pidfd turns readable (on SIGCHLD where pidfds
+    are missing), so the rusage totals belong to that task alone and no
+    thread sits waiting on it. With `tmux=True` a tmux session of the same
+    name tails the log, so the task shows up in `tmux ls` and the GUI tree
+    without tmux owning the process.
+
+    Tasks are queued first: at most `max_running` run at once, the queue is
+    ordered by priority class then arrival, and a task waits while another
+    one holding the same exclusive key (default: its name) is running.
+    """
+
+    def __init__(self, base_dir: Optional[Path] = None, history: int = 200,
+                 tmux_linger: float = 30.0, kill_grace: float = 5.0,
+                 max_running: int = DEFAULT_MAX_RUNNING):
+        self.base_dir = Path(base_dir) if base_dir else state_dir()
+        self.log_dir = self.base_dir / LOG_SUBDIR
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.state_path = self.base_dir / STATE_FILE
+        self.socket_path = self.base_dir / SOCKET_FILE
+        self.history = history
+        self.tmux_linger = tmux_linger
+        self.kill_grace = kill_grace
+        self.max_running = max(1, max_running)
+
+        self.running: Dict[str, _Task] = {}
+        self.pending: List[_Task] = []
+        self.finished: List[Dict] = []
+        self._next_id = 1
+        self._sigchld_loop = None  # Loop with the SIGCHLD fallback installed
+        self._load_previous()
+
+        # Searchable copy of all task output (see philaunch_archive)
+        import sqlite3
+        from philaunch_archive import ARCHIVE_FILE, OutputArchive
+        try:
+            self.archive = OutputArchive(self.base_dir / ARCHIVE_FILE)
+        except sqlite3.Error:
+            self.archive = None
+
+    # === Tasks ===
+
+    def start_task(self, argv: List[str], name: Optional[str] = None,
+                   cwd: Optional[str] = None, tmux: bool = False,
+                   priority: str = 'normal', exclusive: Optional[str] = None) -> Dict:
+        """Queue a task; it starts right away if a slot and its exclusive key are free"""
+        if not argv:
+            raise SupervisorError('empty command')
+        if priority not in PRIORITIES:
+            raise SupervisorError(f"priority must be one of {', '.join(PRIORITIES)}")
+        task = _Task(self._next_id, name or task_name_for(argv), list(argv),
+                     cwd or str(Path.home()), priority, exclusive, tmux)
+        self._next_id += 1
+
+        self.pending.append(task)
+        self._schedule()
+        self._publish()
+        return task.to_dict()
+
+    def stop_task(self, name: str) -> Dict:
+        """Terminate a running task, or cancel a queued one (by name or #id)"""
+        task = self.running.get(name)
+        if task is not None:
+            task.stop_requested = True
+            self._signal(task, signal.SIGTERM)
+            asyncio.get_event_loop().call_later(self.kill_grace, self._signal, task, signal.SIGKILL)
+            return task.to_dict()
+
+        for queued in self.pending:
+            if name in (queued.name, f'#{queued.id}'):
+                self.pending.remove(queued)
+                queued.state = 'cancelled'
+                queued.ended = time.time()
+                self._retire(queued)
+                return queued.to_dict()
+        raise SupervisorError(f'no running or queued task: {name}')
+
+    def list_tasks(self, include_finished: bool = True) -> List[Dict]:
+        tasks = [task.to_dict() for task in self.running.values()]
+        tasks.extend(task.to_dict() for task in self._queue_order())
+        if include_finished:
+            tasks.extend(reversed(self.finished))
+        return tasks
+
+    def get_task(self, name: str) -> Dict:
+        if name in self.running:
+            return self.running[name].to_dict()
+        for task in self._queue_order():
+            if name in (task.name, f'#{task.id}'):
+                return task.to_dict()
+        for record in reversed(self.finished):
+            if name in (record['name'], f"#{record.get('id')}"):
+                return record
+        raise SupervisorError(f'unknown task: {name}')
+
+    # === Scheduling ===
+
+    def _queue_order(self) -> List[_Task]:
+        return sorted(self.pending, key=lambda task: (PRIORITIES.index(task.priority), task.id))
+
+    def _schedule(self):
+        """Start queued tasks while slots are free"""
+        held = {task.exclusive for task in self.running.values()}
+        for task in self._queue_order():
+            if len(self.running) >= self.max_running:
+                break
+            if task.name in self.running or task.exclusive in held:
+                continue  # Mutually exclusive with a running task; keep its place
+            self.pending.remove(task)
+            try:
+                self._launch(task)
+            except SupervisorError as e:
+                task.state = 'failed'
+                task.error = str(e)
+                task.ended = time.time()
+                self._retire(task)
+                continue
+            held.add(task.exclusive)
+
+    def _launch(self, task: _Task):
+        # One string behaves like tmux/start-long-task.sh: run it through sh
+        argv = task.argv
+        command = ['/bin/sh', '-c', argv[0]] if len(argv) == 1 else list(argv)
+        stamp = time.strftime('%Y%m%d-%H%M%S')
+        task.log_path = self.log_dir / f'{task.name}-{stamp}.log'
+
+        try:
+            task.log = open(task.log_path, 'ab', buffering=0)
+            master, slave = pty.openpty()
+        except OSError as e:
+            if task.log is not None:
+                task.log.close()
+            raise SupervisorError(f'could not start {task.name}: {e}')
+        try:
+            task.proc = subprocess.Popen(
+                command, stdin=slave, stdout=slave, stderr=slave, cwd=task.cwd,
+                start_new_session=True, close_fds=True, preexec_fn=_take_terminal,
+                env={**os.environ, 'PHILAUNCH_TASK': task.name},
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            os.close(master)
+            task.log.close()
+            raise SupervisorError(f'could not start {task.name}: {e}')
+        finally:
+            os.close(slave)
+
+        loop = asyncio.get_event_loop()
+        task.pid = task.proc.pid
+        task.state = RUNNING
+        task.started = time.time()
+        task.master_fd = master
+        task.output_done = loop.create_future()
+        try:
+            if task.priority == 'low':
+                try:
+                    os.setpriority(os.PRIO_PGRP, task.pid, LOW_PRIORITY_NICE)
+                except OSError:
+                    pass
+            os.set_blocking(master, False)
+            loop.add_reader(master, self._drain, task)
+            self._watch_exit(task)
+        except OSError as e:
+            self._abort(task)
+            raise SupervisorError(f'could not start {task.name}: {e}')
+        if self.archive is not None:
+            self.archive.start_run(str(task.log_path), 'task', task.name, task.started)
+
+        if task.tmux:
+            task.viewer = loop.create_task(self._open_viewer(task))
+
+        self.running[task.name] = task
+        loop.create_task(self._reap(task))
+
+    def _abort(self, task: _Task):
+        """Kill and reap a task whose launch failed half way"""
+        self._signal(task, signal.SIGKILL)
+        try:
+            os.waitpid(task.pid, 0)
+        except ChildProcessError:
+            pass
+        task.proc.returncode = -signal.SIGKILL
+        self._unwatch_exit(task)
+        self._close_pty(task)
+        task.log.close()
+
+    def _retire(self, task: _Task):
+        self.finished.append(task.to_dict())
+        del self.finished[:-self.history]
+
+    def _signal(self, task: _Task, signum: int):
+        if task.state != RUNNING:
+            return
+        try:
+            os.killpg(task.pid, signum)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    def _drain(self, task: _Task):
+        try:
+            data = os.read(task.master_fd, 65536)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b''  # EIO: every slave fd is closed
+        if data:
+            task.log.write(data)
+            if self.archive is not None:
+                self.archive.append(str(task.log_path), data)
+            return
+        self._close_pty(task)
+
+    def _close_pty(self, task: _Task):
+        if task.master_fd is None:
+            return
+        asyncio.get_event_loop().remove_reader(task.master_fd)
+        os.close(task.master_fd)
+        task.master_fd = None
+        if not task.output_done.done():
+            task.output_done.set_result(None)
+
+    # === Reaping ===
+
+    def _watch_exit(self, task: _Task):
+        loop = asyncio.get_event_loop()
+        task.exited = loop.create_future()
+        try:
+            task.pidfd = os.pidfd_open(task.pid)
+        except (AttributeError, OSError):  # Python < 3.9 or kernel < 5.3
+            if self._sigchld_loop is not loop:
+                loop.add_signal_handler(signal.SIGCHLD, self._collect_all)
+                self._sigchld_loop = loop
+            self._collect(task)  # It may be gone already
+            return
+        loop.add_reader(task.pidfd, self._collect, task)
+
+    def _unwatch_exit(self, task: _Task):
+        if task.pidfd is None:
+            return
+        asyncio.get_event_loop().remove_reader(task.pidfd)
+        os.close(task.pidfd)
+        task.pidfd = None
+
+    def _collect_all(self):
+        for task in list(self.running.values()):
+            if task.pidfd is None:
+                self._collect(task)
+
+    def _collect(self, task: _Task):
+        """Reap the task if it has exited (pidfd readable or SIGCHLD)"""
+        if task.exited.done():
+            return
+        try:
+            pid, status, usage = os.wait4(task.pid, os.WNOHANG)
+        except ChildProcessError:
+            pid, status, usage = task.pid, None, None  # Reaped behind our back
+        if pid == 0:
+            return
+        self._unwatch_exit(task)
+        task.exited.set_result((status, usage))
+
+    async def _reap(self, task: _Task):
+        loop = asyncio.get_event_loop()
+        status, usage = await task.exited
+        task.ended = time.time()
+        if status is None:
+            task.proc.returncode = -1  # Popen must not wait for it either
+            task.state = 'lost'
+        else:
+            task.proc.returncode = status  # Popen must not reap it again
+            task.rusage = _rusage_dict(usage)
+            if os.WIFSIGNALED(status):
+                task.signal = os.WTERMSIG(status)
+                task.exit_code = -task.signal
+                task.state = 'killed'
+            else:
+                task.exit_code = os.WEXITSTATUS(status)
+                task.state = 'exited' if task.exit_code == 0 else 'failed'
+            if task.stop_requested:
+                task.state = 'killed'
+
+        # Background children may keep the pty open; don't wait on them forever
+        try:
+            await asyncio.wait_for(asyncio.shield(task.output_done), 1.0)
+        except asyncio.TimeoutError:
+            self._close_pty(task)
+
+        trailer = (f"\n[philaunch] {task.name} {task.state} "
+                   f"(exit {task.exit_code}) after {task.ended - task.started:.1f}s\n").encode()
+        task.log.write(trailer)
+        task.log.close()
+        if self.archive is not None:
+            self.archive.append(str(task.log_path), trailer)
+            self.archive.end_run(str(task.log_path), task.exit_code)
+
+        if task.viewer is not None:
+            await task.viewer
+        if task.tmux_session:
+            loop.call_later(self.tmux_linger, self._close_viewer, task.tmux_session)
+
+        del self.running[task.name]
+        self._retire(task)
+        self._schedule()
+        self._publish()
+
+    # === tmux viewer ===
+
+    async def _open_viewer(self, task: _Task):
+        """Tail the log in a tmux session named after the task (none if tmux fails)"""
+        if not shutil.which('tmux'):
+            return
+        command = f"exec tail -n +1 -F {_sh_quote(str(task.log_path))}"
+        returncode = await asyncio.get_event_loop().run_in_executor(
+            None, _tmux, 'new-session', '-d', '-s', task.name, command)
+        if returncode == 0:
+            task.tmux_session = task.name
+
+    def _close_viewer(self, session: str):
+        if session in self.running:
+            return  # Name reused by a newer task
+        asyncio.get_event_loop().run_in_executor(None, _tmux, 'kill-session', '-t', session)
+
+    # === Shared state ===
+
+    def _load_previous(self):
+        """Keep finished history; tasks of a dead daemon can't be reaped any more"""
+        try:
+            previous = json.loads(self.state_path.read_text())
+        except (OSError, ValueError):
+            return
+        for record in previous.get('tasks', []):
+            if record.get('state') not in FINISHED_STATES:
+                record['state'] = 'lost'  # Was running or still queued
+            self.finished.insert(0, record)
+            self._next_id = max(self._next_id, (record.get('id') or 0) + 1)
+        del self.finished[:-self.history]
+
+    def _publish(self):
+        _write_json(self.state_path, {
+            'daemon_pid': os.getpid(),
+            'updated': time.time(),
+            'tasks': self.list_tasks(),
+        })
+
+    # === Socket server ===
+
+    async def serve(self):
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+        server = await asyncio.start_unix_server(self._handle, path=str(self.socket_path))
+        os.chmod(self.socket_path, 0o600)
+        self._publish()
+        async with server:
+            await server.serve_forever()
+
+    async def _handle(self, reader: 'asyncio.StreamReader', writer: 'asyncio.StreamWriter'):
+        try:
+            request = json.loads(await reader.readline())
+            response = {'ok': True, 'result': await self._dispatch(request)}
+        except (SupervisorError, OSError) as e:
+            response = {'ok': False, 'error': str(e)}
+        except (ValueError, KeyError, TypeError) as e:
+            response = {'ok': False, 'error': f'bad request: {e}'}
+        writer.write(json.dumps(response).encode() + b'\n')
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _dispatch(self, request: Dict):
+        command = request['cmd']
+        if command == 'start':
+            started = self.start_task(request['argv'], name=request.get('name'),
+                                      cwd=request.get('cwd'), tmux=request.get('tmux', False),
+                                      priority=request.get('priority') or 'normal',
+                                      exclusive=request.get('exclusive'))
+            task = self.running.get(started['name'])
+            if task is not None and task.id == started['id'] and task.viewer is not None:
+                await task.viewer  # Reply with the tmux session it got
+                return task.to_dict()
+            return started
+        if command == 'stop':
+            return self.stop_task(request['name'])
+        if command == 'list':
+            return self.list_tasks(request.get('all', True))
+        if command == 'status':
+            return self.get_task(request['name'])
+        if command == 'ping':
+            return {'pid': os.getpid()}
+        raise SupervisorError(f'unknown command: {command}')
+
+
+def _sh_quote(text: str) -> str:
+    return "'" + text.replace("'", "'\\''") + "'"
+
+
+def _take_terminal():
+    """In the child: make the pty slave (stdin) the controlling tty of its new session"""
+    fcntl.ioctl(0, termios.TIOCSCTTY, 0)
+
+
+def _tmux(*args: str) -> Optional[int]:
+    """Run a short tmux command (off the event loop); None if it failed to run or hung"""
+    try:
+        return subprocess.run(['tmux', *args], capture_output=True, timeout=5).returncode
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run_daemon(base_dir: Optional[Path] = None) -> int:
+    """Run the supervisor in the foreground; exits quietly if one is already up"""
+    base = Path(base_dir) if base_dir else state_dir()
+    lock = open(base / LOCK_FILE, 'w')
+    try:
+        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return 0
+
+    limit = os.environ.get('PHILAUNCH_MAX_TASKS', '')
+    supervisor = TaskSupervisor(base, max_running=int(limit) if limit.isdigit()
+                                else DEFAULT_MAX_RUNNING)
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, loop.stop)
+    try:
+        loop.run_until_complete(supervisor.serve())
+    except RuntimeError:
+        pass  # loop.stop() from a signal handler
+    finally:
+        for task in supervisor.running.values():
+            supervisor._signal(task, signal.SIGTERM)
+        if supervisor.archive is not None:
+            supervisor.archive.close()
+        try:
+            supervisor.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+    return 0
+
+
+class SupervisorClient:
+    """
+    Talks to the daemon (starting it on demand).
+
+    list_tasks() / get_task() fall back to the last published supervisor.json
+    when the daemon is down, so read-only callers never need it running.
+    """
+
+    def __init__(self, base_dir: Optional[Path] = None, timeout: float = 5.0):
+        self.base_dir = Path(base_dir) if base_dir else state_dir()
+        self.socket_path = self.base_dir / SOCKET_FILE
+        self.state_path = self.base_dir / STATE_FILE
+        self.timeout = timeout
+
+    def request(self, command: str, spawn: bool = False, **args):
+        """Send one request; raises SupervisorError on failure"""
+        try:
+            return self._send(command, args)
+        except (FileNotFoundError, ConnectionRefusedError):
+            if not spawn:
+                raise SupervisorError('supervisor is not running')
+        self.ensure_daemon()
+        try:
+            return self._send(command, args)
+        except OSError as e:
+            raise SupervisorError(f'supervisor unreachable: {e}')
+
+    def _send(self, command: str, args: Dict):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout)
+            sock.connect(str(self.socket_path))
+            sock.sendall(json.dumps({'cmd': command, **args}).encode() + b'\n')
+            data = b''
+            while not data.endswith(b'\n'):
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                data += chunk
+        response = json.loads(data or b'{}')
+        if not response.get('ok'):
+            raise SupervisorError(response.get('error', 'no response'))
+        return response['result']
+
+    def ensure_daemon(self, wait: float = 3.0):
+        """Start a detached daemon and wait for its socket"""
+        subprocess.Popen([sys.executable, str(Path(__file__).resolve()), 'daemon'],
+                         stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                         stderr=subprocess.DEVNULL, start_new_session=True,
+                         env={**os.environ, 'PHILAUNCH_STATE_DIR': str(self.base_dir)})
+        deadline = time.monotonic() + wait
+        while time.monotonic() < deadline:
+            try:
+                self._send('ping', {})
+                return
+            except (OSError, ValueError, SupervisorError):
+                time.sleep(0.05)
+        raise SupervisorError('supervisor did not start')
+
+    def start(self, argv: List[str], name: Optional[str] = None,
+              cwd: Optional[str] = None, tmux: bool = False,
+              priority: str = 'normal', exclusive: Optional[str] = None) -> Dict:
+        return self.request('start', spawn=True, argv=argv, name=name, cwd=cwd, tmux=tmux,
+                            priority=priority, exclusive=exclusive)
+
+    def stop(self, name: str) -> Dict:
+        return self.request('stop', name=name)
+
+    def list_tasks(self, include_finished: bool = True) -> List[Dict]:
+        try:
+            return self.request('list', all=include_finished)
+        except SupervisorError:
+            tasks = self._published()
+            return tasks if include_finished else [t for t in tasks
+                                                   if t['state'] not in FINISHED_STATES]
+
+    def get_task(self, name: str) -> Dict:
+        try:
+            return self.request('status', name=name)
+        except SupervisorError:
+            for record in self._published():
+                if record['name'] == name:
+                    return record
+            raise
+
+    def _published(self) -> List[Dict]:
+        try:
+            tasks = json.loads(self.state_path.read_text()).get('tasks', [])
+        except (OSError, ValueError):
+            return []
+        for record in tasks:
+            if record.get('state') in (RUNNING, PENDING):
+                record['state'] = 'unknown'  # Daemon gone; can't vouch for it
+        return tasks
+
+
+# === CLI ===
+
+def _format_task(task: Dict) -> str:
+    usage = task.get('rusage') or {}
+    cpu = f"{usage.get('utime', 0) + usage.get('stime', 0):.1f}s cpu" if usage else ''
+    rss = f"{usage.get('maxrss', 0) // 1024}MB rss" if usage else ''
+    code = '' if task['exit_code'] is None else f"exit {task['exit_code']}"
+    started = time.strftime('%H:%M:%S', time.localtime(task['started'] or task['queued']))
+    wait = f"waited {task['wait']:.1f}s" if task.get('wait') else ''
+    fields = [f"#{task.get('id', '?'):<4}", f"{task['name']:<24}", f"{task['state']:<9}",
+              f"{task.get('priority', 'normal'):<6}", started, f"{task['duration']:8.1f}s",
+              wait, code, cpu, rss, task.get('error') or '']
+    return '  '.join(field for field in fields if field)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description='PhiLaunch task supervisor')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('daemon', help='run the supervisor in the foreground')
+
+    start = sub.add_parser('start', help='launch a task')
+    start.add_argument('--name')
+    start.add_argument('--cwd')
+    start.add_argument('--tmux', action='store_true', help='also open a tmux viewer session')
+    start.add_argument('--priority', choices=PRIORITIES, default='normal')
+    start.add_argument('--exclusive', help='mutual-exclusion key (default: the task name)')
+    start.add_argument('argv', nargs=argparse.REMAINDER)
+
+    stop = sub.add_parser('stop', help='terminate a running task or cancel a queued one')
+    stop.add_argument('name')
+
+    listing = sub.add_parser('list', help='show tasks')
+    listing.add_argument('--all', action='store_true', help='include finished tasks')
+    listing.add_argument('--json', action='store_true')
+
+    status = sub.add_parser('status', help='show one task')
+    status.add_argument('name')
+    status.add_argument('--json', action='store_true')
+
+    logs = sub.add_parser('logs', help='print the tail of a task log')
+    logs.add_argument('name')
+    logs.add_argument('-n', '--lines', type=int, default=50)
+
+    args = parser.parse_args(argv)
+    if args.command == 'daemon':
+        return run_daemon()
+
+    client = SupervisorClient()
+    try:
+        if args.command == 'start':
+            command = args.argv[1:] if args.argv[:1] == ['--'] else args.argv
+            task = client.start(command, name=args.name, cwd=args.cwd, tmux=args.tmux,
+                                priority=args.priority, exclusive=args.exclusive)
+            if task['state'] == PENDING:
+                print(f"⏸ Task queued: {task['name']} (#{task['id']}, {task['priority']} priority)")
+            elif task['state'] != RUNNING:
+                print(f"✗ Task {task['state']}: {task['name']} {task['error'] or ''}")
+                return 1
+            else:
+                print(f"✓ Task started: {task['name']} (pid {task['pid']})")
+                print(f"  Log: {task['log']}")
+                if task['tmux_session']:
+                    print(f"  Attach: tmux attach -t {task['tmux_session']}")
+        elif args.command == 'stop':
+            client.stop(args.name)
+            print(f"✓ Stopping task: {args.name}")
+        elif args.command == 'list':
+            tasks = client.list_tasks(include_finished=args.all)
+            if args.json:
+                print(json.dumps({'tasks': tasks, 'count': len(tasks)}))
+            elif not tasks:
+                print('No supervised tasks')
+            else:
+                for task in tasks:
+                    print(_format_task(task))
+        elif args.command == 'status':
+            task = client.get_task(args.name)
+            print(json.dumps(task, indent=2) if args.json else _format_task(task))
+        elif args.command == 'logs':
+            from philaunch_logpack import LogPackError, tail_lines
+            task = client.get_task(args.name)
+            try:
+                print('\n'.join(tail_lines(Path(task['log']), args.lines)))
+            except LogPackError as e:
+                raise SupervisorError(str(e))
+    except (SupervisorError, OSError) as e:
+        print(f"✗ {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,137 @@
+"""
+PhiLaunch Task Tree Model
+Keyed RUNNING TASKS tree that applies add/remove/rename deltas in place
+"""
+
+from datetime import datetime
+from typing import Dict, List
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QTreeWidgetItem
+
+from philaunch_sessions import diff_sessions
+from philaunch_task_usage import format_bytes
+
+
+# Per-session metadata lives on the item next to the "task:<name>" payload
+SESSION_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+class TaskTreeModel:
+    """
+    Maps session name -> QTreeWidgetItem under the RUNNING TASKS root.
+
+    apply() only touches items that actually changed, so selection, expansion
+    and scroll position survive refreshes and nothing is reallocated when the
+    session list is unchanged. set_usage() appends live CPU/RSS to each item
+    and, with `sort_by_usage`, keeps the top consumers first.
+    """
+
+    def __init__(self, root: QTreeWidgetItem, foreground=None):
+        self.root = root
+        self.foreground = foreground
+        self.items: Dict[str, QTreeWidgetItem] = {}
+        self.sessions: Dict[str, Dict] = {}
+        self.usage: Dict[str, Dict] = {}
+        self.sort_by_usage = False
+
+    def apply(self, sessions: List[Dict]) -> Dict[str, List]:
+        """Apply a full session list as deltas. Returns the delta."""
+        delta = diff_sessions(self.sessions, sessions)
+
+        for name in delta['removed']:
+            item = self.items.pop(name)
+            self.sessions.pop(name)
+            self.usage.pop(name, None)
+            self.root.removeChild(item)
+
+        for old_name, session in delta['renamed']:
+            item = self.items.pop(old_name)
+            self.sessions.pop(old_name)
+            if old_name in self.usage:
+                self.usage[session['name']] = self.usage.pop(old_name)
+            self._store(item, session)
+
+        for session in delta['updated']:
+            self._store(self.items[session['name']], session)
+
+        for session in delta['added']:
+            item = QTreeWidgetItem(self.root)
+            if self.foreground is not None:
+                item.setForeground(0, self.foreground)
+            self._store(item, session)
+
+        if delta['added'] and self.sort_by_usage:
+            self._sort()
+        return delta
+
+    def set_usage(self, usage: Dict[str, Dict]):
+        """Live per-task usage ({name: {'cpu', 'rss', 'procs'}}, see philaunch_task_usage)"""
+        self.usage = {name: stats for name, stats in usage.items() if name in self.items}
+        for name, item in self.items.items():
+            self._label(item, name)
+        if self.sort_by_usage:
+            self._sort()
+
+    def set_sort_by_usage(self, enabled: bool):
+        """Order tasks by CPU (then RSS) instead of creation order"""
+        self.sort_by_usage = enabled
+        if enabled:
+            self._sort()
+        else:
+            self._reorder(sorted(self.items, key=lambda n: self.sessions[n].get('created') or 0))
+
+    def session(self, name: str) -> Dict:
+        return self.sessions.get(name, {})
+
+    def __len__(self):
+        return len(self.items)
+
+    def _store(self, item: QTreeWidgetItem, session: Dict):
+        name = session['name']
+
+        item.setData(0, Qt.ItemDataRole.UserRole, f"task:{name}")
+        item.setData(0, SESSION_ROLE, session)
+
+        self.items[name] = item
+        self.sessions[name] = session
+        self._label(item, name)
+
+    def _label(self, item: QTreeWidgetItem, name: str):
+        session = self.sessions[name]
+        usage = self.usage.get(name)
+
+        text = f"  ├─ ▶ {name}"
+        if usage:
+            text += f"  {usage['cpu']:.0f}% {format_bytes(usage['rss'])}"
+        if item.text(0) != text:
+            item.setText(0, text)
+
+        created = session.get('created')
+        started = datetime.fromtimestamp(created).strftime('%Y-%m-%d %H:%M:%S') if created else '?'
+        tooltip = (f"{name}\nState: {session.get('state', 'running')}\nStarted: {started}\n"
+                   f"Windows: {session.get('windows', '?')}")
+        if usage:
+            tooltip += (f"\nCPU: {usage['cpu']:.1f}%\nRSS: {format_bytes(usage['rss'])}"
+                        f"\nProcesses: {usage['procs']}")
+        item.setToolTip(0, tooltip)
+
+    def _sort(self):
+        def load(name):
+            stats = self.usage.get(name, {})
+            return (-stats.get('cpu', 0.0), -stats.get('rss', 0), name)
+        self._reorder(sorted(self.items, key=load))
+
+    def _reorder(self, names: List[str]):
+        """Move children into `names` order, touching nothing if already there"""
+        current = [self.root.child(i) for i in range(self.root.childCount())]
+        wanted = [self.items[name] for name in names]
+        if current == wanted:
+            return
+        tree = self.root.treeWidget()
+        selected = tree.currentItem() if tree is not None else None
+        for item in wanted:
+            self.root.removeChild(item)
+        self.root.addChildren(wanted)
+        if selected in wanted:
+            tree.setCurrentItem(selected)
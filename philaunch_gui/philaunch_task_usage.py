@@ -0,0 +1,203 @@
+"""
+PhiLaunch Task Usage Collector
+Per-task CPU and RSS from each task's process tree in /proc
+"""
+
+import os
+import subprocess
+import time
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from philaunch_sessions import WATCH_SESSION
+
+
+CLK_TCK = os.sysconf('SC_CLK_TCK')
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+
+
+def _read(path: str) -> Optional[bytes]:
+    # os.open/os.read: no buffered file object per /proc read
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        return os.read(fd, 4096)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+
+def read_stat(proc_root: str, pid: int) -> Optional[Tuple[int, int, int, int, int]]:
+    """(ppid, utime+stime ticks, starttime ticks, rss bytes, threads) from /proc/<pid>/stat"""
+    data = _read(f'{proc_root}/{pid}/stat')
+    if not data:
+        return None
+    # comm may contain spaces and parens: fields restart after the last ')'
+    fields = data[data.rfind(b')') + 2:].split(b' ', 22)
+    try:
+        return (int(fields[1]), int(fields[11]) + int(fields[12]),
+                int(fields[19]), int(fields[21]) * PAGE_SIZE, int(fields[17]))
+    except (IndexError, ValueError):
+        return None
+
+
+def tmux_pane_pids(tmux_bin: str = 'tmux') -> Dict[str, List[int]]:
+    """session name -> pane process ids (one tmux call for all sessions)"""
+    try:
+        result = subprocess.run(
+            [tmux_bin, 'list-panes', '-a', '-F', '#{session_name}\t#{pane_pid}'],
+            capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.TimeoutExpired):
+        return {}
+    roots: Dict[str, List[int]] = {}
+    for line in result.stdout.splitlines():
+        name, _, pid = line.rpartition('\t')
+        if name and name != WATCH_SESSION and pid.isdigit():
+            roots.setdefault(name, []).append(int(pid))
+    return roots
+
+
+class TaskUsageCollector:
+    """
+    Samples CPU and RSS per task.
+
+    Each task is a set of root pids (tmux pane processes or a supervised
+    task's pid). sample() walks only those trees via
+    /proc/<pid>/task/<tid>/children and reads one stat file per process, so
+    the cost follows the size of the task trees rather than the host's
+    process count. Leaf processes keep their cached (empty) child list and
+    are only re-checked every `relink_every` samples; roots and processes
+    that already have children are re-read every time, which is where new
+    work gets forked in practice. CPU is the delta of utime+stime per
+    (pid, starttime) since the previous sample. Kernels without
+    CONFIG_PROC_CHILDREN fall back to a full /proc scan for the parent links.
+    """
+
+    def __init__(self, proc_root: str = '/proc', relink_every: int = 5):
+        self.proc_root = proc_root
+        self.relink_every = relink_every
+        self.roots: Dict[str, List[int]] = {}
+        self.usage: Dict[str, Dict] = {}
+        self.last_walk_ms = 0.0
+
+        self._ticks: Dict[Tuple[int, int], int] = {}
+        self._kids: Dict[Tuple[int, int], List[int]] = {}
+        self._samples = 0
+        self._last_uptime = None
+        self._children_files = os.path.exists(
+            f'{proc_root}/{os.getpid()}/task/{os.getpid()}/children')
+
+    def set_roots(self, roots: Dict[str, Iterable[int]]):
+        """Task name -> root pids; takes effect on the next sample()"""
+        self.roots = {name: list(pids) for name, pids in roots.items()}
+
+    def sample(self) -> Dict[str, Dict]:
+        """{name: {'cpu': %, 'rss': bytes, 'procs': n}} for every task"""
+        started = time.perf_counter()
+        uptime = self._uptime()
+        elapsed = uptime - self._last_uptime if self._last_uptime is not None else None
+        children_of = None if self._children_files else self._parent_links()
+        relink = self._samples % self.relink_every == 0
+        self._samples += 1
+
+        ticks: Dict[Tuple[int, int], int] = {}
+        kids_of: Dict[Tuple[int, int], List[int]] = {}
+        seen = set()
+        usage = {}
+        for name, roots in self.roots.items():
+            cpu_ticks, rss, procs = 0, 0, 0
+            root_set = set(roots)
+            queue = deque(pid for pid in roots if pid not in seen)
+            seen.update(queue)
+            while queue:
+                pid = queue.popleft()
+                stat = read_stat(self.proc_root, pid)
+                if stat is None:
+                    continue
+                _, total, start, resident, threads = stat
+                key = (pid, start)
+                ticks[key] = total
+                cpu_ticks += self._delta(key, total, start)
+                rss += resident
+                procs += 1
+
+                if children_of is not None:
+                    kids = children_of.get(pid, [])
+                else:
+                    kids = self._kids.get(key)
+                    if kids is None or kids or relink or pid in root_set:
+                        kids = self._children(pid, threads)
+                kids_of[key] = kids
+                for child in kids:
+                    if child not in seen:
+                        seen.add(child)
+                        queue.append(child)
+
+            cpu = cpu_ticks / CLK_TCK / elapsed * 100 if elapsed else 0.0
+            usage[name] = {'cpu': round(cpu, 1), 'rss': rss, 'procs': procs}
+
+        self._ticks = ticks
+        self._kids = kids_of
+        self._last_uptime = uptime
+        self.usage = usage
+        self.last_walk_ms = (time.perf_counter() - started) * 1000
+        return usage
+
+    def top(self, key: str = 'cpu', limit: Optional[int] = None) -> List[Tuple[str, Dict]]:
+        """Tasks ordered by `key` (cpu or rss), biggest first"""
+        ranked = sorted(self.usage.items(), key=lambda item: item[1][key], reverse=True)
+        return ranked[:limit] if limit else ranked
+
+    # === /proc ===
+
+    def _delta(self, key: Tuple[int, int], total: int, start: int) -> int:
+        previous = self._ticks.get(key)
+        if previous is not None:
+            return total - previous
+        # First sighting: count it only if it started after the last sample
+        if self._last_uptime is not None and start / CLK_TCK >= self._last_uptime:
+            return total
+        return 0
+
+    def _children(self, pid: int, threads: int) -> List[int]:
+        base = f'{self.proc_root}/{pid}/task'
+        if threads == 1:
+            tids = [str(pid)]  # Single-threaded: no need to list task/
+        else:
+            try:
+                tids = os.listdir(base)
+            except OSError:
+                return []
+        kids = []
+        for tid in tids:
+            data = _read(f'{base}/{tid}/children')
+            if data:
+                kids.extend(map(int, data.split()))
+        return kids
+
+    def _parent_links(self) -> Dict[int, List[int]]:
+        children_of: Dict[int, List[int]] = {}
+        for entry in os.listdir(self.proc_root):
+            if entry.isdigit():
+                stat = read_stat(self.proc_root, int(entry))
+                if stat is not None:
+                    children_of.setdefault(stat[0], []).append(int(entry))
+        return children_of
+
+    def _uptime(self) -> float:
+        try:
+            return float(_read(f'{self.proc_root}/uptime').split()[0])
+        except (AttributeError, ValueError, IndexError):
+            return time.monotonic()
+
+
+def format_bytes(size: int) -> str:
+    """Compact RSS label (K/M/G)"""
+    for unit in ('K', 'M', 'G'):
+        size /= 1024
+        if size < 1024 or unit == 'G':
+            return f"{size:.0f}{unit}" if size >= 10 else f"{size:.1f}{unit}"
+    return f"{size}"
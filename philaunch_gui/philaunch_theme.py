@@ -0,0 +1,189 @@
+"""
+PhiLaunch Theme Compiler
+Turns philaunch_colors into one cached application-level QSS
+
+Widgets no longer carry their own stylesheets - they only get an object name
+or a `role` / `surface` / `tone` property (see tag()) and the compiled sheet
+matches on those selectors. Swapping themes is a single apply_theme() call.
+"""
+
+from functools import lru_cache
+from typing import Dict
+
+from philaunch_colors import COLORS, INTERACTION_STATES, COMPONENT_COLORS
+
+
+THEMES: Dict[str, Dict[str, Dict[str, str]]] = {
+    'soft_fade': {
+        'colors': COLORS,
+        'states': INTERACTION_STATES,
+        'components': COMPONENT_COLORS,
+    },
+}
+
+DEFAULT_THEME = 'soft_fade'
+
+# Quick action button tones -> palette entry
+TONES = {
+    'running': ('components', 'task_running'),
+    'stopped': ('components', 'task_stopped'),
+    'info': ('colors', 'info'),
+    'warning': ('colors', 'warning'),
+}
+
+
+def register_theme(name: str, colors: Dict[str, str], states: Dict[str, str],
+                   components: Dict[str, str]):
+    """Add or replace a theme (drops any cached sheet for it)"""
+    THEMES[name] = {'colors': colors, 'states': states, 'components': components}
+    compile_stylesheet.cache_clear()
+
+
+def tag(widget, role: str = None, **properties):
+    """Set the selector properties the compiled sheet matches on"""
+    if role is not None:
+        widget.setProperty('role', role)
+    for key, value in properties.items():
+        widget.setProperty(key, value)
+    return widget
+
+
+@lru_cache(maxsize=None)
+def compile_stylesheet(name: str = DEFAULT_THEME) -> str:
+    """Build the full application stylesheet for a theme (cached per name)"""
+    theme = THEMES[name]
+    c, s = theme['colors'], theme['states']
+
+    tones = '\n'.join(
+        f'QPushButton[role="quickAction"][tone="{tone}"] {{ color: {theme[group][key]}; }}'
+        for tone, (group, key) in TONES.items()
+    )
+
+    return f"""
+QWidget {{
+    background-color: {c['bg_base']};
+    color: {c['text_primary']};
+    font-family: 'Monospace';
+}}
+
+QWidget[surface="panel"], QWidget[surface="panel"] QLabel {{
+    background-color: {c['bg_panel']};
+}}
+
+#titleBar {{ border-bottom: 2px solid {c['border_bright']}; }}
+#toolbar {{ border-bottom: 1px solid {c['border_dim']}; }}
+#statusBar {{ border-top: 1px solid {c['border_dim']}; }}
+
+QLabel[role="title"] {{ color: {c['primary']}; }}
+QLabel[role="header"] {{ color: {c['primary']}; padding: 5px; }}
+QLabel[role="indicatorName"] {{ color: {c['text_secondary']}; }}
+QLabel[role="indicatorValue"] {{ color: {c['info']}; }}
+QLabel[role="status"] {{ color: {c['text_secondary']}; }}
+QLabel[role="version"] {{ color: {c['text_dim']}; }}
+
+QFrame[role="separator"] {{
+    color: {c['border_dim']};
+    max-width: 1px;
+}}
+
+QPushButton[role="window"] {{
+    background-color: transparent;
+    color: {c['text_secondary']};
+    border: none;
+}}
+QPushButton[role="window"]:hover {{
+    background-color: {c['bg_card']};
+    color: {c['primary']};
+}}
+
+QPushButton[role="toolbar"] {{
+    background-color: {s['normal_bg']};
+    color: {c['text_primary']};
+    border: 1px solid {c['border_dim']};
+    border-radius: 4px;
+    padding: 6px 12px;
+}}
+QPushButton[role="toolbar"]:hover {{
+    background-color: {s['hover_bg']};
+    border: 1px solid {c['border_bright']};
+    color: {c['primary']};
+}}
+QPushButton[role="toolbar"]:pressed {{
+    background-color: {s['pressed_bg']};
+}}
+
+QPushButton[role="quickAction"] {{
+    background-color: {c['bg_card']};
+    border: 2px solid {c['border_dim']};
+    border-radius: 6px;
+    padding: 10px;
+}}
+QPushButton[role="quickAction"]:hover {{
+    background-color: {s['hover_bg']};
+    border: 2px solid {c['border_bright']};
+}}
+QPushButton[role="quickAction"]:pressed {{
+    background-color: {s['pressed_bg']};
+}}
+{tones}
+
+QSplitter::handle {{
+    background-color: {c['border_dim']};
+}}
+QSplitter::handle:hover {{
+    background-color: {c['border_bright']};
+}}
+
+QTreeWidget#scriptTree {{
+    background-color: {c['bg_card']};
+    color: {c['text_primary']};
+    border: 1px solid {c['border_dim']};
+    border-radius: 4px;
+    padding: 5px;
+}}
+QTreeWidget#scriptTree::item {{
+    padding: 6px;
+    border-left: 3px solid transparent;
+}}
+QTreeWidget#scriptTree::item:hover {{
+    background-color: {s['hover_bg']};
+    color: {c['primary']};
+}}
+QTreeWidget#scriptTree::item:selected {{
+    background-color: {s['selected_bg']};
+    border-left: 3px solid {c['primary']};
+    color: {c['primary']};
+    font-weight: bold;
+}}
+
+QListView#journalView {{
+    background-color: {c['bg_input']};
+    color: {c['text_primary']};
+    border: 1px solid {c['border_dim']};
+    border-radius: 4px;
+}}
+QListView#journalView::item:selected {{
+    background-color: {s['selected_bg']};
+    color: {c['primary']};
+}}
+
+QLineEdit, QComboBox {{
+    background-color: {c['bg_input']};
+    border: 1px solid {c['border_dim']};
+    border-radius: 4px;
+    padding: 4px;
+}}
+
+QPlainTextEdit#liveOutput {{
+    background-color: {c['bg_input']};
+    color: {c['text_primary']};
+    border: 1px solid {c['border_dim']};
+    border-radius: 4px;
+    padding: 10px;
+}}
+"""
+
+
+def apply_theme(app, name: str = DEFAULT_THEME):
+    """Install a theme on the QApplication - one parse, one cascade"""
+    app.setStyleSheet(compile_stylesheet(name))
@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""
+PhiLaunch Time-Series Store
+Per-metric ring segments at 1 s, 1 min and 1 h with min/max/avg/p95 rollups
+
+Each metric is one fixed-size, memory-mapped file under
+`<state>/timeseries/` holding three segments (1 s for an hour, 1 min for 30
+days, 1 h for a year). A bucket's slot is `bucket % capacity` and stores
+the bucket number next to its rollup, so stale slots from a previous lap or
+a gap are recognised without any bookkeeping. Every sample updates the open
+bucket of all three segments in place: min/max/count/avg exactly, p95 with
+a P² estimator. A query picks the coarsest segment that still gives the
+requested number of points, so 30 days is a few hundred hourly rows.
+
+Every metric has a single writer, since two sample streams in one bucket
+would mix their counts and averages and overwrite each other's p95
+estimate. While `record` runs it holds `.recorder.lock` and owns
+RECORDER_METRICS; the dashboard server then only adds the metrics it alone
+knows (probe RTTs). A bucket that is open when the recorder starts or stops
+may still contain samples from both. Readers need no lock.
+
+Usage:
+    philaunch_timeseries.py record [--interval SECONDS]   (CPU, RAM, disk, WoW log; runs forever)
+    philaunch_timeseries.py query METRIC [--range 24h] [--points N] [--json]
+    philaunch_timeseries.py info
+"""
+
+import argparse
+import bisect
+import fcntl
+import json
+import math
+import mmap
+import os
+import re
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from philaunch_paths import state_dir
+
+
+MAGIC = b'PLTS\x00\x01'
+HEADER_SIZE = 64
+_TIER = struct.Struct('<II')  # resolution (s), capacity (buckets)
+
+# (resolution seconds, buckets): 1 hour at 1 s, 30 days at 1 min, 1 year at 1 h
+TIERS = ((1, 3600), (60, 30 * 1440), (3600, 365 * 24))
+
+# Columns of a segment, in file order; 'I' bucket numbers last until 2106
+COLUMNS = (('bucket', 'I'), ('min', 'f'), ('max', 'f'), ('avg', 'f'), ('p95', 'f'), ('count', 'I'))
+SLOT_BYTES = 4 * len(COLUMNS)
+
+DEFAULT_POINTS = 300
+RECORDER_LOCK = '.recorder.lock'
+RECORDER_METRICS = ('cpu', 'mem', 'disk', 'wow.avg', 'wow.jitter', 'wow.loss')
+_RANGE_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+
+
+class TimeSeriesError(Exception):
+    """Unusable store file or query"""
+
+
+def store_dir() -> Path:
+    path = state_dir() / 'timeseries'
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def parse_range(text: str) -> float:
+    """'90s', '15m', '24h', '7d', '2w' or plain seconds"""
+    match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([smhdw]?)\s*', text or '')
+    if not match:
+        raise TimeSeriesError(f"bad range '{text}' (e.g. 1h, 24h, 7d, 30d)")
+    seconds = float(match.group(1)) * _RANGE_UNITS.get(match.group(2) or 's', 1)
+    if seconds <= 0:
+        raise TimeSeriesError(f"bad range '{text}'")
+    return seconds
+
+
+class P2Quantile:
+    """
+    Streaming quantile estimate in constant space (Jain & Chlamtac's P²).
+    Exact until five samples have been seen.
+    """
+
+    __slots__ = ('p', 'heights', 'positions', 'desired', 'increments')
+
+    def __init__(self, p: float = 0.95):
+        self.p = p
+        self.heights: List[float] = []
+        self.positions = [0, 1, 2, 3, 4]
+        self.desired = [0.0, 2 * p, 4 * p, 2 + 2 * p, 4.0]
+        self.increments = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+
+    def add(self, x: float):
+        q = self.heights
+        if len(q) < 5:
+            bisect.insort(q, x)
+            return
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = bisect.bisect_right(q, x, 1, 4) - 1
+        n = self.positions
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+        for i in (1, 2, 3):
+            d = self.desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                parabolic = q[i] + d / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+                if q[i - 1] < parabolic < q[i + 1]:
+                    q[i] = parabolic
+                else:
+                    q[i] += d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                n[i] += d
+
+    def value(self) -> float:
+        q = self.heights
+        if len(q) < 5:
+            return q[max(0, math.ceil(self.p * len(q)) - 1)] if q else math.nan
+        return q[2]
+
+
+class _Segment:
+    """One resolution inside a metric file: column views over the shared mmap"""
+
+    def __init__(self, view: memoryview, offset: int, resolution: int, capacity: int):
+        self.resolution = resolution
+        self.capacity = capacity
+        self.columns = {}
+        for name, code in COLUMNS:
+            self.columns[name] = view[offset:offset + capacity * 4].cast(code)
+            offset += capacity * 4
+        # (bucket, p95 estimate): in memory, so a bucket needs a single writer process
+        self.estimator: Optional[Tuple[int, P2Quantile]] = None
+
+    def add(self, value: float, ts: float):
+        bucket = int(ts // self.resolution)
+        slot = bucket % self.capacity
+        c = self.columns
+        if c['bucket'][slot] != bucket or not c['count'][slot]:  # A zeroed slot is no bucket 0
+            c['bucket'][slot] = bucket
+            c['min'][slot] = c['max'][slot] = c['avg'][slot] = value
+            c['count'][slot] = 0
+        elif value < c['min'][slot]:
+            c['min'][slot] = value
+        elif value > c['max'][slot]:
+            c['max'][slot] = value
+        count = c['count'][slot] + 1
+        c['count'][slot] = count
+        c['avg'][slot] += (value - c['avg'][slot]) / count
+        if self.estimator is None or self.estimator[0] != bucket:
+            self.estimator = (bucket, P2Quantile(0.95))
+        self.estimator[1].add(value)
+        c['p95'][slot] = self.estimator[1].value()
+
+    def rows(self, first: int, last: int) -> List[Tuple[int, float, float, float, float, int]]:
+        """(bucket, min, max, avg, p95, count) for stored buckets in first..last"""
+        first = max(first, last - self.capacity + 1)
+        if first > last:
+            return []
+        start, length = first % self.capacity, last - first + 1
+        columns = []
+        for name, _ in COLUMNS:
+            column = self.columns[name]
+            end = start + length
+            if end <= self.capacity:
+                columns.append(column[start:end].tolist())
+            else:
+                columns.append(column[start:].tolist() + column[:end - self.capacity].tolist())
+        return [row for expected, row in enumerate(zip(*columns), first)
+                if row[0] == expected and row[5]]
+
+
+class MetricFile:
+    """The three segments of one metric, memory-mapped (pages are only allocated when used)"""
+
+    def __init__(self, path: Path, tiers=TIERS, writable: bool = True):
+        self.path = path
+        size = HEADER_SIZE + sum(capacity * SLOT_BYTES for _, capacity in tiers)
+        header = MAGIC + struct.pack('<B', len(tiers)) + b''.join(
+            _TIER.pack(resolution, capacity) for resolution, capacity in tiers)
+        fd = os.open(path, (os.O_RDWR | os.O_CREAT) if writable else os.O_RDONLY, 0o644)
+        try:
+            if writable and os.fstat(fd).st_size == 0:
+                os.ftruncate(fd, size)
+                os.pwrite(fd, header, 0)
+            if os.fstat(fd).st_size != size or os.pread(fd, len(header), 0) != header:
+                raise TimeSeriesError(f"{path.name}: different layout (delete it to start over)")
+            self._map = mmap.mmap(fd, size, prot=mmap.PROT_READ | (mmap.PROT_WRITE if writable else 0))
+        finally:
+            os.close(fd)
+        self._view = memoryview(self._map)
+        self.segments = []
+        offset = HEADER_SIZE
+        for resolution, capacity in tiers:
+            self.segments.append(_Segment(self._view, offset, resolution, capacity))
+            offset += capacity * SLOT_BYTES
+
+    def add(self, value: float, ts: float):
+        for segment in self.segments:
+            segment.add(value, ts)
+
+    def choose(self, seconds: float, points: int) -> _Segment:
+        """Coarsest segment that covers `seconds` and still gives `points` buckets"""
+        covering = [s for s in self.segments if s.resolution * s.capacity >= seconds] or self.segments[-1:]
+        fine_enough = [s for s in covering if s.resolution <= seconds / points]
+        return fine_enough[-1] if fine_enough else covering[0]
+
+    def close(self):
+        for segment in self.segments:
+            for column in segment.columns.values():
+                column.release()
+        self._view.release()
+        self._map.close()
+
+
+class TimeSeriesStore:
+    """
+    Directory of MetricFiles.
+
+    `add` takes a batch of samples under the store's flock (which keeps the
+    files consistent, not the statistics: see the module docstring). Metric
+    names are limited to [A-Za-z0-9_.-] since they are file names.
+    """
+
+    def __init__(self, directory: Optional[Path] = None, tiers=TIERS):
+        self.directory = Path(directory) if directory else store_dir()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.tiers = tiers
+        self._files: Dict[str, MetricFile] = {}
+        self._writable: Dict[str, bool] = {}
+
+    def recorder_running(self) -> bool:
+        """True while a `record` process owns RECORDER_METRICS"""
+        try:
+            with open(self.directory / RECORDER_LOCK) as lock:
+                fcntl.flock(lock, fcntl.LOCK_SH | fcntl.LOCK_NB)
+        except FileNotFoundError:
+            return False
+        except OSError:
+            return True
+        return False
+
+    def metrics(self) -> List[str]:
+        return sorted(path.stem for path in self.directory.glob('*.ts'))
+
+    def _file(self, name: str, writable: bool) -> Optional[MetricFile]:
+        if not re.fullmatch(r'[A-Za-z0-9_.-]+', name):
+            raise TimeSeriesError(f"bad metric name '{name}'")
+        if name in self._files and (self._writable[name] or not writable):
+            return self._files[name]
+        path = self.directory / f"{name}.ts"
+        if not writable and not path.exists():
+            return None
+        if name in self._files:
+            self._files.pop(name).close()
+        self._files[name] = MetricFile(path, self.tiers, writable)
+        self._writable[name] = writable
+        return self._files[name]
+
+    def add(self, samples: Dict[str, Optional[float]], ts: Optional[float] = None):
+        """Record one value per metric (None and NaN are skipped)"""
+        ts = time.time() if ts is None else ts
+        values = {name: float(value) for name, value in samples.items()
+                  if value is not None and not math.isnan(float(value))}
+        if not values:
+            return
+        with open(self.directory / '.lock', 'w') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            for name, value in values.items():
+                self._file(name, writable=True).add(value, ts)
+
+    def query(self, name: str, seconds: float, points: int = DEFAULT_POINTS,
+              now: Optional[float] = None) -> Optional[Dict]:
+        """
+        Columns {'t', 'min', 'max', 'avg', 'p95', 'count'} for the last
+        `seconds`, at most `points` rows (times are each point's start).
+        Merged points take the min of mins, max of maxes, count-weighted avg
+        and the count-weighted mean of the buckets' p95 (an estimate).
+        """
+        metric = self._file(name, writable=False)
+        if metric is None:
+            return None
+        now = time.time() if now is None else now
+        points = max(1, points)
+        segment = metric.choose(seconds, points)
+        resolution = segment.resolution
+        last = int(now // resolution)
+        first = int((now - seconds) // resolution) + 1
+        per_point = max(1, math.ceil((last - first + 1) / points))
+        series = {'t': [], 'min': [], 'max': [], 'avg': [], 'p95': [], 'count': []}
+        group, rows = None, []
+        for row in segment.rows(first, last) + [None]:
+            key = None if row is None else (row[0] - first) // per_point
+            if rows and key != group:
+                count = sum(r[5] for r in rows)
+                series['t'].append((first + group * per_point) * resolution)
+                series['min'].append(round(min(r[1] for r in rows), 3))
+                series['max'].append(round(max(r[2] for r in rows), 3))
+                series['avg'].append(round(sum(r[3] * r[5] for r in rows) / count, 3))
+                series['p95'].append(round(sum(r[4] * r[5] for r in rows) / count, 3))
+                series['count'].append(count)
+                rows = []
+            group = key
+            if row is not None:
+                rows.append(row)
+        return {'metric': name, 'resolution': resolution, 'step': per_point * resolution,
+                'series': series}
+
+    def close(self):
+        for metric in self._files.values():
+            metric.close()
+        self._files.clear()
+
+
+# === Samples ===
+
+def metrics_samples(document: Dict) -> Dict[str, Optional[float]]:
+    """Values worth keeping from the dashboard's metrics.json"""
+    samples = {}
+    for key, name in (('cpu', 'cpu'), ('memory', 'mem'), ('disk', 'disk')):
+        samples[name] = _number((document.get(key) or {}).get('percent'))
+    for target in (document.get('network') or {}).get('targets') or []:
+        if re.fullmatch(r'[A-Za-z0-9_.-]+', str(target.get('name', ''))):
+            samples[f"net.{target['name']}"] = _number(target.get('rtt_ms'))
+    return samples
+
+
+def wow_samples(document: Dict) -> Dict[str, Optional[float]]:
+    """Values worth keeping from the dashboard's wow.json"""
+    stats = document.get('stats') or {}
+    return {'wow.avg': _number(stats.get('avg_latency')),
+            'wow.jitter': _number(stats.get('jitter')),
+            'wow.loss': _number(stats.get('loss'))}
+
+
+def _number(value) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _wow_line_samples(line: str) -> Dict[str, Optional[float]]:
+    fields = dict(re.findall(r'(Avg|Jitter|Loss)=([0-9.]+)', line))
+    return {'wow.avg': _number(fields.get('Avg')), 'wow.jitter': _number(fields.get('Jitter')),
+            'wow.loss': _number(fields.get('Loss'))}
+
+
+def record(store: TimeSeriesStore, interval: float = 1.0):
+    """Sample CPU/RAM (/proc), root disk usage and the newest WoW log line forever"""
+    from philaunch_logpack import tail_lines
+    from philaunch_metrics import SystemSampler
+    from philaunch_paths import log_dir
+    lock = open(store.directory / RECORDER_LOCK, 'w')  # Held (open) until the process exits
+    try:
+        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock.close()
+        raise TimeSeriesError("another recorder is already writing this store")
+    sampler = SystemSampler()
+    last_wow = None
+    while True:
+        started = time.time()
+        status = sampler.sample()
+        samples = {'cpu': status.get('cpu'), 'mem': status.get('ram')}
+        try:
+            disk = os.statvfs('/')
+            samples['disk'] = 100.0 * (1 - disk.f_bavail / disk.f_blocks) if disk.f_blocks else None
+        except OSError:
+            pass
+        logs = sorted(log_dir().glob('wow_connection_*.log*'))
+        if logs:
+            try:
+                line = (tail_lines(logs[-1], 1) or [''])[0]
+            except Exception:  # Partially written or foreign file
+                line = ''
+            if line and line != last_wow:  # Only new monitor lines
+                last_wow = line
+                samples.update(_wow_line_samples(line))
+        store.add(samples, started)
+        time.sleep(max(0.0, interval - (time.time() - started)))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    sub = parser.add_subparsers(dest='command', required=True)
+    recorder = sub.add_parser('record', help='sample CPU, RAM, disk and WoW latency forever')
+    recorder.add_argument('--interval', type=float, default=1.0)
+    query = sub.add_parser('query', help='rollups of one metric')
+    query.add_argument('metric')
+    query.add_argument('--range', default='1h')
+    query.add_argument('--points', type=int, default=60)
+    query.add_argument('--json', action='store_true')
+    sub.add_parser('info', help='stored metrics and their size')
+    args = parser.parse_args(argv)
+
+    store = TimeSeriesStore()
+    try:
+        if args.command == 'record':
+            record(store, args.interval)
+        elif args.command == 'query':
+            result = store.query(args.metric, parse_range(args.range), args.points)
+            if result is None:
+                raise TimeSeriesError(f"no data for '{args.metric}' (have: {', '.join(store.metrics())})")
+            if args.json:
+                print(json.dumps(result))
+            else:
+                series = result['series']
+                print(f"{args.metric}: {len(series['t'])} points of {result['step']}s "
+                      f"(from the {result['resolution']}s segment)")
+                for i, start in enumerate(series['t']):
+                    print(f"  {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(start))}  "
+                          f"min {series['min'][i]:9.2f}  avg {series['avg'][i]:9.2f}  "
+                          f"p95 {series['p95'][i]:9.2f}  max {series['max'][i]:9.2f}  "
+                          f"n={series['count'][i]}")
+        else:
+            for name in store.metrics():
+                path = store.directory / f"{name}.ts"
+                print(f"  {name:<20} {path.stat().st_blocks * 512 / 1e6:7.2f} MB on disk")
+    except TimeSeriesError as e:
+        print(f"✗ {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        pass
+    finally:
+        store.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Integration tests for the dashboard server (dashboard/server.py)
+A DashboardServer with stub documents on an ephemeral port, spoken to over HTTP
+
+Run: python3 -m unittest discover -s tests/integration -p 'test_*.py'
+"""
+
+import asyncio
+import http.client
+import socket
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'dashboard'))
+
+from server import DashboardServer, Document  # noqa: E402
+
+
+class StubProducer:
+    """Counts builds; each build takes `delay` and returns the current `value`"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.value = 1
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {'value': self.value, 'timestamp': time.time()}
+
+
+class ServerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name) / 'dashboard'
+        (root / 'static').mkdir(parents=True)
+        (root / 'index.html').write_text('<html>index</html>')
+        (root / 'static' / 'app.js').write_text('console.log(1);')
+        (root / 'api').mkdir()
+        (root / 'api' / 'secret.sh').write_text('echo secret')
+        (root.parent / 'outside.txt').write_text('outside')
+
+        self.slow = StubProducer(delay=0.2)
+        self.quick = StubProducer()
+        documents = {'slow': Document('slow', self.slow, ttl=60.0),
+                     'quick': Document('quick', self.quick, ttl=0.3)}
+        self.server = DashboardServer(root, documents)
+
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        self.listener = asyncio.run_coroutine_threadsafe(
+            asyncio.start_server(self.server.handle, '127.0.0.1', 0), self.loop).result(5)
+        self.port = self.listener.sockets[0].getsockname()[1]
+
+    def tearDown(self):
+        async def shutdown():
+            self.listener.close()
+            await self.listener.wait_closed()
+        asyncio.run_coroutine_threadsafe(shutdown(), self.loop).result(5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(5)
+        self.loop.close()
+        self.tmp.cleanup()
+
+    def get(self, path: str, method: str = 'GET', headers=None):
+        connection = http.client.HTTPConnection('127.0.0.1', self.port, timeout=5)
+        try:
+            connection.request(method, path, headers=headers or {})
+            response = connection.getresponse()
+            return response.status, dict(response.getheaders()), response.read()
+        finally:
+            connection.close()
+
+    def raw(self, request: bytes) -> bytes:
+        with socket.create_connection(('127.0.0.1', self.port), timeout=5) as sock:
+            sock.sendall(request)
+            data = b''
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    return data
+                data += chunk
+
+
+class TestDocuments(ServerTestCase):
+
+    def test_concurrent_requests_share_one_build(self):
+        with ThreadPoolExecutor(max_workers=8) as clients:
+            results = list(clients.map(lambda _: self.get('/api/slow.json'), range(8)))
+        self.assertTrue(all(status == 200 for status, _, _ in results))
+        self.assertEqual(len({body for _, _, body in results}), 1)
+        self.assertEqual(self.slow.calls, 1)
+
+    def test_ttl(self):
+        first = self.get('/api/quick.json')[2]
+        self.assertEqual(self.get('/api/quick.json')[2], first)  # Cached
+        self.assertEqual(self.quick.calls, 1)
+        time.sleep(0.4)
+        self.get('/api/quick.json')
+        self.assertEqual(self.quick.calls, 2)
+
+    def test_unknown_document_is_404(self):
+        status, _, _ = self.get('/api/missing.json')
+        self.assertEqual(status, 404)
+
+
+class TestSnapshot(ServerTestCase):
+
+    def test_revalidation(self):
+        status, headers, body = self.get('/api/snapshot')
+        self.assertEqual(status, 200)
+        etag = headers['ETag']
+        self.assertIn(b'"versions"', body)
+
+        status, headers, body = self.get('/api/snapshot', headers={'If-None-Match': etag})
+        self.assertEqual((status, body), (304, b''))
+        self.assertEqual(headers['ETag'], etag)
+        self.assertNotIn('Content-Type', headers)
+
+        # A rebuild with only a new timestamp keeps the version (and the tag)
+        time.sleep(0.4)
+        self.assertEqual(self.get('/api/snapshot', headers={'If-None-Match': etag})[0], 304)
+
+        self.quick.value = 2
+        time.sleep(0.4)
+        status, headers, _ = self.get('/api/snapshot', headers={'If-None-Match': etag})
+        self.assertEqual(status, 200)
+        self.assertNotEqual(headers['ETag'], etag)
+
+
+class TestRequests(ServerTestCase):
+
+    def test_index_and_static(self):
+        self.assertEqual(self.get('/')[2], b'<html>index</html>')
+        status, headers, body = self.get('/static/app.js')
+        self.assertEqual((status, body), (200, b'console.log(1);'))
+        self.assertTrue(headers['Content-Type'].startswith('application/javascript'))
+        status, _, body = self.get('/static/app.js', method='HEAD')
+        self.assertEqual((status, body), (200, b''))
+
+    def test_nothing_outside_static_is_served(self):
+        for path in ('/static/../outside.txt', '/static/%2e%2e/%2e%2e/outside.txt',
+                     '/static/../api/secret.sh', '/api/secret.sh', '/outside.txt',
+                     '/static/%00x', '/static/'):
+            status, _, body = self.get(path)
+            self.assertEqual(status, 404, path)
+            self.assertNotIn(b'secret', body)
+            self.assertNotIn(b'outside', body)
+
+    def test_other_methods_are_405(self):
+        for method in ('POST', 'PUT', 'DELETE'):
+            status, headers, _ = self.get('/', method=method)
+            self.assertEqual(status, 405, method)
+            self.assertEqual(headers['Allow'], 'GET, HEAD')
+
+    def test_bad_content_length_is_400(self):
+        response = self.raw(b'GET / HTTP/1.1\r\nHost: x\r\nContent-Length: abc\r\n\r\n')
+        self.assertTrue(response.startswith(b'HTTP/1.1 400 '), response[:40])
+        self.assertIn(b'Connection: close', response)
+
+    def test_keep_alive_serves_several_requests(self):
+        connection = http.client.HTTPConnection('127.0.0.1', self.port, timeout=5)
+        try:
+            for _ in range(3):
+                connection.request('GET', '/api/slow.json')
+                response = connection.getresponse()
+                self.assertEqual(response.status, 200)
+                response.read()
+        finally:
+            connection.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Integration tests for the supervisor daemon and its unix-socket client
+SupervisorClient spawns a real daemon in a scratch state directory
+
+Run: python3 -m unittest discover -s tests/integration -p 'test_*.py'
+"""
+
+import os
+import signal
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'philaunch_gui'))
+
+from philaunch_supervisor import FINISHED_STATES, SupervisorClient, SupervisorError  # noqa: E402
+
+
+class TestSupervisorClient(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.client = SupervisorClient(Path(self.tmp.name))
+        self.daemon_pid = None
+
+    def tearDown(self):
+        if self.daemon_pid is not None:
+            self.stop_daemon()
+        self.tmp.cleanup()
+
+    def start(self, command: str, name: str):
+        task = self.client.start(['/bin/sh', '-c', command], name=name, cwd=self.tmp.name)
+        self.daemon_pid = self.client.request('ping')['pid']
+        return task
+
+    def stop_daemon(self):
+        os.kill(self.daemon_pid, signal.SIGTERM)
+        deadline = time.monotonic() + 5
+        while self.client.socket_path.exists() and time.monotonic() < deadline:
+            time.sleep(0.02)
+        self.daemon_pid = None
+
+    def wait_finished(self, name: str, timeout: float = 10.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            task = self.client.get_task(name)
+            if task['state'] in FINISHED_STATES:
+                return task
+            time.sleep(0.05)
+        self.fail(f'{name} did not finish')
+
+    def test_read_only_calls_do_not_spawn(self):
+        with self.assertRaises(SupervisorError):
+            self.client.request('ping')
+        self.assertEqual(self.client.list_tasks(), [])
+        self.assertFalse(self.client.socket_path.exists())
+
+    def test_start_status_and_list_round_trip(self):
+        started = self.start('echo round-trip; exit 5', 'rt')
+        self.assertEqual(started['name'], 'rt')
+        self.assertIn(started['state'], ('pending', 'running', 'failed'))
+
+        task = self.wait_finished('rt')
+        self.assertEqual(task['state'], 'failed')
+        self.assertEqual(task['exit_code'], 5)
+        self.assertIn('round-trip', Path(task['log']).read_text())
+        self.assertIn('rt', [record['name'] for record in self.client.list_tasks()])
+
+    def test_stop_over_the_socket(self):
+        self.start('sleep 30', 'sleeper')
+        self.client.stop('sleeper')
+        self.assertEqual(self.wait_finished('sleeper')['state'], 'killed')
+
+    def test_errors_come_back_as_supervisor_errors(self):
+        self.start('true', 'first')
+        with self.assertRaisesRegex(SupervisorError, 'no running or queued task'):
+            self.client.stop('nothing')
+        with self.assertRaisesRegex(SupervisorError, 'unknown command'):
+            self.client.request('bogus')
+        with self.assertRaisesRegex(SupervisorError, 'priority'):
+            self.client.start(['true'], priority='urgent')
+
+    def test_published_state_after_daemon_exit(self):
+        self.start('exit 0', 'kept')
+        self.wait_finished('kept')
+        self.stop_daemon()
+        records = {record['name']: record for record in self.client.list_tasks()}
+        self.assertEqual(records['kept']['state'], 'exited')
+        self.assertEqual(self.client.get_task('kept')['exit_code'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -35,6 +35,18 @@ teardown() {
     assert_output_contains "HOME AUTOMATION CONTROL"
 }
 
+@test "home-control.sh help lists supervisor commands" {
+    mkdir -p "$TEST_TEMP_DIR/config"
+    cp "$TEST_CONFIG" "$TEST_TEMP_DIR/config/philaunch.conf"
+
+    cd "$PHILAUNCH_ROOT/automation"
+    run bash -c "PHILAUNCH_HOME='$TEST_TEMP_DIR' ./home-control.sh 2>&1"
+
+    assert_success
+    assert_output_contains "run-task"
+    assert_output_contains "task-status"
+}
+
 @test "launch-script.sh exists and is executable" {
     [ -f "$PHILAUNCH_ROOT/automation/launch-script.sh" ]
     [ -x "$PHILAUNCH_ROOT/automation/launch-script.sh" ]
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Unit tests for log packs (philaunch_logpack.py)
+A plain log and its pack must read back as the same lines, pty CRLF output included
+
+Run: python3 -m unittest discover -s tests/unit -p 'test_*.py'
+"""
+
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'philaunch_gui'))
+
+from philaunch_logpack import pack_file, read_between, read_lines, tail_lines  # noqa: E402
+
+
+# pty output: CRLF endings and a progress line redrawn with a bare \r
+LOG = (b'2026-10-13 21:04:11 start\r\n'
+       b'progress 10%\rprogress 100%\r\n'
+       b'line two\r\n'
+       b'2026-10-13 21:05:00 plain newline\n'
+       b'\r\n'
+       b'2026-10-13 21:06:30 last, no newline')
+
+
+class TestPlainMatchesPacked(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.plain = Path(self.tmp.name) / 'task-20261013-210411.log'
+        self.plain.write_bytes(LOG)
+        self.pack = Path(pack_file(self.plain, keep=True)['pack'])
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_read_lines(self):
+        expected = ['2026-10-13 21:04:11 start', 'progress 10%\rprogress 100%', 'line two',
+                    '2026-10-13 21:05:00 plain newline', '', '2026-10-13 21:06:30 last, no newline']
+        self.assertEqual(read_lines(self.plain), expected)
+        self.assertEqual(read_lines(self.pack), expected)
+        for start, stop in ((1, 3), (2, None), (-2, None), (0, 0)):
+            self.assertEqual(read_lines(self.plain, start, stop), read_lines(self.pack, start, stop))
+
+    def test_tail_lines(self):
+        for count in (0, 1, 3, 6, 50):
+            self.assertEqual(tail_lines(self.plain, count), tail_lines(self.pack, count), count)
+        self.assertEqual(tail_lines(self.plain, 2), ['', '2026-10-13 21:06:30 last, no newline'])
+
+    def test_read_between(self):
+        since = time.mktime(time.strptime('2026-10-13 21:04:30', '%Y-%m-%d %H:%M:%S'))
+        until = time.mktime(time.strptime('2026-10-13 21:05:30', '%Y-%m-%d %H:%M:%S'))
+        plain = read_between(self.plain, since, until)
+        self.assertEqual(plain, read_between(self.pack, since, until))
+        self.assertEqual([line for _, line in plain], ['2026-10-13 21:05:00 plain newline', ''])
+        self.assertEqual(read_between(self.plain), read_between(self.pack))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the task supervisor's state machine (philaunch_supervisor.py)
+Queueing, priorities, exclusivity, exit status capture, reaping and stop/cancel, in-process
+
+Run: python3 -m unittest discover -s tests/unit -p 'test_*.py'
+"""
+
+import asyncio
+import json
+import signal
+import sys
+import tempfile
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'philaunch_gui'))
+
+from philaunch_supervisor import STATE_FILE, SupervisorError, TaskSupervisor  # noqa: E402
+
+
+class SupervisorTestCase(unittest.TestCase):
+    """A TaskSupervisor in a scratch state directory with its own event loop"""
+
+    max_running = 2
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self.tmp.name)
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.supervisor = TaskSupervisor(self.base, max_running=self.max_running, kill_grace=2.0)
+
+    def tearDown(self):
+        for task in list(self.supervisor.running.values()):
+            self.supervisor._signal(task, signal.SIGKILL)
+        if self.supervisor.running:
+            self.wait_idle()
+        if self.supervisor.archive is not None:
+            self.supervisor.archive.close()
+        self.loop.close()
+        asyncio.set_event_loop(None)
+        self.tmp.cleanup()
+
+    def start(self, command: str, name: str, **kwargs):
+        return self.supervisor.start_task(['/bin/sh', '-c', command], name=name,
+                                          cwd=self.tmp.name, **kwargs)
+
+    def wait_for(self, condition, timeout: float = 10.0):
+        async def poll():
+            deadline = time.monotonic() + timeout
+            while not condition():
+                if time.monotonic() > deadline:
+                    raise AssertionError('timed out waiting for the supervisor')
+                await asyncio.sleep(0.02)
+        self.loop.run_until_complete(poll())
+
+    def wait_idle(self):
+        self.wait_for(lambda: not self.supervisor.running and not self.supervisor.pending)
+
+    def states(self):
+        return {task['name']: task['state'] for task in self.supervisor.list_tasks()}
+
+
+class TestExitStatus(SupervisorTestCase):
+
+    def test_success_is_exited_with_rusage(self):
+        self.start('echo hello', 'ok')
+        self.wait_idle()
+        task = self.supervisor.get_task('ok')
+        self.assertEqual(task['state'], 'exited')
+        self.assertEqual(task['exit_code'], 0)
+        self.assertIsNone(task['signal'])
+        self.assertIn('utime', task['rusage'])
+        log = Path(task['log']).read_text()
+        self.assertIn('hello', log)
+        self.assertIn('[philaunch] ok exited (exit 0)', log)
+
+    def test_nonzero_exit_is_failed(self):
+        self.start('exit 3', 'bad')
+        self.wait_idle()
+        task = self.supervisor.get_task('bad')
+        self.assertEqual(task['state'], 'failed')
+        self.assertEqual(task['exit_code'], 3)
+
+    def test_signal_death_is_killed(self):
+        self.start('kill -9 $$', 'shot')
+        self.wait_idle()
+        task = self.supervisor.get_task('shot')
+        self.assertEqual(task['state'], 'killed')
+        self.assertEqual(task['signal'], signal.SIGKILL)
+        self.assertEqual(task['exit_code'], -signal.SIGKILL)
+
+    def test_stop_running_task(self):
+        self.start('sleep 30', 'long')
+        self.assertEqual(self.states()['long'], 'running')
+        self.supervisor.stop_task('long')
+        self.wait_idle()
+        task = self.supervisor.get_task('long')
+        self.assertEqual(task['state'], 'killed')
+        self.assertEqual(task['signal'], signal.SIGTERM)
+
+    def test_rejected_requests(self):
+        with self.assertRaises(SupervisorError):
+            self.supervisor.start_task([])
+        with self.assertRaises(SupervisorError):
+            self.start('true', 'x', priority='urgent')
+        with self.assertRaises(SupervisorError):
+            self.supervisor.stop_task('nothing')
+        with self.assertRaises(SupervisorError):
+            self.supervisor.get_task('nothing')
+
+
+class TestLaunch(SupervisorTestCase):
+
+    max_running = 8
+
+    def test_pty_is_the_controlling_terminal(self):
+        self.start('echo via-tty > /dev/tty', 'tty')
+        self.wait_idle()
+        task = self.supervisor.get_task('tty')
+        self.assertEqual(task['state'], 'exited')
+        self.assertIn('via-tty', Path(task['log']).read_text())
+
+    def test_launch_failure_fails_the_task(self):
+        self.supervisor.log_dir = self.base / 'missing'
+        self.start('sleep 30', 'nolog')
+        task = self.supervisor.get_task('nolog')
+        self.assertEqual(task['state'], 'failed')
+        self.assertIn('could not start nolog', task['error'])
+        self.assertIsNone(task['pid'])  # Never spawned
+        self.assertEqual(self.supervisor.running, {})
+
+
+class TestReaping(SupervisorTestCase):
+
+    max_running = 8
+
+    def test_more_tasks_than_executor_threads(self):
+        # Waiting for an exit must not hold a thread of the default executor
+        self.loop.set_default_executor(ThreadPoolExecutor(max_workers=2))
+        for number in range(4):
+            self.start('sleep 30', f'sleeper{number}')
+        self.start('true', 'quick')
+        self.wait_for(lambda: self.states()['quick'] == 'exited', timeout=3.0)
+        self.assertIn('utime', self.supervisor.get_task('quick')['rusage'])
+
+    def test_sigchld_without_pidfd(self):
+        with mock.patch('os.pidfd_open', side_effect=OSError('not supported'), create=True):
+            self.start('sleep 0.2; exit 4', 'slow')
+            self.start('exit 0', 'fast')
+            self.wait_idle()
+        self.assertEqual(self.states(), {'slow': 'failed', 'fast': 'exited'})
+        self.assertEqual(self.supervisor.get_task('slow')['exit_code'], 4)
+        self.assertIsNotNone(self.supervisor.get_task('slow')['rusage'])
+
+
+class TestQueue(SupervisorTestCase):
+
+    max_running = 1
+
+    def test_limit_and_priority_order(self):
+        release = self.base / 'release'
+        self.start(f'while [ ! -e {release} ]; do sleep 0.02; done', 'blocker')
+        self.start('true', 'low', priority='low')
+        self.start('true', 'normal')
+        self.start('true', 'high', priority='high')
+
+        # One slot: the rest wait, listed in the order they will run
+        listed = [task['name'] for task in self.supervisor.list_tasks(include_finished=False)]
+        self.assertEqual(listed, ['blocker', 'high', 'normal', 'low'])
+        self.assertEqual(self.states()['high'], 'pending')
+
+        release.touch()
+        self.wait_idle()
+        started = sorted(self.supervisor.list_tasks(), key=lambda task: task['started'])
+        self.assertEqual([task['name'] for task in started], ['blocker', 'high', 'normal', 'low'])
+        self.assertTrue(all(task['state'] == 'exited' for task in started))
+        self.assertGreater(self.supervisor.get_task('low')['wait'], 0)
+
+    def test_cancel_queued_by_id(self):
+        self.start('sleep 30', 'blocker')
+        queued = self.start('true', 'later')
+        self.assertEqual(queued['state'], 'pending')
+        self.supervisor.stop_task(f"#{queued['id']}")
+        self.assertEqual(self.supervisor.get_task('later')['state'], 'cancelled')
+        self.assertEqual(self.supervisor.pending, [])
+
+
+class TestExclusive(SupervisorTestCase):
+
+    max_running = 2
+
+    def test_same_key_waits_despite_free_slot(self):
+        release = self.base / 'release'
+        self.start(f'while [ ! -e {release} ]; do sleep 0.02; done', 'first', exclusive='backup')
+        self.start('true', 'second', exclusive='backup')
+        self.start('true', 'other')
+        self.wait_for(lambda: self.states().get('other') == 'exited')
+        self.assertEqual(self.states()['second'], 'pending')
+
+        release.touch()
+        self.wait_idle()
+        first, second = self.supervisor.get_task('first'), self.supervisor.get_task('second')
+        self.assertGreaterEqual(second['started'], first['ended'])
+
+
+class TestPublishedState(unittest.TestCase):
+
+    def test_unfinished_tasks_of_a_dead_daemon_are_lost(self):
+        with tempfile.TemporaryDirectory() as directory:
+            base = Path(directory)
+            (base / STATE_FILE).write_text(json.dumps({'tasks': [
+                {'id': 4, 'name': 'was-running', 'state': 'running'},
+                {'id': 7, 'name': 'done', 'state': 'exited'},
+            ]}))
+            supervisor = TaskSupervisor(base)
+            try:
+                self.assertEqual(supervisor.get_task('was-running')['state'], 'lost')
+                self.assertEqual(supervisor.get_task('done')['state'], 'exited')
+                self.assertEqual(supervisor._next_id, 8)
+            finally:
+                if supervisor.archive is not None:
+                    supervisor.archive.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the time-series store (philaunch_timeseries.py)
+Ring slots, per-bucket rollups, segment choice, query merging and the history endpoint
+
+Run: python3 -m unittest discover -s tests/unit -p 'test_*.py'
+"""
+
+import asyncio
+import fcntl
+import json
+import random
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / 'philaunch_gui'))
+sys.path.insert(0, str(ROOT / 'dashboard'))
+
+from philaunch_timeseries import (  # noqa: E402
+    RECORDER_LOCK, TIERS, P2Quantile, TimeSeriesError, TimeSeriesStore, parse_range
+)
+
+
+class StoreTestCase(unittest.TestCase):
+    """A TimeSeriesStore in a scratch directory (small tiers unless a test says otherwise)"""
+
+    tiers = ((1, 4), (2, 4))
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = TimeSeriesStore(Path(self.tmp.name), tiers=self.tiers)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def series(self, seconds: float, now: float, points: int = 300, name: str = 'm'):
+        return self.store.query(name, seconds, points, now=now)['series']
+
+
+class TestRingSlots(StoreTestCase):
+
+    def test_wrap_overwrites_the_oldest_bucket(self):
+        for second in range(5):  # Bucket 4 reuses bucket 0's slot
+            self.store.add({'m': second}, ts=second + 0.5)
+        series = self.series(4, now=4.5)
+        self.assertEqual(series['t'], [1, 2, 3, 4])
+        self.assertEqual(series['avg'], [1.0, 2.0, 3.0, 4.0])
+        # Further back than any segment holds: the longest one answers
+        result = self.store.query('m', 100, now=4.5)
+        self.assertEqual((result['resolution'], result['series']['t']), (2, [0, 2, 4]))
+
+    def test_never_written_slots_are_empty(self):
+        # A fresh file is all zeroes, which must not read as a bucket 0 holding 0.0
+        self.store.add({'m': 5.0}, ts=0.5)
+        series = self.series(4, now=3.5)
+        self.assertEqual((series['t'], series['min'], series['count']), ([0], [5.0], [1]))
+
+    def test_stale_slot_from_an_earlier_lap_is_not_returned(self):
+        self.store.add({'m': 7}, ts=1.5)
+        # Bucket 9 maps to bucket 1's slot, which still holds bucket 1
+        self.assertEqual(self.series(4, now=9.5)['t'], [])
+        self.store.add({'m': 8}, ts=9.5)
+        series = self.series(4, now=9.5)
+        self.assertEqual((series['t'], series['min'], series['count']), ([9], [8.0], [1]))
+
+    def test_nan_and_none_are_skipped(self):
+        self.store.add({'m': None, 'n': float('nan')}, ts=1.0)
+        self.assertEqual(self.store.metrics(), [])
+        self.assertIsNone(self.store.query('m', 4, now=1.0))
+
+    def test_bad_metric_name(self):
+        with self.assertRaises(TimeSeriesError):
+            self.store.add({'../escape': 1.0}, ts=1.0)
+
+
+class TestRollups(StoreTestCase):
+
+    tiers = ((1, 100), (10, 100))
+
+    def test_min_max_avg_count_per_bucket(self):
+        for offset, value in ((0.1, 3.0), (0.5, 1.0), (0.9, 8.0)):
+            self.store.add({'m': value}, ts=50 + offset)
+        series = self.series(1, now=50.95)
+        self.assertEqual(series['t'], [50])
+        self.assertEqual((series['min'], series['max'], series['count']), ([1.0], [8.0], [3]))
+        self.assertAlmostEqual(series['avg'][0], 4.0, places=3)
+        self.assertEqual(series['p95'], [8.0])  # Exact below five samples
+
+    def test_every_segment_is_updated(self):
+        for second in range(20):
+            self.store.add({'m': second}, ts=second)
+        # 20 s over 2 points: the 10 s segment, one bucket per point
+        series = self.series(20, now=19.5, points=2)
+        self.assertEqual(series['t'], [0, 10])
+        self.assertEqual(series['min'], [0.0, 10.0])
+        self.assertEqual(series['max'], [9.0, 19.0])
+        self.assertEqual(series['count'], [10, 10])
+        self.assertAlmostEqual(series['avg'][1], 14.5, places=3)
+
+    def test_merged_points_weight_by_count(self):
+        self.store.add({'m': 10.0}, ts=0.5)
+        for _ in range(3):
+            self.store.add({'m': 2.0}, ts=1.5)
+        result = self.store.query('m', 2, points=1, now=1.9)
+        self.assertEqual(result['resolution'], 1)  # 10 s would not cover the 2 s ask
+        self.assertEqual(result['step'], 2)
+        series = result['series']
+        self.assertEqual((series['min'], series['max'], series['count']), ([2.0], [10.0], [4]))
+        self.assertAlmostEqual(series['avg'][0], 4.0, places=3)
+
+    def test_p95_estimate(self):
+        estimator = P2Quantile(0.95)
+        values = list(range(1, 10001))
+        random.Random(7).shuffle(values)
+        for value in values:
+            estimator.add(value)
+        self.assertAlmostEqual(estimator.value(), 9500, delta=200)
+
+
+class TestSegmentChoice(StoreTestCase):
+
+    tiers = TIERS
+
+    def test_resolution_per_range(self):
+        now = 1_800_000_000.0
+        self.store.add({'m': 1.0}, ts=now)
+        chosen = {text: self.store.query('m', parse_range(text), 300, now=now)['resolution']
+                  for text in ('1h', '24h', '30d', '365d')}
+        self.assertEqual(chosen, {'1h': 1, '24h': 60, '30d': 3600, '365d': 3600})
+        # More points than an hourly segment can give: minutes still cover 30 days
+        self.assertEqual(self.store.query('m', parse_range('30d'), 5000, now=now)['resolution'], 60)
+
+    def test_parse_range(self):
+        self.assertEqual([parse_range(text) for text in ('90s', '15m', '24h', '7d', '2w', '30')],
+                         [90, 900, 86400, 604800, 1209600, 30])
+        for text in ('', 'abc', '0h', '-1h', '1y', '1h30m'):
+            with self.assertRaises(TimeSeriesError, msg=text):
+                parse_range(text)
+
+
+class TestRecorderLock(StoreTestCase):
+
+    def test_recorder_running_follows_the_lock(self):
+        self.assertFalse(self.store.recorder_running())
+        with open(self.store.directory / RECORDER_LOCK, 'w') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            self.assertTrue(self.store.recorder_running())
+        self.assertFalse(self.store.recorder_running())
+
+
+class TestHistoryEndpoint(StoreTestCase):
+
+    def setUp(self):
+        super().setUp()
+        import server
+        self.server_module = server
+        self.saved, server._history = server._history, self.store
+        self.server = server.DashboardServer(documents={})
+
+    def tearDown(self):
+        self.server_module._history = self.saved
+        super().tearDown()
+
+    def history(self, query: str):
+        status, body = asyncio.run(self.server.metrics_history(query))
+        return status, json.loads(body)
+
+    def test_bad_range_is_400(self):
+        for query in ('range=abc', 'range=0m', 'range=1h&points=x', 'range=1h&metric=../x'):
+            status, body = self.history(query)
+            self.assertEqual(status, 400, query)
+            self.assertIn('error', body)
+
+    def test_selected_metrics(self):
+        self.store.add({'cpu': 5.0, 'mem': 50.0})
+        status, body = self.history('range=4s&metric=cpu')
+        self.assertEqual(status, 200)
+        self.assertEqual(list(body['metrics']), ['cpu'])
+        self.assertEqual(body['metrics']['cpu']['series']['max'], [5.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,8 @@
 # @SCRIPT_LAUNCHER_LOCAL - Script written by this computer
 # WoW Connection Monitor for Sydney/Oceanic Servers
 # Monitors latency, jitter, and packet loss from Bullengarook (4G LTE) to Sydney
+# Priority: low
+# Exclusive: wow-monitor
 
 # Load PhiLaunch configuration
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"